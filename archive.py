@@ -0,0 +1,29 @@
+"""
+GradeUP results archival
+- Moves attempts older than the retention age out of the hot database into
+  monthly archive databases (see ARCHIVAL in gradeup/analytics.py); safe to run from cron
+  while the app is serving
+
+    python archive.py --days 180
+"""
+
+import argparse
+
+from gradeup.analytics import RETENTION_DAYS, archive_results
+from gradeup.storage import ARCHIVE_DIR
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--days", type=int, default=RETENTION_DAYS,
+                    help="archive attempts older than this many days")
+    args = ap.parse_args()
+
+    moved = archive_results(args.days)
+    for month, n in moved.items():
+        print(f"{month}: {n} attempts → {ARCHIVE_DIR / f'results-{month}.db'}")
+    print(f"archived {sum(moved.values())} attempts older than {args.days} days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+GradeUP static assets
+- Minifies the app stylesheet and subsets Poppins to the characters the
+  question bank and UI actually use (WOFF2), writing content-hashed files
+  under static/ for Streamlit's static file serving
+- The app then links the stylesheet instead of inlining it on every rerun
+  and never reaches out to Google Fonts; rebuild after changing the CSS
+  (a stale build is ignored and the CSS inlined again)
+- Font subsetting needs `pip install fonttools brotli` and the Poppins TTFs
+  (Poppins-Regular.ttf, Poppins-SemiBold.ttf, … from the Google Fonts zip)
+
+    python assets.py --fonts ~/Downloads/Poppins
+    python assets.py                                  # stylesheet only
+"""
+
+import argparse, hashlib, json, pathlib, tempfile
+
+from gradeup import BASE_DIR
+from gradeup.bank import BANK_LIST
+from gradeup.theme import CSS, STATIC_DIR, css_digest, minify_css
+
+WEIGHTS = {300: "Light", 400: "Regular", 500: "Medium", 600: "SemiBold", 700: "Bold", 800: "ExtraBold"}
+
+
+def hashed(folder, stem, suffix, data):
+    """Write `data` as folder/stem.<hash>suffix; returns the path relative to static/."""
+    name = f"{stem}.{hashlib.blake2b(data, digest_size=6).hexdigest()}{suffix}"
+    (folder / name).write_bytes(data)
+    return (folder / name).relative_to(STATIC_DIR).as_posix()
+
+def used_text():
+    """Every character the app can show: printable ASCII, the UI strings in
+    the gradeup package and the whole bank."""
+    text = {chr(c) for c in range(0x20, 0x7F)}
+    for source in (BASE_DIR / "gradeup").glob("*.py"):
+        text.update(source.read_text(encoding="utf-8"))
+    for q in BANK_LIST:
+        text.update(q["question"], *q["options"], q.get("explanation", ""), q.get("year", ""))
+    return "".join(sorted(c for c in text if c.isprintable()))
+
+def subset_font(src, text):
+    from fontTools import subset
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga"]
+    font = subset.load_font(str(src), options)
+    sub  = subset.Subsetter(options)
+    sub.populate(text=text)
+    sub.subset(font)
+    with tempfile.NamedTemporaryFile(suffix=".woff2") as tmp:
+        subset.save_font(font, tmp.name, options)
+        return pathlib.Path(tmp.name).read_bytes()
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--fonts", type=pathlib.Path, help="folder with Poppins-<Weight>.ttf files")
+    args = ap.parse_args()
+
+    fonts = STATIC_DIR / "fonts"
+    fonts.mkdir(parents=True, exist_ok=True)
+    for old in [*STATIC_DIR.glob("gradeup.*.css"), *fonts.glob("poppins-*.woff2")]:
+        old.unlink()
+
+    faces = []
+    if args.fonts:
+        text = used_text()
+        for weight, style in WEIGHTS.items():
+            src = args.fonts / f"Poppins-{style}.ttf"
+            if not src.exists():
+                print(f"skipping weight {weight}: {src} not found")
+                continue
+            data = subset_font(src, text)
+            path = hashed(fonts, f"poppins-{weight}", ".woff2", data)
+            faces.append(f"@font-face{{font-family:'Poppins';font-style:normal;font-weight:{weight};"
+                         f"font-display:swap;src:url({path}) format('woff2')}}")
+            print(f"{path}: {len(data) / 1024:.1f} KiB ({src.stat().st_size / 1024:.0f} KiB TTF, "
+                  f"{len(text)} characters)")
+
+    css  = ("".join(faces) + minify_css(CSS)).encode()
+    path = hashed(STATIC_DIR, "gradeup", ".css", css)
+    (STATIC_DIR / "manifest.json").write_text(json.dumps({"css": path, "source": css_digest(),
+                                                           "fonts": len(faces)}))
+    print(f"{path}: {len(css) / 1024:.1f} KiB ({len(CSS) / 1024:.1f} KiB source)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+GradeUP headless load test
+- Starts the app on a local Streamlit server (throwaway DB, live timer off)
+  and drives N concurrent virtual candidates over its websocket protocol:
+  landing → dashboard → mode select → test → submit → leaderboard
+- Reports p50/p95/p99 rerun latency per page, server CPU per user, and DB
+  statement timings from inside the server; write latency and "database is
+  locked" errors stand in for lock waits
+
+    python bench/loadtest.py --users 50 --iterations 2
+"""
+
+import argparse, asyncio, json, os, pathlib, random, signal, sqlite3, statistics
+import subprocess, sys, tempfile, threading, time, urllib.request
+
+APP  = pathlib.Path(__file__).resolve().parent.parent / "app.py"
+HERE = pathlib.Path(__file__).resolve()
+
+SUBJECTS = ["English", "Mathematics", "General Science", "History", "Geography", "Economics"]
+WRITES   = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "ALTER", "COMMIT")
+
+# ═══════════════════════════════════════════════════════════════
+# SERVER SIDE — runs inside the Streamlit process (--serve)
+# Every sqlite3 connection the app opens is timed; SIGUSR1 dumps the
+# cumulative numbers and the process CPU time to the stats file.
+# ═══════════════════════════════════════════════════════════════
+_db_lock  = threading.Lock()
+db_reads  = []
+db_writes = []
+db_locked = 0
+
+class TimedConnection(sqlite3.Connection):
+    def _timed(self, fn, sql, *args):
+        global db_locked
+        t0 = time.perf_counter()
+        try:
+            return fn(sql, *args)
+        except sqlite3.OperationalError as e:
+            if "locked" in str(e):
+                with _db_lock: db_locked += 1
+            raise
+        finally:
+            dt = time.perf_counter() - t0
+            with _db_lock:
+                (db_writes if sql.lstrip().upper().startswith(WRITES) else db_reads).append(dt)
+
+    def execute(self, sql, *args):
+        return self._timed(super().execute, sql, *args)
+
+    def executemany(self, sql, *args):
+        return self._timed(super().executemany, sql, *args)
+
+    def executescript(self, sql):
+        return self._timed(super().executescript, sql)
+
+    def commit(self):
+        return self._timed(lambda _: super(TimedConnection, self).commit(), "COMMIT")
+
+def serve(port, stats_path):
+    connect = sqlite3.connect
+    sqlite3.connect = lambda *a, **kw: connect(*a, factory=TimedConnection, **kw)
+
+    def dump(*_):
+        with _db_lock:
+            stats = {"cpu_s": time.process_time(), "db_reads": db_reads, "db_writes": db_writes,
+                     "db_locked": db_locked}
+            pathlib.Path(stats_path).write_text(json.dumps(stats))
+    signal.signal(signal.SIGUSR1, dump)
+
+    from streamlit.web import cli
+    sys.argv = ["streamlit", "run", str(APP), "--server.port", str(port),
+                "--server.headless", "true", "--server.enableXsrfProtection", "false",
+                "--browser.gatherUsageStats", "false"]
+    cli.main()
+
+# ═══════════════════════════════════════════════════════════════
+# VIRTUAL USER — speaks Streamlit's websocket protocol like a browser
+# ═══════════════════════════════════════════════════════════════
+class VirtualUser:
+    def __init__(self, url):
+        self.url      = url
+        self.query    = ""
+        self.elements = {}
+        self.errors   = 0
+
+    async def __aenter__(self):
+        import websockets
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *_):
+        await self.ws.close()
+
+    async def rerun(self, *widgets):
+        """Send one interaction; seconds until the resulting run (and any
+        st.rerun() chain it triggers) has finished."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query
+        msg.rerun_script.widget_states.widgets.extend(widgets)
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fm   = ForwardMsg.FromString(await self.ws.recv())
+            kind = fm.WhichOneof("type")
+            if kind == "new_session":
+                self.elements = {}
+            elif kind == "page_info_changed":
+                self.query = fm.page_info_changed.query_string
+            elif kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                el = fm.delta.new_element
+                et = el.WhichOneof("type")
+                self.elements.setdefault(et, []).append(getattr(el, et))
+                self.errors += et == "exception"
+            elif kind == "script_finished" and fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return time.perf_counter() - t0
+
+    def button(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        button = next(b for b in self.elements.get("button", []) if b.label == label)
+        return WidgetState(id=button.id, trigger_value=True)
+
+async def journey(url, user, iteration, answer_rate):
+    """One candidate's full path; returns [(page, seconds)] and error count."""
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+    rng     = random.Random(f"{user}:{iteration}")
+    timings = []
+    async with VirtualUser(url) as vu:
+        timings.append(("landing", await vu.rerun()))
+        name = WidgetState(id=vu.elements["text_input"][0].id, string_value=f"vu-{user:04d}")
+        timings.append(("landing", await vu.rerun(name)))
+        timings.append(("dashboard", await vu.rerun(vu.button("Get Started →"))))
+        timings.append(("mode_select", await vu.rerun(vu.button(f"Start {rng.choice(SUBJECTS)}"))))
+        timings.append(("test", await vu.rerun(vu.button("Start Full Mock"))))
+        for radio in vu.elements.get("radio", []):
+            if rng.random() < answer_rate:
+                pick = WidgetState(id=radio.id, string_value=rng.choice(radio.options))
+                timings.append(("test", await vu.rerun(pick)))
+        timings.append(("results", await vu.rerun(vu.button("Submit Test ✓"))))
+        timings.append(("leaderboard", await vu.rerun(vu.button("🏆 Leaderboard"))))
+        return timings, vu.errors
+
+# ═══════════════════════════════════════════════════════════════
+# DRIVER
+# ═══════════════════════════════════════════════════════════════
+def pct(xs):
+    if not xs:
+        return {"n": 0, "p50": 0, "p95": 0, "p99": 0}
+    q = statistics.quantiles(xs, n=100) if len(xs) > 1 else [xs[0]] * 99
+    return {"n": len(xs), "p50": q[49] * 1e3, "p95": q[94] * 1e3, "p99": q[98] * 1e3}
+
+def snapshot(proc, stats_path):
+    stats_path.unlink(missing_ok=True)
+    proc.send_signal(signal.SIGUSR1)
+    while not stats_path.exists():
+        time.sleep(0.05)
+    time.sleep(0.05)
+    return json.loads(stats_path.read_text())
+
+async def load(url, args):
+    async def one(n):
+        await asyncio.sleep(args.ramp * (n % args.users) / max(1, args.users))
+        return await journey(url, n % args.users, n // args.users, args.answer_rate)
+    return await asyncio.gather(*(one(n) for n in range(args.users * args.iterations)))
+
+def main():
+    ap = argparse.ArgumentParser(description="GradeUP headless load test")
+    ap.add_argument("--users",       type=int,   default=20)
+    ap.add_argument("--iterations",  type=int,   default=1, help="journeys per user")
+    ap.add_argument("--answer-rate", type=float, default=0.1, help="share of questions answered")
+    ap.add_argument("--ramp",        type=float, default=0.0, help="seconds to stagger starts over")
+    ap.add_argument("--port",        type=int,   default=8599)
+    ap.add_argument("--json",        type=pathlib.Path, help="also write the report here")
+    ap.add_argument("--serve",       type=pathlib.Path, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.serve:
+        return serve(args.port, args.serve)
+
+    workdir = pathlib.Path(tempfile.mkdtemp(prefix="gradeup-load-"))
+    stats   = workdir / "stats.json"
+    env = {**os.environ,
+           "GRADEUP_DB":         str(workdir / "gradeup.db"),
+           "GRADEUP_SESSION_DB": str(workdir / "sessions.db"),
+           "GRADEUP_TIMER_TICK": "0"}
+    proc = subprocess.Popen([sys.executable, str(HERE), "--port", str(args.port), "--serve", str(stats)],
+                            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(300):
+            try:
+                urllib.request.urlopen(f"http://localhost:{args.port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.1)
+        url = f"ws://localhost:{args.port}/_stcore/stream"
+        asyncio.run(journey(url, -1, 0, 0))     # warm caches and the paper pool
+        before = snapshot(proc, stats)
+
+        wall0    = time.perf_counter()
+        outcomes = asyncio.run(load(url, args))
+        wall     = time.perf_counter() - wall0
+        after    = snapshot(proc, stats)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    by_page = {}
+    for timings, _ in outcomes:
+        for page, dt in timings:
+            by_page.setdefault(page, []).append(dt)
+    reruns = [dt for xs in by_page.values() for dt in xs]
+    cpu    = after["cpu_s"] - before["cpu_s"]
+    report = {
+        "users": args.users, "iterations": args.iterations, "wall_s": wall,
+        "server_cpu_s": cpu,
+        "cpu_s_per_user": cpu / args.users,
+        "cpu_ms_per_rerun": cpu / max(1, len(reruns)) * 1e3,
+        "errors": sum(e for _, e in outcomes),
+        "rerun_ms": pct(reruns),
+        "pages_ms": {page: pct(xs) for page, xs in by_page.items()},
+        "db_read_ms": pct(after["db_reads"][len(before["db_reads"]):]),
+        "db_write_ms": pct(after["db_writes"][len(before["db_writes"]):]),
+        "db_locked_errors": after["db_locked"] - before["db_locked"],
+    }
+
+    print(f"\n{args.users} users × {args.iterations} journeys in {wall:.1f}s "
+          f"· server CPU {cpu:.1f}s ({report['cpu_s_per_user']:.2f}s/user, "
+          f"{report['cpu_ms_per_rerun']:.1f}ms/rerun) · errors {report['errors']}")
+    print(f"{'':14}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = [("all reruns", report["rerun_ms"]), *report["pages_ms"].items(),
+            ("db reads", report["db_read_ms"]), ("db writes", report["db_write_ms"])]
+    for label, p in rows:
+        print(f"{label:14}{p['n']:>7}{p['p50']:>10.1f}{p['p95']:>10.1f}{p['p99']:>10.1f}")
+    print(f"'database is locked' errors: {report['db_locked_errors']}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
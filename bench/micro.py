@@ -0,0 +1,150 @@
+"""
+GradeUP micro-benchmarks
+- Core functions against synthetic question banks and results tables of
+  configurable size: question selection, scoring, the db_* helpers and
+  the answer-review HTML of the results page
+- Saves a baseline and flags anything slower than it by more than the
+  threshold (exit status 1), so it can gate changes in CI
+
+    python bench/micro.py --save                  # record bench/baseline.json
+    python bench/micro.py --rows 10000,100000     # compare against it
+"""
+
+import argparse, json, os, pathlib, random, sys, tempfile, time, timeit
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from gradeup import storage
+from gradeup.pages import _review_card, review_html
+from gradeup.scoring import calculate_score
+from gradeup.selection import get_questions
+from synth import generate, synthetic_bank, use_bank
+
+BASELINE  = pathlib.Path(__file__).resolve().parent / "baseline.json"
+BENCHES   = []
+
+def bench(fn):
+    BENCHES.append(fn)
+    return fn
+
+# ═══════════════════════════════════════════════════════════════
+# BENCHMARKS — each yields (name, callable) or (name, callable, setup),
+# where setup runs untimed before every call (e.g. to empty a cache)
+# ═══════════════════════════════════════════════════════════════
+@bench
+def selection(args):
+    for per_chapter in args.bank_sizes:
+        use_bank(synthetic_bank(per_chapter, random.Random(per_chapter)))
+        seeds = iter(range(10**9))
+        yield f"get_questions/chapter/bank={per_chapter}", \
+            lambda: get_questions("Mathematics", "Trigonometry & Geometry", "chapter", next(seeds))
+        yield f"get_questions/full/bank={per_chapter}", \
+            lambda: get_questions("General Science", None, "full", next(seeds))
+
+@bench
+def scoring(args):
+    use_bank(synthetic_bank(max(args.bank_sizes), random.Random(0)))
+    for n in (50, 150):
+        qs  = get_questions("General Science", None, "full", 1)[:n]
+        rng = random.Random(n)
+        answers = {i: rng.choice(q["options"] + [None]) for i, q in enumerate(qs)}
+        yield f"calculate_score/q={n}", lambda qs=qs, answers=answers: calculate_score(qs, answers)
+
+@bench
+def results_html(args):
+    use_bank(synthetic_bank(max(args.bank_sizes), random.Random(0)))
+    qs  = get_questions("General Science", None, "full", 2)[:150]
+    rng = random.Random(3)
+    answers = {i: rng.choice(q["options"] + [None]) for i, q in enumerate(qs)}
+    render  = lambda: "".join(review_html(i, q, answers.get(i)) for i, q in enumerate(qs))
+    # Warm: every card is an lru hit (a re-rendered results page); cold: the
+    # first render of an attempt, every card built
+    yield "review_html/q=150", render
+    yield "review_html/cold/q=150", render, _review_card.cache_clear
+
+@bench
+def database(args):
+    for rows in args.rows:
+        path  = os.path.join(args.workdir, f"results-{rows}.db")
+        users = generate(path, max(1, rows // 50), rows, random.Random(rows))
+        rng   = random.Random(1)
+        row   = {"name": "bench", "subject": "History", "chapter": "Indian History", "mode": "chapter",
+                 "correct": 30, "wrong": 10, "unattempted": 10, "raw_score": 106.7, "total_marks": 200,
+                 "percentage": 53.3, "time_taken": 900, "taken_at": "01 Jan 2026 10:00"}
+
+        def bind(fn):
+            # DB_PATH is module state; pin it per table size at call time
+            def call(path=path):
+                storage.DB_PATH = pathlib.Path(path)
+                return fn()
+            return call
+
+        yield f"db_save_result/rows={rows}", bind(lambda: storage.db_save_result(row))
+        yield f"db_load_user_results/rows={rows}", bind(lambda: storage.db_load_user_results(f"user{rng.randrange(users)}"))
+        yield f"db_leaderboard/rows={rows}", bind(lambda: storage.db_leaderboard(25))
+
+# ═══════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════
+SETUP_CALLS = 20    # timed calls per round when each needs its own setup
+
+def measure(fn, repeat, setup=None):
+    """Best per-call seconds over `repeat` rounds of an auto-sized loop, or
+    of SETUP_CALLS single calls each preceded by `setup`."""
+    if setup is None:
+        timer     = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat, number)) / number
+    best = float("inf")
+    for _ in range(repeat * SETUP_CALLS):
+        setup()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def fmt(sec):
+    return f"{sec * 1e6:9.1f} µs" if sec < 1e-3 else f"{sec * 1e3:9.2f} ms"
+
+def main():
+    ints = lambda s: [int(x) for x in s.split(",")]
+    ap = argparse.ArgumentParser(description="GradeUP micro-benchmarks")
+    ap.add_argument("--rows",       type=ints, default=[10_000, 100_000, 1_000_000],
+                    help="results-table sizes, comma separated")
+    ap.add_argument("--bank-sizes", type=ints, default=[50, 500],
+                    help="synthetic questions per chapter, comma separated")
+    ap.add_argument("--repeat",     type=int,   default=5)
+    ap.add_argument("--threshold",  type=float, default=0.20, help="allowed slowdown vs baseline")
+    ap.add_argument("--baseline",   type=pathlib.Path, default=BASELINE)
+    ap.add_argument("--save",       action="store_true", help="write results as the new baseline")
+    ap.add_argument("-k",           default="", help="only run benchmarks whose name contains this")
+    args = ap.parse_args()
+    args.workdir = tempfile.mkdtemp(prefix="gradeup-bench-")
+
+    base    = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results = {}
+    slower  = []
+    for group in BENCHES:
+        for name, fn, *setup in group(args):
+            if args.k not in name: continue
+            sec = results[name] = measure(fn, args.repeat, *setup)
+            line = f"{name:42}{fmt(sec)}"
+            if name in base:
+                ratio = sec / base[name]
+                line += f"   {ratio:5.2f}x baseline"
+                if ratio > 1 + args.threshold:
+                    line += "   ← REGRESSION"
+                    slower.append(name)
+            print(line, flush=True)
+
+    if args.save:
+        args.baseline.write_text(json.dumps({**base, **results}, indent=2, sort_keys=True))
+        print(f"baseline saved to {args.baseline}")
+    if slower and not args.save:
+        print(f"{len(slower)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+GradeUP startup report
+- Cold-imports app.py (and through it the gradeup package) in fresh
+  interpreters and reports the wall time, the peak memory and an
+  `-X importtime` breakdown of the slowest libraries the app imports,
+  i.e. what every new worker pays before it can render a page
+- Shares bench/baseline.json with micro.py and flags regressions the same
+  way (exit status 1), so heavy imports creeping back to module level
+  fail CI
+
+    python bench/startup.py --save
+    python bench/startup.py --top 15
+"""
+
+import argparse, json, os, pathlib, subprocess, sys, tempfile
+
+ROOT     = pathlib.Path(__file__).resolve().parent.parent
+BASELINE = pathlib.Path(__file__).resolve().parent / "baseline.json"
+
+# Peak RSS in KiB (Linux ru_maxrss unit) printed after the import
+PROBE = "import app, resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+
+def ours(name):
+    return name == "app" or name.split(".")[0] == "gradeup"
+
+def cold_import(workdir):
+    """(import seconds, peak RSS MiB, {module: (self µs, cumulative µs, importer)})."""
+    env = {**os.environ, "GRADEUP_DB": os.path.join(workdir, "startup.db"),
+           "GRADEUP_SESSION_DB": os.path.join(workdir, "sessions.db")}
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    modules, pending = {}, []    # lines come children first; pending = (depth, name) without a parent yet
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth, name = (len(name) - len(name.lstrip())) // 2, name.strip()
+        while pending and pending[-1][0] > depth:
+            child = pending.pop()[1]
+            modules[child] = modules[child][:2] + (name,)
+        modules[name] = (int(own), int(cumulative), None)
+        pending.append((depth, name))
+    return modules["app"][1] / 1e6, int(out.stdout.split()[-1]) / 1024, modules
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat",    type=int,   default=5)
+    ap.add_argument("--top",       type=int,   default=10, help="slowest library imports to list")
+    ap.add_argument("--threshold", type=float, default=0.20, help="allowed slowdown vs baseline")
+    ap.add_argument("--baseline",  type=pathlib.Path, default=BASELINE)
+    ap.add_argument("--save",      action="store_true", help="write results as the new baseline")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="gradeup-startup-") as workdir:
+        runs = sorted(cold_import(workdir) for _ in range(args.repeat))
+    sec, rss, modules = runs[0]
+
+    # What app.py and the gradeup modules import directly, by cumulative
+    # time, then the time spent in our own module bodies
+    print(f"{'module':42}{'self':>10}{'cumulative':>12}")
+    heavy = [(cum, own, name) for name, (own, cum, parent) in modules.items()
+             if parent and ours(parent) and not ours(name)]
+    for cum, own, name in sorted(heavy, reverse=True)[:args.top]:
+        print(f"{name:42}{own / 1e3:8.1f} ms{cum / 1e3:9.1f} ms")
+    print(f"{'app + gradeup (own module bodies)':42}"
+          f"{sum(own for name, (own, _, _) in modules.items() if ours(name)) / 1e3:8.1f} ms")
+
+    results = {"startup/import app": sec, "startup/peak rss MiB": rss}
+    base    = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    slower  = []
+    print()
+    for name, value in results.items():
+        line = f"{name:42}{value * 1e3:9.1f} ms" if name.endswith("app") else f"{name:42}{value:9.1f} MiB"
+        if name in base:
+            ratio = value / base[name]
+            line += f"   {ratio:5.2f}x baseline"
+            if ratio > 1 + args.threshold:
+                line += "   ← REGRESSION"
+                slower.append(name)
+        print(line)
+    print(f"{'(heavy modules loaded)':42}{', '.join(m for m in ('pandas', 'altair', 'numpy') if m in modules) or 'none'}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps({**base, **results}, indent=2, sort_keys=True))
+        print(f"baseline saved to {args.baseline}")
+    if slower and not args.save:
+        print(f"{len(slower)} startup metric(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
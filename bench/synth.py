@@ -0,0 +1,188 @@
+"""
+GradeUP synthetic data
+- Bulk-loads candidates, attempts and their per-question responses into a
+  GradeUP database, so leaderboard and dashboard scaling can be measured
+  without real traffic
+- Attempts are real seeded variants of the bank (rescorable, reviewable);
+  candidates have a skill level and a long-tailed activity level
+- Optionally builds a synthetic question bank shaped like QUESTION_BANK and
+  compiles it to a segment the app can run on (GRADEUP_BANK_SEGMENT)
+
+    python bench/synth.py --users 10000 --results 1000000
+    python bench/synth.py --db big.db --bank-per-chapter 500 --results 2000000
+"""
+
+import argparse, datetime, itertools, pathlib, random, sqlite3, sys, time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from gradeup import bank, scoring, selection, storage
+from gradeup.questions import Q
+
+COURSES   = {"NDA": 0.6, "CDS": 0.2, "AFCAT": 0.15, "Other": 0.05}
+MODE_MIX  = {"chapter": 0.70, "full": 0.25, "paper": 0.05}
+DURATIONS = {"chapter": 1800, "full": 3600}
+TEMPLATES = 4      # seeded variants per test key
+LEVELS    = 11     # skill levels 0.0, 0.1 … 1.0
+PER_LEVEL = 4      # answer sheets per (variant, level)
+BATCH     = 50_000
+
+# Bulk-load settings: no rollback journal, no fsync, one writer, big cache.
+# All per-connection — the app's own connections are unaffected.
+BULK_PRAGMAS = ["PRAGMA journal_mode=OFF", "PRAGMA synchronous=OFF",
+                "PRAGMA locking_mode=EXCLUSIVE", "PRAGMA temp_store=MEMORY",
+                "PRAGMA cache_size=-262144"]
+
+# ═══════════════════════════════════════════════════════════════
+# QUESTION BANK
+# ═══════════════════════════════════════════════════════════════
+def synthetic_bank(per_chapter, rng):
+    """A bank shaped like QUESTION_BANK with `per_chapter` questions per chapter."""
+    years = [f"NDA {y} {s}" for y in range(2015, 2025) for s in ("I", "II")]
+    return {subj: {ch: [Q(f"{subj}/{ch} question {i}: {rng.random()}",
+                          [f"option {k} {rng.random():.6f}" for k in range(4)],
+                          rng.randrange(4), rng.choice(["Hard", "Medium"]),
+                          "explanation " * 12, rng.choice(years))
+                        for i in range(per_chapter)]
+                   for ch in chs}
+            for subj, chs in bank.CHAPTERS.items()}
+
+def use_bank(built):
+    bank.QUESTION_BANK = built
+    bank.BANK_LIST, bank.BANK_POS, bank.BANK_VERSION = bank.index_bank(built)
+
+# ═══════════════════════════════════════════════════════════════
+# ATTEMPT TEMPLATES
+# A few seeded variants per test key, each with answer sheets pre-scored
+# at every skill level. Rows then only pick a template — O(1) per row.
+# ═══════════════════════════════════════════════════════════════
+def answer_sheet(questions, skill, rng):
+    attempt = 0.55 + 0.4 * skill
+    codes = []
+    for q in questions:
+        if rng.random() > attempt:
+            codes.append("-")
+        elif rng.random() < 0.25 + 0.7 * skill:
+            codes.append(str(q["correct"]))
+        else:
+            codes.append(str(rng.choice([k for k in range(4) if k != q["correct"]])))
+    return "".join(codes)
+
+def templates(rng):
+    """key → [(seed, question ids, duration, [[(answers, score)] per level])]."""
+    keys = selection.pool_keys() + [("paper", name, None) for name in selection.BLUEPRINTS]
+    out = {}
+    for key in keys:
+        mode, subject, _ = key
+        duration = selection.BLUEPRINTS[subject]["duration"] if mode == "paper" else DURATIONS[mode]
+        out[key] = []
+        for _ in range(TEMPLATES):
+            variant   = selection.build_variant(key, rng.getrandbits(63))
+            questions = selection.materialize(variant)
+            levels = []
+            for level in range(LEVELS):
+                sheets = []
+                for _ in range(PER_LEVEL):
+                    codes = answer_sheet(questions, level / (LEVELS - 1), rng)
+                    sheets.append((codes, scoring.calculate_score(questions,
+                                                                  selection.decode_answers(questions, codes))))
+                levels.append(sheets)
+            ids = ",".join(bank.BANK_LIST[p]["id"] for p in variant[1])
+            out[key].append((variant[0], ids, duration, levels))
+    return out
+
+# ═══════════════════════════════════════════════════════════════
+# GENERATOR
+# ═══════════════════════════════════════════════════════════════
+def user_rows(users, start, rng):
+    names, courses = list(COURSES), list(COURSES.values())
+    for n in range(users):
+        registered = start - datetime.timedelta(days=rng.uniform(0, 180))
+        yield f"cand{n:07d}", rng.choices(names, courses)[0], registered.isoformat()
+
+def result_rows(results, users, start, span, rng):
+    tpl   = templates(rng)
+    keys  = {mode: [k for k in tpl if k[0] == mode] for mode in MODE_MIX}
+    skill = [rng.betavariate(4, 3) for _ in range(users)]
+    # Long-tailed activity: a few candidates take most of the tests
+    active = list(itertools.accumulate(rng.paretovariate(2.0) for _ in range(users)))
+    modes, mix = list(MODE_MIX), list(MODE_MIX.values())
+    step = span / max(1, results)
+    for i in range(results):
+        u      = rng.choices(range(users), cum_weights=active)[0]
+        key    = rng.choice(keys[rng.choices(modes, mix)[0]])
+        seed, ids, duration, levels = rng.choice(tpl[key])
+        level  = min(LEVELS - 1, max(0, round((skill[u] + rng.gauss(0, 0.08)) * (LEVELS - 1))))
+        codes, score = rng.choice(levels[level])
+        taken  = start + datetime.timedelta(seconds=i * step + rng.random() * step)
+        mode, subject, chapter = key
+        yield (f"cand{u:07d}", subject, chapter or "Full Mock", mode,
+               score["correct"], score["wrong"], score["unattempted"],
+               score["raw_score"], score["total_marks"], score["percentage"],
+               int(duration * rng.uniform(0.35, 1.0)), taken.strftime("%d %b %Y %H:%M"),
+               ids, seed, bank.BANK_VERSION, codes)
+
+def batched(rows, n):
+    it = iter(rows)
+    while batch := list(itertools.islice(it, n)):
+        yield batch
+
+def generate(path, users, results, rng, days=365):
+    """Append `users` candidates and `results` attempts to the database at
+    `path`, in one transaction. Returns the number of candidates."""
+    storage.DB_PATH = pathlib.Path(path)
+    storage.db_init()
+    users = max(1, users)
+    end   = datetime.datetime.now().replace(microsecond=0)
+    start = end - datetime.timedelta(days=days)
+    con = sqlite3.connect(path, isolation_level=None)
+    for pragma in BULK_PRAGMAS:
+        con.execute(pragma)
+    con.execute("BEGIN")
+    first = con.execute("SELECT coalesce(max(id), 0) FROM results").fetchone()[0]
+    for batch in batched(user_rows(users, start, rng), BATCH):
+        con.executemany("INSERT OR IGNORE INTO users(name,course,registered_at) VALUES(?,?,?)", batch)
+    for batch in batched(result_rows(results, users, start, (end - start).total_seconds(), rng), BATCH):
+        con.executemany("""INSERT INTO results
+            (name,subject,chapter,mode,correct,wrong,unattempted,
+             raw_score,total_marks,percentage,time_taken,taken_at,questions,
+             seed,bank_version,answers)
+            VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""", batch)
+    # Bypassing save_results, so count the new rows into the score histograms here
+    con.execute(storage.SQLiteStorage.HIST_BACKFILL, (first, con.execute("SELECT max(id) FROM results").fetchone()[0]))
+    con.execute("COMMIT")
+    con.close()
+    return users
+
+def main():
+    ap = argparse.ArgumentParser(description="GradeUP synthetic data")
+    ap.add_argument("--db",       type=pathlib.Path, default=storage.DB_PATH)
+    ap.add_argument("--users",    type=int, default=10_000)
+    ap.add_argument("--results",  type=int, default=1_000_000)
+    ap.add_argument("--days",     type=int, default=365, help="spread attempts over this many days")
+    ap.add_argument("--bank-per-chapter", type=int,
+                    help="generate a synthetic bank with this many questions per chapter")
+    ap.add_argument("--segment",  type=pathlib.Path,
+                    help="where to compile the synthetic bank (default: next to --db)")
+    ap.add_argument("--seed",     type=int, default=0)
+    args = ap.parse_args()
+    rng  = random.Random(args.seed)
+
+    if args.bank_per_chapter:
+        built = synthetic_bank(args.bank_per_chapter, rng)
+        use_bank(built)
+        segment = args.segment or args.db.with_suffix(".seg")
+        bank.compile_bank(segment, built)
+        print(f"bank: {len(bank.BANK_LIST)} questions → {segment}")
+        print(f"      run the app with GRADEUP_BANK_SEGMENT={segment} GRADEUP_DB={args.db}")
+
+    t0 = time.perf_counter()
+    generate(args.db, args.users, args.results, rng, args.days)
+    dt = time.perf_counter() - t0
+    print(f"{args.users} users, {args.results} results → {args.db} in {dt:.1f}s "
+          f"({args.results / dt:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
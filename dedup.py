@@ -0,0 +1,47 @@
+"""
+GradeUP near-duplicate questions
+- Finds clusters of reworded copies of the same question across years and
+  chapters (MinHash + LSH, see NEAR-DUPLICATES in gradeup/bank.py) and reports them
+- With --compile, writes a bank segment with each cluster merged into one
+  question, for serve.py / GRADEUP_BANK_SEGMENT
+
+    python dedup.py
+    python dedup.py --threshold 0.6 --json dupes.json
+    python dedup.py --compile /dev/shm/gradeup-bank.seg
+"""
+
+import argparse, json, pathlib
+
+from gradeup.bank import BANK_LIST, DUP_THRESHOLD, compile_bank, dedupe_bank, near_duplicates
+from gradeup.questions import build_question_bank
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--threshold", type=float, default=DUP_THRESHOLD,
+                    help="minimum Jaccard similarity of question + options")
+    ap.add_argument("--json",    type=pathlib.Path, help="also write the clusters here")
+    ap.add_argument("--compile", type=pathlib.Path, help="write a merged bank segment here")
+    args = ap.parse_args()
+
+    clusters = [[BANK_LIST[i] for i in c] for c in near_duplicates(BANK_LIST, args.threshold)]
+    for members in clusters:
+        print(f"── {len(members)} copies")
+        for q in members:
+            print(f"   {q['id']}  {q['subject']} / {q['chapter']} · {q.get('year', '')}")
+            print(f"      {q['question'][:100]}")
+    print(f"{len(clusters)} clusters, {sum(map(len, clusters)) - len(clusters)} redundant questions "
+          f"in a bank of {len(BANK_LIST)}")
+
+    if args.json:
+        args.json.write_text(json.dumps([[{k: q.get(k) for k in ("id", "subject", "chapter", "year", "question")}
+                                          for q in members] for members in clusters], indent=2, ensure_ascii=False))
+    if args.compile:
+        bank = build_question_bank()
+        bank, merged = dedupe_bank(bank, args.threshold)
+        compile_bank(args.compile, bank)
+        print(f"merged {len(merged)} clusters → {args.compile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+GradeUP analytics export
+- Streams new attempts from the results table to Parquet, partitioned by
+  date and subject, so analyses run on columnar files instead of a copy of
+  the live database
+- Incremental: the last exported id is checkpointed; each run (or each
+  --every tick) picks up where the previous one stopped. Rows are read in
+  short id-range batches, so writers are never blocked for long
+- Attempts moved out by archive.py are not read — schedule the export well
+  inside the retention window
+
+    python export.py --out analytics
+    python export.py --out analytics --every 600
+
+Layout (Hive-style, readable by pyarrow.dataset, DuckDB, Spark, pandas):
+
+    analytics/results/date=2026-01-05/subject=History/part-000000104001.parquet
+    analytics/responses/date=2026-01-05/subject=History/part-000000104001.parquet
+    analytics/_checkpoint.json
+"""
+
+import argparse, collections, datetime, json, os, pathlib, time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from gradeup import BASE_DIR
+from gradeup.analytics import parse_taken
+from gradeup.bank import BANK_LIST
+from gradeup.selection import attempt_options
+from gradeup.storage import db_export_rows, db_init
+
+BATCH = 50_000
+
+RESULTS_SCHEMA = pa.schema([
+    ("id", pa.int64()), ("name", pa.string()), ("course", pa.string()),
+    ("chapter", pa.string()), ("mode", pa.string()),
+    ("correct", pa.int32()), ("wrong", pa.int32()), ("unattempted", pa.int32()),
+    ("raw_score", pa.float64()), ("total_marks", pa.float64()), ("percentage", pa.float64()),
+    ("time_taken", pa.int32()), ("taken_at", pa.timestamp("s")), ("seed", pa.int64()),
+    ("bank_version", pa.string()),
+])
+
+# One row per question of an attempt. `option` is the original (unshuffled)
+# option index chosen, null if skipped; `is_correct` is null when the
+# question is no longer in the current bank.
+RESPONSES_SCHEMA = pa.schema([
+    ("result_id", pa.int64()), ("name", pa.string()), ("position", pa.int16()),
+    ("question_id", pa.string()), ("chapter", pa.string()), ("option", pa.int8()),
+    ("is_correct", pa.bool_()),
+])
+
+def columns(schema):
+    return {name: [] for name in schema.names}
+
+def add_responses(cols, row, bank):
+    """Append one attempt's per-question rows to `cols`. `bank` maps
+    question id → (chapter, original correct index)."""
+    for pos, (qid, option) in enumerate(attempt_options(row)):
+        chapter, correct = bank.get(qid, (None, None))
+        cols["result_id"].append(row["id"]);  cols["name"].append(row["name"])
+        cols["position"].append(pos);         cols["question_id"].append(qid)
+        cols["chapter"].append(chapter);      cols["option"].append(option)
+        cols["is_correct"].append(None if correct is None or option is None else option == correct)
+
+def write_partitions(root, table, schema, groups, part):
+    for (day, subject), cols in groups.items():
+        if not cols[schema.names[0]]: continue
+        folder = root / table / f"date={day}" / f"subject={subject}"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"part-{part:012d}.parquet"
+        tmp  = path.with_name(path.name + ".tmp")
+        pq.write_table(pa.Table.from_pydict(cols, schema=schema), tmp, compression="zstd")
+        os.replace(tmp, path)
+
+def export_once(out):
+    """Export everything newer than the checkpoint; returns rows exported."""
+    ckpt = out / "_checkpoint.json"
+    last = json.loads(ckpt.read_text())["last_id"] if ckpt.exists() else 0
+    bank  = {q["id"]: (q["chapter"], q["correct"]) for q in BANK_LIST}
+    total = 0
+    while rows := db_export_rows(last, BATCH):
+        results = collections.defaultdict(lambda: columns(RESULTS_SCHEMA))
+        answers = collections.defaultdict(lambda: columns(RESPONSES_SCHEMA))
+        for row in rows:
+            taken = parse_taken(row["taken_at"])
+            known = taken.year > 1
+            key   = (taken.date().isoformat() if known else "unknown", row["subject"])
+            cols  = results[key]
+            for name in RESULTS_SCHEMA.names:
+                cols[name].append(row[name])
+            cols["taken_at"][-1] = taken if known else None
+            add_responses(answers[key], row, bank)
+        # Parts are named after the batch's first id, so a run that dies
+        # before the checkpoint is written just rewrites the same files
+        write_partitions(out, "results", RESULTS_SCHEMA, results, rows[0]["id"])
+        write_partitions(out, "responses", RESPONSES_SCHEMA, answers, rows[0]["id"])
+        last   = rows[-1]["id"]
+        total += len(rows)
+        tmp = ckpt.with_name(ckpt.name + ".tmp")
+        tmp.write_text(json.dumps({"last_id": last, "exported_at": datetime.datetime.now().isoformat()}))
+        os.replace(tmp, ckpt)
+    return total
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--out",   type=pathlib.Path, default=BASE_DIR / "analytics")
+    ap.add_argument("--every", type=float, help="keep running, exporting every N seconds")
+    args = ap.parse_args()
+
+    db_init()
+    while True:
+        t0 = time.perf_counter()
+        n  = export_once(args.out)
+        print(f"exported {n} attempts to {args.out} in {time.perf_counter() - t0:.1f}s", flush=True)
+        if not args.every:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
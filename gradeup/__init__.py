@@ -0,0 +1,25 @@
+"""
+GradeUP — NDA/CDS exam preparation platform
+
+    metrics     opt-in latency histograms and the per-session profiler
+    storage     SQLite / PostgreSQL backends and the db_* helpers
+    questions   the built-in question bank
+    bank        bank loading (dicts or a shared segment), near-duplicates, search
+    scoring     marking scheme
+    selection   seeded papers, full-length blueprints, the paper pool
+    analytics   archival, rollups, mastery, engagement, practice recommendations
+    sessions    session state, shared session backends, checkpoints
+    theme       stylesheet and static assets
+    offline     offline-tolerant tests
+    service     process-wide start-up
+    pages       sidebar and page renderers
+
+app.py is the page script Streamlit re-executes on every rerun; this
+package is imported once per process, so the bank and other module state
+live as long as the worker. altair, pandas, numpy and streamlit.components
+are imported inside the functions that use them (see bench/startup.py).
+"""
+
+import pathlib
+
+BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
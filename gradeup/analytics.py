@@ -0,0 +1,368 @@
+"""
+GradeUP analytics kept beside the results table: archival, rollups, mastery,
+engagement and practice recommendations.
+"""
+
+import streamlit as st
+import datetime, functools, hashlib, heapq, logging, math, os, sqlite3, threading, time, zlib
+
+from . import bank, storage
+from .storage import (ARCHIVE_DIR, STORAGE_BACKEND, db_apply_engagement, db_apply_mastery,
+                      db_apply_rollups, db_backfill_histograms, db_export_rows, db_init,
+                      db_load_engagement, db_rollup_watermark)
+from .selection import attempt_options
+
+log = logging.getLogger(__name__)
+
+# Attempts older than this many days are moved to monthly archive DBs
+# under ARCHIVE_DIR by archive_results() (see archive.py)
+RETENTION_DAYS = int(os.environ.get("GRADEUP_RETENTION_DAYS", 180))
+
+# ═══════════════════════════════════════════════════════════════
+# ARCHIVAL
+# Attempts older than RETENTION_DAYS move, one calendar month per file,
+# to ARCHIVE_DIR/results-YYYY-MM.db. The hot DB keeps an `archives`
+# index (month → id range) and per-(user, subject) totals plus the best
+# archived attempt, so dashboards and the leaderboard never open the
+# archives; full history and old attempt reviews read them on demand.
+# Totals are unchanged by archiving, but the leaderboard then lists only
+# that best attempt per (user, subject) for archived months: their other
+# attempts leave the board, so ranks stay the same or improve.
+# ═══════════════════════════════════════════════════════════════
+TAKEN_FMT = "%d %b %Y %H:%M"
+
+def parse_taken(s):
+    try:
+        return datetime.datetime.strptime(s, TAKEN_FMT)
+    except (TypeError, ValueError):
+        return datetime.datetime.min
+
+@functools.lru_cache(maxsize=None)
+def _month(month_year):
+    # "Jan 2026" (taken_at[3:11]) → "2026-01"
+    try:
+        return datetime.datetime.strptime(month_year, "%b %Y").strftime("%Y-%m")
+    except ValueError:
+        return "0000-00"
+
+def _archive_cutoff(con, before):
+    """Highest results id taken before `before`, or None.
+
+    Ids grow with taken_at, so this bisects over ids instead of parsing
+    every row's date.
+    """
+    lo, hi = con.execute("SELECT min(id), max(id) FROM results").fetchone()
+    found  = None
+    while lo is not None and lo <= hi:
+        mid = (lo + hi) // 2
+        row = con.execute("SELECT id, taken_at FROM results WHERE id>=? ORDER BY id LIMIT 1",
+                          (mid,)).fetchone()
+        if row and row[0] <= hi and parse_taken(row[1]) < before:
+            found, lo = row[0], row[0] + 1
+        else:
+            hi = mid - 1
+    return found
+
+def archive_results(days=RETENTION_DAYS, now=None):
+    """Move attempts older than `days` into monthly archives.
+
+    Each month is one transaction across the hot DB and its archive file,
+    so an interrupted run leaves every attempt in exactly one place.
+    Returns {month: rows moved}.
+    """
+    if STORAGE_BACKEND != "sqlite":
+        raise RuntimeError("archival is only implemented for SQLite storage")
+    db_init()
+    refresh_rollups()   # rollups only ever read the hot table
+    refresh_mastery()
+    refresh_engagement()
+    refresh_histograms()
+    before = (now or datetime.datetime.now()) - datetime.timedelta(days=days)
+    con = sqlite3.connect(storage.DB_PATH, isolation_level=None)
+    try:
+        cutoff = _archive_cutoff(con, before)
+        if cutoff is None:
+            return {}
+
+        runs = []   # [month, first id, last id] — contiguous since ids follow time
+        for rid, taken in con.execute("SELECT id, taken_at FROM results WHERE id<=? ORDER BY id",
+                                      (cutoff,)):
+            month = _month((taken or "")[3:11])
+            if runs and runs[-1][0] == month:
+                runs[-1][2] = rid
+            else:
+                runs.append([month, rid, rid])
+
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        moved = {}
+        for month, lo, hi in runs:
+            moved[month] = moved.get(month, 0) + _archive_month(con, month, lo, hi)
+        return moved
+    finally:
+        con.close()
+
+# Best = first in leaderboard order, so a candidate's rank never drops
+BEST_ROWS = """SELECT name, subject, tests, pct_sum, wrong_sum,
+                      chapter, mode, raw_score, total_marks, percentage, time_taken, taken_at
+               FROM (SELECT *, count(*) OVER w AS tests, sum(percentage) OVER w AS pct_sum,
+                            sum(wrong) OVER w AS wrong_sum,
+                            row_number() OVER (w ORDER BY percentage DESC, time_taken ASC) AS pick
+                     FROM main.results WHERE id BETWEEN ? AND ?
+                     WINDOW w AS (PARTITION BY name, subject))
+               WHERE pick = 1"""
+
+def _archive_month(con, month, lo, hi):
+    """Move ids lo..hi into `month`'s archive in one transaction; rows moved."""
+    file = f"results-{month}.db"
+    con.execute("ATTACH DATABASE ? AS arc", (str(ARCHIVE_DIR / file),))
+    try:
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("CREATE TABLE IF NOT EXISTS arc.results AS SELECT * FROM main.results WHERE 0")
+        con.execute("CREATE INDEX IF NOT EXISTS arc.results_id ON results(id)")
+        con.execute("CREATE INDEX IF NOT EXISTS arc.results_name ON results(name)")
+        cols = ",".join(r[1] for r in con.execute("PRAGMA arc.table_info(results)"))
+        n = con.execute(f"""INSERT INTO arc.results({cols}) SELECT {cols} FROM main.results
+                            WHERE id BETWEEN ? AND ?""", (lo, hi)).rowcount
+        better = "(excluded.best_pct > best_pct OR (excluded.best_pct = best_pct AND excluded.best_time < best_time))"
+        con.execute(f"""INSERT INTO archived_stats {BEST_ROWS}
+            ON CONFLICT(name, subject) DO UPDATE SET
+                tests   = tests + excluded.tests,
+                pct_sum = pct_sum + excluded.pct_sum,
+                wrong   = wrong + excluded.wrong,
+                best_chapter  = iif({better}, excluded.best_chapter, best_chapter),
+                best_mode     = iif({better}, excluded.best_mode, best_mode),
+                best_raw      = iif({better}, excluded.best_raw, best_raw),
+                best_total    = iif({better}, excluded.best_total, best_total),
+                best_taken_at = iif({better}, excluded.best_taken_at, best_taken_at),
+                best_time     = iif({better}, excluded.best_time, best_time),
+                best_pct      = max(best_pct, excluded.best_pct)""", (lo, hi))
+        con.execute("DELETE FROM main.results WHERE id BETWEEN ? AND ?", (lo, hi))
+        con.execute("""INSERT INTO archives VALUES(?,?,?,?,?)
+            ON CONFLICT(month) DO UPDATE SET
+                first_id = min(first_id, excluded.first_id),
+                last_id  = max(last_id, excluded.last_id),
+                rows     = rows + excluded.rows""", (month, file, lo, hi, n))
+        con.execute("COMMIT")
+        return n
+    except Exception:
+        if con.in_transaction:
+            con.execute("ROLLBACK")
+        raise
+    finally:
+        con.execute("DETACH DATABASE arc")
+
+# ═══════════════════════════════════════════════════════════════
+# ROLLUPS — cohort analytics for the instructor page
+# New results are folded, in id order behind a watermark, into hourly and
+# daily score buckets per (course, subject, chapter, mode, score decile)
+# and into all-time per-question answer counts. The page reads only these
+# tables, so its cost follows the number of buckets, not of users. A
+# second watermark ("mastery") folds the same rows into per-user chapter
+# counts for the dashboard's recommendations.
+# ═══════════════════════════════════════════════════════════════
+ROLLUP_BATCH     = 5000
+ROLLUP_INTERVAL  = 60
+HOURLY_KEEP_DAYS = 7
+
+def refresh_rollups(batch=ROLLUP_BATCH):
+    """Fold results newer than the watermark into the rollups; returns rows folded."""
+    done = 0
+    while True:
+        last = db_rollup_watermark()
+        rows = db_export_rows(last, batch)
+        if not rows:
+            return done
+        scores, questions = {}, {}
+        for r in rows:
+            taken = parse_taken(r["taken_at"])
+            decile = min(9, int(r["percentage"] // 10))
+            for grain, bucket in (("hour", taken.strftime("%Y-%m-%d %H:00")),
+                                  ("day", taken.strftime("%Y-%m-%d"))):
+                key = (grain, bucket, r["course"] or "Unknown", r["subject"],
+                       r["chapter"] or "", r["mode"], decile)
+                acc = scores.setdefault(key, [0, 0.0, 0, 0, 0])
+                acc[0] += 1; acc[1] += r["percentage"]
+                acc[2] += r["correct"]; acc[3] += r["wrong"]; acc[4] += r["unattempted"]
+            for qid, option in attempt_options(r):
+                if qid not in bank.BANK_POS: continue
+                acc = questions.setdefault(qid, [0, 0, 0])
+                acc[0] += 1
+                if option is not None:
+                    acc[1] += 1
+                    acc[2] += option == bank.BANK_LIST[bank.BANK_POS[qid]]["correct"]
+        prune = (datetime.datetime.now() - datetime.timedelta(days=HOURLY_KEEP_DAYS)).strftime("%Y-%m-%d %H:00")
+        if db_apply_rollups(last, rows[-1]["id"], [(*k, *v) for k, v in scores.items()],
+                            [(qid, *v) for qid, v in questions.items()], prune):
+            done += len(rows)
+
+MASTERY_FMT = "%Y-%m-%d %H:%M"
+
+def fold_mastery(acc, name, options, taken):
+    """Add one attempt's (question id, original option) pairs to `acc`,
+    keyed (name, subject, chapter) → [shown, answered, correct, last taken]."""
+    for qid, option in options:
+        if qid not in bank.BANK_POS: continue
+        q = bank.BANK_LIST[bank.BANK_POS[qid]]
+        a = acc.setdefault((name, q["subject"], q["chapter"]), [0, 0, 0, ""])
+        a[0] += 1
+        if option is not None:
+            a[1] += 1
+            a[2] += option == q["correct"]
+        a[3] = max(a[3], taken)
+    return acc
+
+def refresh_mastery(batch=ROLLUP_BATCH):
+    """Fold results newer than the mastery watermark into per-user chapter
+    counts (the dashboard's "practice next"); returns rows folded."""
+    done = 0
+    while True:
+        last = db_rollup_watermark("mastery")
+        rows = db_export_rows(last, batch)
+        if not rows:
+            return done
+        acc = {}
+        for r in rows:
+            fold_mastery(acc, r["name"], attempt_options(r), parse_taken(r["taken_at"]).strftime(MASTERY_FMT))
+        if db_apply_mastery(last, rows[-1]["id"], [(*k, *v) for k, v in acc.items()]):
+            done += len(rows)
+
+# ═══════════════════════════════════════════════════════════════
+# ENGAGEMENT — approximate distinct candidates per day, subject and course
+# Each (day, dim, key) keeps a test count and a HyperLogLog sketch of the
+# names seen (4096 one-byte registers, ~1.6% error, zlib-packed so quiet
+# days stay small). Sketches union by register max, so weekly/monthly
+# actives are merged from daily ones; nothing reads results to count.
+# ═══════════════════════════════════════════════════════════════
+HLL_P = 12
+HLL_M = 1 << HLL_P
+ENGAGEMENT_DIMS = ("all", "subject", "course")
+
+class HyperLogLog:
+    ALPHA = 0.7213 / (1 + 1.079 / HLL_M)
+
+    def __init__(self, registers=None):
+        import numpy as np
+        self.reg = np.zeros(HLL_M, np.uint8) if registers is None else registers
+
+    @classmethod
+    def from_blob(cls, blob):
+        import numpy as np
+        return cls(np.frombuffer(zlib.decompress(blob), np.uint8).copy())
+
+    def to_blob(self):
+        return zlib.compress(self.reg.tobytes())
+
+    def add(self, item):
+        h    = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=8).digest(), "big")
+        idx  = h >> (64 - HLL_P)
+        rank = 64 - HLL_P - (h & ((1 << (64 - HLL_P)) - 1)).bit_length() + 1
+        if rank > self.reg[idx]:
+            self.reg[idx] = rank
+
+    def merge(self, other):
+        import numpy as np
+        np.maximum(self.reg, other.reg, out=self.reg)
+        return self
+
+    def count(self):
+        import numpy as np
+        est   = self.ALPHA * HLL_M * HLL_M / np.ldexp(1.0, -self.reg.astype(np.int32)).sum()
+        zeros = int((self.reg == 0).sum())
+        if est <= 2.5 * HLL_M and zeros:
+            est = HLL_M * math.log(HLL_M / zeros)    # linear counting for small sets
+        return round(est)
+
+def refresh_engagement(batch=ROLLUP_BATCH):
+    """Fold results newer than the engagement watermark into the daily
+    counters and sketches; returns rows folded."""
+    done = 0
+    while True:
+        last = db_rollup_watermark("engagement")
+        rows = db_export_rows(last, batch)
+        if not rows:
+            return done
+        acc = {}
+        for r in rows:
+            day = parse_taken(r["taken_at"]).strftime("%Y-%m-%d")
+            for dim, key in zip(ENGAGEMENT_DIMS, ("all", r["subject"], r["course"] or "Unknown")):
+                a = acc.setdefault((day, dim, key), [0, HyperLogLog()])
+                a[0] += 1; a[1].add(r["name"])
+        # Read after the watermark: only the batch's CAS winner writes these keys
+        for day, dim, key, tests, sketch in db_load_engagement(min(k[0] for k in acc)):
+            if (day, dim, key) in acc:
+                a = acc[day, dim, key]
+                a[0] += tests; a[1].merge(HyperLogLog.from_blob(sketch))
+        if db_apply_engagement(last, rows[-1]["id"], [(*k, n, h.to_blob()) for k, (n, h) in acc.items()]):
+            done += len(rows)
+
+def engagement(days):
+    """(daily actives [(day, n)], {(dim, key): (tests, distinct)} over the
+    last `days` days), from the sketches alone."""
+    since  = (datetime.date.today() - datetime.timedelta(days=days - 1)).isoformat()
+    daily  = []
+    totals = {}
+    for day, dim, key, tests, sketch in sorted(db_load_engagement(since)):
+        h = HyperLogLog.from_blob(sketch)
+        if dim == "all":
+            daily.append((day, h.count()))
+        t = totals.setdefault((dim, key), [0, HyperLogLog()])
+        t[0] += tests; t[1].merge(h)
+    return daily, {k: (n, h.count()) for k, (n, h) in totals.items()}
+
+def refresh_histograms(batch=ROLLUP_BATCH):
+    """Count results that predate the score histograms, one short
+    transaction per batch, so workers starting meanwhile never wait on it."""
+    while db_backfill_histograms(batch):
+        pass
+
+@st.cache_resource
+def rollup_worker():
+    def run():
+        while True:
+            try:
+                refresh_rollups()
+                refresh_mastery()
+                refresh_engagement()
+                refresh_histograms()
+            except Exception:    # keep the thread alive; each refresh resumes from its watermark
+                log.exception("rollup refresh failed")
+            time.sleep(ROLLUP_INTERVAL)
+    thread = threading.Thread(target=run, name="rollups", daemon=True)
+    thread.start()
+    return thread
+
+# ═══════════════════════════════════════════════════════════════
+# PRACTICE NEXT — chapters ranked by expected gain from one more test
+# Per-chapter counts come from user_mastery once per session, then each
+# submitted test is folded into the session copy, so ranking costs no
+# query. Gain = room to improve (1 − accuracy, shrunk towards 50% when
+# few questions were answered) + what has likely been forgotten since
+# the last practice + a small bonus for thinly sampled chapters.
+# ═══════════════════════════════════════════════════════════════
+PRACTICE_CARDS   = 3
+FORGET_HALF_LIFE = 14     # days until half of the forgettable share is lost
+FORGET_SHARE     = 0.5    # share of mastered questions that can be forgotten
+EXPLORE_BONUS    = 0.1
+
+def chapter_gain(shown, answered, correct, last_taken, now):
+    acc = (correct + 1) / (answered + 2)
+    if last_taken:
+        days   = max(0.0, (now - datetime.datetime.strptime(last_taken, MASTERY_FMT)).total_seconds() / 86400)
+        forget = FORGET_SHARE * (1 - 0.5 ** (days / FORGET_HALF_LIFE))
+    else:
+        forget = 0.0
+    return (1 - acc) + acc * forget + EXPLORE_BONUS / math.sqrt(1 + answered)
+
+def practice_next(n=PRACTICE_CARDS, now=None):
+    """[(gain, subject, chapter, shown, accuracy or None, last taken)] — the
+    `n` best chapters in subjects the candidate has practised."""
+    mastery = st.session_state.mastery
+    now     = now or datetime.datetime.now()
+    ranked  = []
+    for subject in {subj for subj, _ in mastery}:
+        if subject not in bank.QUESTION_BANK: continue
+        for chapter in bank.QUESTION_BANK[subject]:
+            shown, answered, correct, last = mastery.get((subject, chapter), (0, 0, 0, ""))
+            ranked.append((chapter_gain(shown, answered, correct, last, now), subject, chapter, shown,
+                           correct / answered if answered else None, last))
+    return heapq.nlargest(n, ranked)
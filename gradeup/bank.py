@@ -0,0 +1,296 @@
+"""
+GradeUP question bank: loading (dicts or a shared mmapped segment), near-duplicates and search.
+"""
+
+import streamlit as st
+import array, collections.abc, functools, hashlib, itertools, json, mmap, os, pathlib, sqlite3, struct, threading
+
+from .questions import build_question_bank
+
+# ═══════════════════════════════════════════════════════════════
+# NEAR-DUPLICATES — MinHash signatures + LSH banding
+# The same PYQ often appears reworded under several years. Questions are
+# shingled (character 5-grams of question + sorted options), signed with
+# MINHASH_PERM hash permutations and bucketed per band; only pairs sharing
+# a bucket are compared exactly, so the cost grows with the bank, not its
+# square. 16 bands × 4 rows make pairs above ~0.5 Jaccard collide. A pair
+# is a duplicate at DUP_THRESHOLD Jaccard with the same correct answer
+# (so "LCM of …" and "HCF of …" stay apart).
+# ═══════════════════════════════════════════════════════════════
+SHINGLE       = 5
+MINHASH_PERM  = 64
+LSH_BANDS     = 16
+DUP_THRESHOLD = 0.7
+_PRIME        = (1 << 31) - 1
+
+def _normalized(text):
+    return " ".join("".join(c.lower() if c.isalnum() else " " for c in text).split())
+
+def shingles(q):
+    text = _normalized(" ".join([q["question"], *sorted(q["options"])]))
+    return {text[i:i + SHINGLE] for i in range(max(1, len(text) - SHINGLE + 1))}
+
+def minhash(sets):
+    """MINHASH_PERM-wide signature per shingle set, one int64 row each."""
+    import numpy as np
+    rng  = np.random.default_rng(0)
+    a    = rng.integers(1, _PRIME, MINHASH_PERM, dtype=np.int64)[:, None]
+    b    = rng.integers(0, _PRIME, MINHASH_PERM, dtype=np.int64)[:, None]
+    sigs = np.empty((len(sets), MINHASH_PERM), dtype=np.int64)
+    for i, sh in enumerate(sets):
+        h = np.fromiter((int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little")
+                         for s in sh), dtype=np.int64, count=len(sh))
+        sigs[i] = ((a * h + b) % _PRIME).min(axis=1)
+    return sigs
+
+def near_duplicates(questions, threshold=DUP_THRESHOLD):
+    """Clusters (lists of positions in `questions`) of near-duplicate questions."""
+    sets   = [shingles(q) for q in questions]
+    keys   = [_normalized(q["options"][q["correct"]]) for q in questions]
+    sigs   = minhash(sets)
+    rows   = MINHASH_PERM // LSH_BANDS
+    parent = list(range(len(questions)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for band in range(LSH_BANDS):
+        buckets = {}
+        for i, sig in enumerate(sigs[:, band * rows:(band + 1) * rows]):
+            buckets.setdefault(sig.tobytes(), []).append(i)
+        for members in buckets.values():
+            for x, y in itertools.combinations(members, 2):
+                if (x, y) in checked: continue
+                checked.add((x, y))
+                if keys[x] == keys[y] and len(sets[x] & sets[y]) / len(sets[x] | sets[y]) >= threshold:
+                    parent[root(y)] = root(x)
+
+    clusters = {}
+    for i in range(len(questions)):
+        clusters.setdefault(root(i), []).append(i)
+    return [c for c in clusters.values() if len(c) > 1]
+
+def dedupe_bank(bank, threshold=DUP_THRESHOLD):
+    """(bank with one question per near-duplicate cluster, clusters of ids).
+
+    The kept question is the one with the longest explanation; the years
+    of the ones dropped are listed on it under "also_asked".
+    """
+    flat, _, _ = index_bank(bank)
+    drop, clusters = set(), []
+    for cluster in near_duplicates(flat, threshold):
+        members = [flat[i] for i in cluster]
+        keep    = max(members, key=lambda q: len(q.get("explanation", "")))
+        rest    = [q for q in members if q is not keep]
+        keep["also_asked"] = sorted({q.get("year", "") for q in rest} - {keep.get("year")})
+        drop.update(id(q) for q in rest)
+        clusters.append([keep["id"]] + [q["id"] for q in rest])
+    deduped = {subj: {ch: [q for q in qs if id(q) not in drop] for ch, qs in chs.items()}
+               for subj, chs in bank.items()}
+    return deduped, clusters
+
+# ═══════════════════════════════════════════════════════════════
+# BANK LOADING — in-process dicts, or a shared read-only segment
+# With GRADEUP_BANK_SEGMENT set to a file written by compile_bank()
+# (serve.py does this once before starting its workers), every process
+# mmaps the same pages and decodes a question only when it is accessed,
+# so each extra worker adds almost no memory for the bank. The most
+# recently used DECODED_CACHE questions stay decoded per process.
+#
+# Segment layout: magic · u32 header length · JSON header (version, count,
+# chapter ranges) · u64 record offsets[count+1] · sorted (5-byte id, u32
+# position) table · one compact JSON record per question.
+# ═══════════════════════════════════════════════════════════════
+BANK_SEGMENT  = os.environ.get("GRADEUP_BANK_SEGMENT")
+SEGMENT_MAGIC = b"GUPBANK1"
+ID_ENTRY      = struct.Struct("<5sI")
+DECODED_CACHE = 4096   # decoded questions kept per process
+
+# Stable id per question (hash of its text) so attempts can record which
+# questions they contained; subject/chapter are stamped on for mixed papers
+def _qid(q):
+    return hashlib.blake2b(q["question"].encode(), digest_size=5).hexdigest()
+
+def index_bank(bank):
+    """(questions in bank order, id → position, bank version) for a built bank."""
+    flat = []
+    for subj, chs in bank.items():
+        for ch, qs in chs.items():
+            for q in qs:
+                q.update(id=_qid(q), subject=subj, chapter=ch)
+                flat.append(q)
+    positions = {q["id"]: i for i, q in enumerate(flat)}
+    version   = hashlib.blake2b(repr([(q["id"], q["options"], q["correct"]) for q in flat])
+                                .encode(), digest_size=6).hexdigest()
+    return flat, positions, version
+
+def compile_bank(path, bank=None, dedupe=False):
+    """Write the bank segment; with `dedupe`, near-duplicates are merged
+    first. Returns the merged clusters."""
+    path = pathlib.Path(path)
+    bank = bank or build_question_bank()
+    clusters = []
+    if dedupe:
+        bank, clusters = dedupe_bank(bank)
+    flat, _, version = index_bank(bank)
+    chapters, start = [], 0
+    for subj, chs in bank.items():
+        for ch, qs in chs.items():
+            chapters.append([subj, ch, start, start + len(qs)]); start += len(qs)
+    header  = json.dumps({"version": version, "count": len(flat), "chapters": chapters}).encode()
+    records = [json.dumps(q, ensure_ascii=False, separators=(",", ":")).encode() for q in flat]
+    offsets = array.array("Q", itertools.accumulate(map(len, records), initial=0))
+    ids     = sorted((bytes.fromhex(q["id"]), i) for i, q in enumerate(flat))
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(SEGMENT_MAGIC + struct.pack("<I", len(header)) + header)
+        f.write(offsets.tobytes())
+        f.write(b"".join(ID_ENTRY.pack(*entry) for entry in ids))
+        f.write(b"".join(records))
+    os.replace(tmp, path)   # workers never map a half-written segment
+    return clusters
+
+class BankSegment:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buf[:8] != SEGMENT_MAGIC:
+            raise ValueError(f"{path} is not a compiled GradeUP bank")
+        hlen   = struct.unpack_from("<I", self.buf, 8)[0]
+        header = json.loads(self.buf[12:12 + hlen])
+        self.version  = header["version"]
+        self.count    = header["count"]
+        self.chapters = header["chapters"]
+        at = 12 + hlen
+        self.offsets = memoryview(self.buf)[at:at + 8 * (self.count + 1)].cast("Q")
+        self.ids_at  = at + 8 * (self.count + 1)
+        self.data_at = self.ids_at + ID_ENTRY.size * self.count
+        self.question = functools.lru_cache(maxsize=DECODED_CACHE)(self._decode)
+
+    def _decode(self, i):
+        return json.loads(self.buf[self.data_at + self.offsets[i]:self.data_at + self.offsets[i + 1]])
+
+    def id_entry(self, k):
+        return ID_ENTRY.unpack_from(self.buf, self.ids_at + k * ID_ENTRY.size)
+
+    def position(self, qid):
+        # Binary search over the sorted id table
+        key, lo, hi = bytes.fromhex(qid), 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.id_entry(mid)[0] < key: lo = mid + 1
+            else: hi = mid
+        if lo < self.count and self.id_entry(lo)[0] == key:
+            return self.id_entry(lo)[1]
+        raise KeyError(qid)
+
+    def bank(self):
+        bank = {}
+        for subj, ch, start, end in self.chapters:
+            bank.setdefault(subj, {})[ch] = MappedQuestions(self, start, end)
+        return bank
+
+class MappedQuestions(collections.abc.Sequence):
+    """Questions [start, end) of a segment, decoded on access."""
+    def __init__(self, seg, start, end):
+        self.seg, self.start, self.end = seg, start, end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0: i += len(self)
+        if not 0 <= i < len(self): raise IndexError(i)
+        return self.seg.question(self.start + i)
+
+class MappedPositions(collections.abc.Mapping):
+    """Question id → bank position, looked up in the segment's id table."""
+    def __init__(self, seg):
+        self.seg = seg
+
+    def __getitem__(self, qid):
+        return self.seg.position(qid)
+
+    def __iter__(self):
+        return (self.seg.id_entry(k)[0].hex() for k in range(self.seg.count))
+
+    def __len__(self):
+        return self.seg.count
+
+def load_bank():
+    """(bank, questions in bank order, id → position, version). Called once,
+    on import, so each process builds or maps the bank a single time."""
+    if BANK_SEGMENT and pathlib.Path(BANK_SEGMENT).exists():
+        seg = BankSegment(BANK_SEGMENT)
+        return seg.bank(), MappedQuestions(seg, 0, seg.count), MappedPositions(seg), seg.version
+    bank = build_question_bank()
+    return (bank, *index_bank(bank))
+
+# Other modules read these as bank.QUESTION_BANK etc., so a bank swapped in
+# by the benchmarks (bench/synth.py use_bank) is seen everywhere
+QUESTION_BANK, BANK_LIST, BANK_POS, BANK_VERSION = load_bank()
+
+CHAPTERS = {
+    "English":         ["Grammar & Vocabulary"],
+    "Mathematics":     ["Algebra & Number Theory", "Trigonometry & Geometry"],
+    "General Science": ["Physics", "Chemistry", "Biology"],
+    "History":         ["Indian History"],
+    "Geography":       ["Indian & World Geography"],
+    "Economics":       ["Indian Economy & Economic Theory"],
+}
+SUBJECTS      = list(QUESTION_BANK.keys())
+SUBJECT_ICONS = {
+    "English":"📝", "Mathematics":"📐", "General Science":"🔬",
+    "History":"🏛️", "Geography":"🌏", "Economics":"💹"
+}
+
+# ═══════════════════════════════════════════════════════════════
+# QUESTION SEARCH
+# An in-memory FTS5 index over the bank (rowid = bank position): question,
+# options, explanation, year, chapter and subject, ranked by bm25 with the
+# question text weighted highest. Built once per process, on first search.
+# ═══════════════════════════════════════════════════════════════
+SEARCH_PAGE    = 10
+SEARCH_WEIGHTS = (8.0, 3.0, 1.0, 5.0, 4.0, 2.0)   # same order as the columns
+
+def fts_query(text):
+    # Every word becomes a quoted prefix term, so input can't break FTS syntax
+    words = "".join(c if c.isalnum() else " " for c in text).split()
+    return " ".join(f'"{w}"*' for w in words)
+
+class SearchIndex:
+    def __init__(self, questions):
+        self.con  = sqlite3.connect(":memory:", check_same_thread=False)
+        self.lock = threading.Lock()
+        self.con.execute("""CREATE VIRTUAL TABLE bank USING fts5(
+                                question, options, explanation, year, chapter, subject,
+                                tokenize='unicode61 remove_diacritics 2')""")
+        self.con.executemany("INSERT INTO bank(rowid,question,options,explanation,year,chapter,subject) "
+                             "VALUES(?,?,?,?,?,?,?)",
+                             ((i, q["question"], " · ".join(q["options"]), q.get("explanation", ""),
+                               q.get("year", ""), q["chapter"], q["subject"])
+                              for i, q in enumerate(questions)))
+
+    def search(self, text, subject=None, offset=0, limit=SEARCH_PAGE):
+        """(total matches, [(bank position, highlighted question)]) for one page."""
+        match = fts_query(text)
+        if subject:
+            match = f'({match}) AND subject : "{subject}"' if match else f'subject : "{subject}"'
+        if not match:
+            return 0, []
+        with self.lock:
+            total = self.con.execute("SELECT count(*) FROM bank WHERE bank MATCH ?", (match,)).fetchone()[0]
+            rows  = self.con.execute(f"""SELECT rowid, highlight(bank, 0, '<mark>', '</mark>') FROM bank
+                                         WHERE bank MATCH ? ORDER BY bm25(bank, {",".join(map(str, SEARCH_WEIGHTS))})
+                                         LIMIT ? OFFSET ?""", (match, limit, offset)).fetchall()
+        return total, rows
+
+@st.cache_resource
+def search_index():
+    return SearchIndex(BANK_LIST)
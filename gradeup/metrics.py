@@ -0,0 +1,147 @@
+"""
+GradeUP instrumentation: latency histograms, Prometheus export and the per-session profiler.
+"""
+
+import streamlit as st
+import bisect, collections, contextlib, functools, os, pathlib, sys, threading, time
+
+from . import BASE_DIR
+
+# ═══════════════════════════════════════════════════════════════
+# INSTRUMENTATION — opt-in with GRADEUP_METRICS=1
+# Fixed-bucket latency histograms per rerun, page and db_* call, kept
+# in-process. They are shown on the admin page and written in Prometheus
+# text format to GRADEUP_METRICS_FILE (a node-exporter textfile target).
+# When off, timed() returns the function untouched and timer() is a no-op.
+# ═══════════════════════════════════════════════════════════════
+METRICS_ENABLED  = os.environ.get("GRADEUP_METRICS") == "1"
+METRICS_FILE     = pathlib.Path(os.environ.get("GRADEUP_METRICS_FILE", BASE_DIR / "metrics.prom"))
+METRICS_INTERVAL = 15
+BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum    = 0.0
+        self.count  = 0
+
+    def observe(self, sec):
+        self.counts[bisect.bisect_left(BUCKETS, sec)] += 1
+        self.sum   += sec
+        self.count += 1
+
+    def quantile(self, q):
+        # Linear interpolation inside the bucket holding the q-th sample
+        rank, seen = q * self.count, 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                lo = BUCKETS[i - 1] if i else 0.0
+                hi = BUCKETS[i] if i < len(BUCKETS) else lo * 2 or 1
+                return lo + (hi - lo) * (rank - seen) / c
+            seen += c
+        return 0.0
+
+class Metrics:
+    def __init__(self):
+        self.lock     = threading.Lock()
+        self.families = {}   # family → {label: Histogram}
+
+    def observe(self, family, label, sec):
+        with self.lock:
+            fam = self.families.setdefault(family, {})
+            (fam.get(label) or fam.setdefault(label, Histogram())).observe(sec)
+
+    def prometheus(self):
+        out = []
+        with self.lock:
+            for family, hists in sorted(self.families.items()):
+                name = f"gradeup_{family}_seconds"
+                out.append(f"# TYPE {name} histogram")
+                for label, h in sorted(hists.items()):
+                    lbl, cum = f'{family}="{label}"', 0
+                    for le, c in zip([*map(str, BUCKETS), "+Inf"], h.counts):
+                        cum += c
+                        out.append(f'{name}_bucket{{{lbl},le="{le}"}} {cum}')
+                    out.append(f"{name}_sum{{{lbl}}} {h.sum:.6f}")
+                    out.append(f"{name}_count{{{lbl}}} {h.count}")
+        return "\n".join(out) + "\n"
+
+@st.cache_resource
+def metrics():
+    m = Metrics()
+
+    def dump():
+        while True:
+            time.sleep(METRICS_INTERVAL)
+            try:
+                tmp = METRICS_FILE.with_name(METRICS_FILE.name + ".tmp")
+                tmp.write_text(m.prometheus())
+                os.replace(tmp, METRICS_FILE)
+            except OSError:
+                pass
+
+    threading.Thread(target=dump, name="metrics-dump", daemon=True).start()
+    return m
+
+@contextlib.contextmanager
+def timer(family, label):
+    if not METRICS_ENABLED:
+        yield; return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics().observe(family, label, time.perf_counter() - t0)
+
+def timed(family):
+    def wrap(fn):
+        if not METRICS_ENABLED: return fn
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with timer(family, fn.__name__):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+class StackSampler:
+    """Samples one thread's Python stack every `interval` seconds.
+
+    Results are collapsed stacks (root;…;leaf → samples), the input format
+    of flamegraph.pl and speedscope.
+    """
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval  = interval
+        self.stacks    = collections.Counter()
+        self.stop      = threading.Event()
+        self.thread    = threading.Thread(target=self._run, name="sampler", daemon=True)
+
+    def _run(self):
+        while not self.stop.wait(self.interval):
+            frame, stack = sys._current_frames().get(self.thread_id), []
+            while frame:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({pathlib.Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop.set()
+        self.thread.join()
+
+@contextlib.contextmanager
+def profiling():
+    """Sample this rerun if the session switched the profiler on."""
+    if not st.session_state.get("profile"):
+        yield; return
+    sampler = StackSampler(threading.get_ident())
+    try:
+        with sampler:
+            yield
+    finally:   # st.rerun() raises, so merge on the way out either way
+        st.session_state.setdefault("profile_stacks", collections.Counter()).update(sampler.stacks)
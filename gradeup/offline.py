@@ -0,0 +1,95 @@
+"""
+GradeUP offline-tolerant tests: the browser component and paper encoding.
+"""
+
+import streamlit as st
+import array, base64, functools, hashlib, json, time, zlib
+
+from . import BASE_DIR, bank
+from .selection import POSITION_TYPE, materialize
+
+# ═══════════════════════════════════════════════════════════════
+# OFFLINE TESTS — the whole paper goes to the browser once
+# A component renders it, buffers answers in the page and localStorage,
+# and posts them in one payload on submit or at time-out, so a test costs
+# no reruns and survives dropped connections and reloads. The payload
+# names the paper it answers and carries a checksum; anything that does
+# not match the paper in this session is refused.
+#
+# The paper itself travels as deflated, base64 JSON with year/difficulty/
+# section strings interned and no answer keys or explanations, built once
+# per (bank version, variant) and shared by every session drawing it. Its
+# etag is the cache key: once the browser acks an etag (it keeps the paper
+# in localStorage), later renders send only the etag.
+#
+# Only the offline toggle takes this path. The normal test page still
+# renders every question as markdown plus a radio (one rerun per answer,
+# checkpointed on the server), so its page weight is unchanged.
+# ═══════════════════════════════════════════════════════════════
+OFFLINE_GRACE = 600    # seconds past the deadline to wait for a buffered submission
+PAPER_CACHE   = 1024   # encoded papers kept per process
+
+@st.cache_resource
+def offline_component():
+    import streamlit.components.v1 as components
+    return components.declare_component("offline_test", path=str(BASE_DIR / "components" / "offline_test"))
+
+def fnv1a(text):
+    h = 0x811c9dc5
+    for b in text.encode():
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+def paper_token():
+    """Names the paper in play; stable across reloads and checkpoint resumes."""
+    seed, positions, perms = st.session_state.variant
+    blob = b"%s:%d:%s:%s" % (st.session_state.name.encode(), seed, positions.tobytes(), bytes(perms))
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=PAPER_CACHE)
+def encoded_paper(version, seed, positions, perms, sections):
+    """(etag, deflated base64 JSON) for one variant. `positions` and
+    `perms` are bytes so the variant is hashable."""
+    pos = array.array(POSITION_TYPE)
+    pos.frombytes(positions)
+    strings, index = [], {}
+    def intern(s):
+        if s not in index:
+            index[s] = len(strings); strings.append(s)
+        return index[s]
+    rows = [[q["question"], q["options"], intern(q.get("year", "NDA PYQ")),
+             intern(q.get("difficulty", "Hard")), intern(q["subject"] if sections else "")]
+            for q in materialize((seed, pos, perms))]
+    raw  = json.dumps({"s": strings, "q": rows}, ensure_ascii=False, separators=(",", ":")).encode()
+    etag = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    return etag, base64.b64encode(zlib.compress(raw, 9)).decode()
+
+def offline_paper(token):
+    """Component args for the paper in play; the body is left out once the
+    browser has acked its etag."""
+    seed, positions, perms = st.session_state.variant
+    etag, data = encoded_paper(bank.BANK_VERSION, seed, positions.tobytes(), bytes(perms),
+                               st.session_state.current_mode == "paper")
+    codec = "json" if st.session_state.get("paper_plain") else "deflate"
+    if etag in st.session_state.paper_etags:
+        data = None
+    elif codec == "json":    # browsers without DecompressionStream
+        data = zlib.decompress(base64.b64decode(data)).decode()
+    return {"token": token, "etag": etag, "codec": codec, "data": data,
+            "title": f"{len(st.session_state.questions)} questions · offline-tolerant"}
+
+def check_submission(payload, token, questions, deadline, now=None):
+    """(answer codes, None) for a valid submission, else (None, reason).
+    `deadline` is when the test ran out; OFFLINE_GRACE past it, nothing is taken."""
+    if (time.time() if now is None else now) > deadline + OFFLINE_GRACE:
+        return None, "This submission arrived after the test closed."
+    if not isinstance(payload, dict) or payload.get("token") != token:
+        return None, "This submission belongs to a different paper."
+    codes = payload.get("answers")
+    if (not isinstance(codes, str) or len(codes) != len(questions)
+            or any(c != "-" and not (c.isdigit() and int(c) < len(q["options"]))
+                   for c, q in zip(codes, questions))):
+        return None, "The submitted answer sheet is incomplete — please submit again."
+    if payload.get("checksum") != fnv1a(f"{token}:{codes}"):
+        return None, "The answers were damaged in transit — please submit again."
+    return codes, None
@@ -0,0 +1,1049 @@
+"""
+GradeUP pages: sidebar, page renderers and the rerun entry point.
+"""
+
+import streamlit as st
+import collections, datetime, functools, hmac, logging, math, os, time
+
+from . import bank
+from .metrics import METRICS_ENABLED, METRICS_FILE, METRICS_INTERVAL, metrics, profiling, timer
+from .storage import (db_delete_user, db_leaderboard, db_load_rollups, db_load_user,
+                      db_save_result, db_save_user, db_score_histogram, db_user_rank,
+                      db_weakest_questions, percentile, score_bin)
+from .bank import SEARCH_PAGE, SUBJECT_ICONS, SUBJECTS, search_index
+from .scoring import MARKS_CORRECT, MARKS_WRONG, calculate_score
+from .selection import (BLUEPRINTS, attempt_options, blueprint_size, decode_answers, draw_variant,
+                        encode_answers, get_paper, start_test)
+from .analytics import (HLL_M, MASTERY_FMT, ROLLUP_INTERVAL, engagement, fold_mastery,
+                        practice_next)
+from .sessions import (checkpoint_test, checkpoint_writer, clear_shared_state, init_state,
+                       load_archived_results, load_checkpoint, load_db_results,
+                       performance_summary, persist_state, resume_test)
+from .theme import WM_FOOTER, WM_LANDING, stylesheet
+from .offline import OFFLINE_GRACE, check_submission, offline_component, offline_paper, paper_token
+from .service import start
+
+log = logging.getLogger(__name__)
+
+# Seconds between live-timer reruns on the test page; 0 turns the live
+# timer off (the deadline is still enforced on the next interaction)
+TIMER_TICK = float(os.environ.get("GRADEUP_TIMER_TICK", 1))
+
+# Users allowed on the admin and instructor pages (comma-separated names);
+# admins are instructors too. A listed name only gets the role after
+# entering the matching token; with no token configured nobody does.
+ADMINS      = {n.strip() for n in os.environ.get("GRADEUP_ADMINS", "").split(",") if n.strip()}
+INSTRUCTORS = {n.strip() for n in os.environ.get("GRADEUP_INSTRUCTORS", "").split(",") if n.strip()} | ADMINS
+ROLE_TOKENS = [("admin",      ADMINS,      os.environ.get("GRADEUP_ADMIN_TOKEN", "")),
+               ("instructor", INSTRUCTORS, os.environ.get("GRADEUP_INSTRUCTOR_TOKEN", ""))]
+
+# ═══════════════════════════════════════════════════════════════
+# SIDEBAR
+# ═══════════════════════════════════════════════════════════════
+def sidebar():
+    with st.sidebar:
+        # Logo
+        st.markdown("""
+        <div style="text-align:center;padding:1.5rem 0 1rem;">
+            <div style="font-size:2.2rem;font-weight:800;color:white;font-family:'Poppins',sans-serif;
+                        letter-spacing:-1px;">Grade<span style="color:#7ecfff;">UP</span></div>
+            <div style="font-size:0.7rem;color:rgba(255,255,255,0.4);letter-spacing:0.12em;
+                        text-transform:uppercase;margin-top:0.2rem;">Defence Exam Prep</div>
+        </div>""", unsafe_allow_html=True)
+
+        # User card
+        st.markdown(f"""
+        <div style="background:rgba(255,255,255,0.07);border:1px solid rgba(255,255,255,0.10);
+                    border-radius:18px;padding:1rem;text-align:center;margin-bottom:1.2rem;">
+            <div style="font-size:1.8rem;margin-bottom:0.3rem;">👤</div>
+            <div style="font-weight:700;color:white;font-size:0.95rem;">{st.session_state.name}</div>
+            <div style="margin-top:0.5rem;">
+                <span style="background:rgba(126,207,255,0.15);border:1px solid rgba(126,207,255,0.25);
+                             border-radius:999px;padding:0.2rem 0.8rem;font-size:0.75rem;color:#a8d8ff;">
+                    🎯 {st.session_state.course}
+                </span>
+            </div>
+        </div>""", unsafe_allow_html=True)
+
+        # Quick stats
+        tests, avg, _, _ = performance_summary()
+        if tests:
+            st.markdown(f"""
+            <div style="display:grid;grid-template-columns:1fr 1fr;gap:0.6rem;margin-bottom:1.2rem;">
+                <div style="background:rgba(255,255,255,0.06);border-radius:14px;padding:0.7rem;text-align:center;">
+                    <div style="font-size:1.4rem;font-weight:800;color:white;">{tests}</div>
+                    <div style="font-size:0.65rem;color:rgba(255,255,255,0.4);text-transform:uppercase;letter-spacing:0.06em;">Tests</div>
+                </div>
+                <div style="background:rgba(255,255,255,0.06);border-radius:14px;padding:0.7rem;text-align:center;">
+                    <div style="font-size:1.4rem;font-weight:800;color:#7ecfff;">{avg:.0f}%</div>
+                    <div style="font-size:0.65rem;color:rgba(255,255,255,0.4);text-transform:uppercase;letter-spacing:0.06em;">Avg</div>
+                </div>
+            </div>""", unsafe_allow_html=True)
+
+        st.toggle("📶  Offline-tolerant tests", key="offline",
+                  help="Load the whole paper up front and keep answers on this device until you "
+                       "submit — for patchy connections. Applies to the next test you start.")
+
+        st.markdown("<hr>", unsafe_allow_html=True)
+
+        if st.button("🏠  Dashboard",  use_container_width=True):
+            st.session_state.page = "dashboard"; st.rerun()
+        if st.button("🏆  Leaderboard", use_container_width=True):
+            st.session_state.page = "leaderboard"; st.rerun()
+        if st.button("🔎  Search Questions", use_container_width=True):
+            st.session_state.page = "search"; st.rerun()
+        name = st.session_state.name
+        if (name in ADMINS and not is_admin()) or (name in INSTRUCTORS and not is_instructor()):
+            st.text_input("🔑  Staff token", type="password", key="staff_token", on_change=_unlock_role)
+            if st.session_state.get("staff_denied"):
+                st.error("That token is not valid for your account.")
+        if is_instructor() and st.button("🎓  Instructor", use_container_width=True):
+            st.session_state.page = "instructor"; st.rerun()
+        if is_admin() and st.button("📈  Admin", use_container_width=True):
+            st.session_state.page = "admin"; st.rerun()
+
+        st.markdown("<div style='height:0.5rem'></div>", unsafe_allow_html=True)
+
+        if st.button("🚪  Logout", use_container_width=True):
+            db_delete_user(st.session_state.name)
+            clear_shared_state()
+            for k in list(st.session_state.keys()):
+                del st.session_state[k]
+            st.rerun()
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: LANDING
+# ═══════════════════════════════════════════════════════════════
+def page_landing():
+    # Centre the form
+    _, col, _ = st.columns([1, 1.6, 1])
+    with col:
+        st.markdown("""
+        <div style="text-align:center;padding:1.5rem 0 2rem;">
+            <div style="font-family:'Poppins',sans-serif;font-size:4rem;font-weight:800;
+                        color:white;letter-spacing:-2px;line-height:1;">
+                Grade<span style="color:#7ecfff;">UP</span>
+            </div>
+            <div style="color:rgba(255,255,255,0.55);font-size:0.9rem;margin-top:0.6rem;
+                        line-height:1.5;font-weight:400;">
+                Prepare smarter for NDA, CDS &amp; Defence Exams<br>
+                <span style="color:rgba(255,255,255,0.35);font-size:0.8rem;">
+                    50+ PYQ questions · Negative marking · Live timer
+                </span>
+            </div>
+        </div>""", unsafe_allow_html=True)
+
+        # Name input
+        name = st.text_input("Your Name", placeholder="Enter your full name")
+
+        # Check if returning user
+        returning = None
+        if name and len(name.strip()) >= 2:
+            returning = db_load_user(name.strip())
+
+        if returning:
+            st.markdown(f"""
+            <div style="background:rgba(50,200,120,0.12);border:1px solid rgba(50,200,120,0.25);
+                        border-radius:14px;padding:0.75rem 1rem;margin:0.5rem 0;font-size:0.88rem;">
+                ✅ Welcome back, <strong>{name.strip()}</strong>! Course: {returning[0]}
+            </div>""", unsafe_allow_html=True)
+            if st.button(f"▶  Continue as {name.strip()}", use_container_width=True):
+                st.session_state.name   = name.strip()
+                st.session_state.course = returning[0]
+                st.session_state.db_loaded = False
+                st.session_state.page   = "dashboard"
+                st.rerun()
+            st.markdown("<div style='color:rgba(255,255,255,0.3);text-align:center;font-size:0.75rem;margin:0.5rem 0;'>or update your details below</div>", unsafe_allow_html=True)
+
+        course = st.selectbox("Course", ["NDA", "CDS", "AFCAT", "Other"])
+
+        st.markdown("<div style='height:0.3rem'></div>", unsafe_allow_html=True)
+
+        if st.button("Get Started →", use_container_width=True):
+            if not name or len(name.strip()) < 2:
+                st.error("Please enter your name (at least 2 characters).")
+            else:
+                db_save_user(name.strip(), course)
+                st.session_state.name   = name.strip()
+                st.session_state.course = course
+                st.session_state.db_loaded = False
+                st.session_state.page   = "dashboard"
+                st.rerun()
+
+        # Watermark — visible below submit
+        st.markdown(WM_LANDING, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: DASHBOARD
+# ═══════════════════════════════════════════════════════════════
+def page_dashboard():
+    sidebar()
+    load_db_results()
+
+    st.markdown(f"""
+    <div style="margin-bottom:2rem;">
+        <h1 style="margin:0;font-size:2rem;">
+            Welcome, {st.session_state.name} 👋
+        </h1>
+        <p style="color:rgba(255,255,255,0.45);margin:0.3rem 0 0;font-size:0.9rem;">
+            {st.session_state.course} Aspirant · Select a subject to begin
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    # Unfinished test from a dropped session — offer to pick it up
+    cp = load_checkpoint(st.session_state.name)
+    if cp:
+        left  = max(0, cp["duration"] - cp["elapsed"] - (time.time() - cp["updated_at"]))
+        title = cp["chapter"] or "Full Mock"
+        st.markdown(f"""
+        <div style="background:rgba(255,210,80,0.10);border:1px solid rgba(255,210,80,0.25);
+                    border-radius:18px;padding:1rem 1.2rem;margin-bottom:0.8rem;font-size:0.88rem;">
+            ⏸ Unfinished test: <strong>{cp['subject']} · {title}</strong>
+            &nbsp;·&nbsp; {len(cp['answers']) - cp['answers'].count('-')} answered
+            &nbsp;·&nbsp; {int(left // 60)}m {int(left % 60)}s left
+        </div>""", unsafe_allow_html=True)
+        c1, c2 = st.columns(2)
+        with c1:
+            if st.button("▶  Resume Test", key="cp_resume", use_container_width=True):
+                resume_test(cp); st.rerun()
+        with c2:
+            if st.button("✗  Discard", key="cp_discard", use_container_width=True):
+                checkpoint_writer().drop(st.session_state.name); st.rerun()
+
+    # Weakest / most-forgotten chapters first
+    picks = practice_next()
+    if picks:
+        st.markdown("#### Practice Next")
+        cols = st.columns(len(picks))
+        for i, (_, subject, chapter, shown, acc, last) in enumerate(picks):
+            if acc is None:
+                why = "Not practised yet"
+            else:
+                days = (datetime.datetime.now() - datetime.datetime.strptime(last, MASTERY_FMT)).days
+                why  = f"{acc:.0%} accuracy over {shown} questions · " + \
+                       ("practised today" if days < 1 else f"last practised {days}d ago")
+            with cols[i]:
+                st.markdown(f"""
+                <div style="background:rgba(126,207,255,0.07);border:1px solid rgba(126,207,255,0.18);
+                            border-radius:20px;padding:1rem 1.2rem;margin-bottom:0.6rem;">
+                    <div style="font-size:0.7rem;color:rgba(255,255,255,0.4);">{SUBJECT_ICONS.get(subject, "📖")} {subject}</div>
+                    <div style="font-weight:700;color:white;font-size:0.9rem;margin:0.2rem 0;">{chapter}</div>
+                    <div style="font-size:0.72rem;color:rgba(255,255,255,0.35);">{why}</div>
+                </div>""", unsafe_allow_html=True)
+                if st.button("Practice", key=f"pn_{i}", use_container_width=True):
+                    start_test(draw_variant(subject, chapter=chapter, mode="chapter"),
+                               subject, chapter, "chapter", 1800)
+                    st.rerun()
+
+    # Subject grid — 2 columns, clean cards
+    st.markdown("#### Choose a Subject")
+    cols = st.columns(2)
+    for i, subject in enumerate(SUBJECTS):
+        with cols[i % 2]:
+            icon  = SUBJECT_ICONS.get(subject, "📖")
+            total_qs = sum(len(v) for v in bank.QUESTION_BANK[subject].values())
+            st.markdown(f"""
+            <div style="background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.09);
+                        border-radius:20px;padding:1.2rem 1.4rem;margin-bottom:0.6rem;">
+                <div style="font-size:1.6rem;margin-bottom:0.4rem;">{icon}</div>
+                <div style="font-weight:700;color:white;font-size:0.95rem;">{subject}</div>
+                <div style="font-size:0.72rem;color:rgba(255,255,255,0.35);margin-top:0.2rem;">
+                    {total_qs} PYQ questions
+                </div>
+            </div>""", unsafe_allow_html=True)
+            if st.button(f"Start {subject}", key=f"sb_{subject}", use_container_width=True):
+                st.session_state.current_subject = subject
+                st.session_state.page = "mode_select"
+                st.rerun()
+
+    # Full-length papers — mixed subjects with fixed section weights
+    st.markdown("#### Full-Length Papers")
+    cols = st.columns(2)
+    for i, name in enumerate(BLUEPRINTS):
+        bp = BLUEPRINTS[name]
+        with cols[i % 2]:
+            st.markdown(f"""
+            <div style="background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.09);
+                        border-radius:20px;padding:1.2rem 1.4rem;margin-bottom:0.6rem;">
+                <div style="font-size:1.6rem;margin-bottom:0.4rem;">{bp['icon']}</div>
+                <div style="font-weight:700;color:white;font-size:0.95rem;">{name}</div>
+                <div style="font-size:0.72rem;color:rgba(255,255,255,0.35);margin-top:0.2rem;">
+                    {blueprint_size(name)} questions · {bp['duration'] // 60} minutes · {len(bp['sections'])} sections
+                </div>
+            </div>""", unsafe_allow_html=True)
+            if st.button(f"Start {name}", key=f"bp_{name}", use_container_width=True):
+                start_test(get_paper(name, st.session_state.name), name, None, "paper", bp["duration"])
+                st.rerun()
+
+    # Performance section
+    results = st.session_state.results
+    tests, avg, total_w, by_subject = performance_summary()
+    if tests:
+        st.markdown("<hr>", unsafe_allow_html=True)
+        st.markdown("#### Your Performance")
+
+        c1, c2, c3, c4 = st.columns(4)
+        cs  = "background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:18px;padding:1.1rem;text-align:center;"
+        with c1: st.markdown(f'<div style="{cs}"><div class="stat-num">{tests}</div><div class="stat-label">Tests</div></div>', unsafe_allow_html=True)
+        with c2: st.markdown(f'<div style="{cs}"><div class="stat-num" style="color:#7ecfff;">{avg:.0f}%</div><div class="stat-label">Average</div></div>', unsafe_allow_html=True)
+        with c3:
+            best_subj = max(by_subject, key=by_subject.get)
+            st.markdown(f'<div style="{cs}"><div style="font-size:1rem;font-weight:800;color:#7fffb0;padding:0.3rem 0;">{best_subj}</div><div class="stat-label">Best Subject</div></div>', unsafe_allow_html=True)
+        with c4:
+            st.markdown(f'<div style="{cs}"><div class="stat-num" style="color:#ff9090;">{total_w}</div><div class="stat-label">Wrong</div></div>', unsafe_allow_html=True)
+
+        st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
+    if results:
+        import altair as alt, pandas as pd
+        df = pd.DataFrame(results)
+        df["#"] = range(1, len(df)+1)
+        ax = alt.Axis(labelColor="rgba(255,255,255,0.5)", titleColor="rgba(255,255,255,0.5)",
+                      gridColor="rgba(255,255,255,0.05)", domainColor="transparent", tickColor="transparent")
+        chart = alt.Chart(df).mark_line(
+            point={"filled": True, "size": 60, "color": "#7ecfff"},
+            strokeWidth=2, color="#7ecfff"
+        ).encode(
+            x=alt.X("#:Q", title="Test Number", axis=ax),
+            y=alt.Y("percentage:Q", title="Score %", scale=alt.Scale(domain=[0,100]), axis=ax),
+            tooltip=["#", "subject", "mode", "percentage", "correct", "wrong"]
+        ).properties(
+            background="transparent", height=180,
+            title=alt.TitleParams("Score Trend", color="rgba(255,255,255,0.6)", fontSize=12)
+        ).configure_view(strokeWidth=0)
+        st.altair_chart(chart, use_container_width=True)
+
+    archived = sum(t for t, _, _ in st.session_state.archived.values())
+    if archived and st.button(f"🗄  Show {archived} older tests in the trend", use_container_width=True):
+        load_archived_results(); st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: MODE SELECT
+# ═══════════════════════════════════════════════════════════════
+def page_mode_select():
+    sidebar()
+    subject = st.session_state.current_subject
+    icon    = SUBJECT_ICONS.get(subject, "📖")
+    total_q = sum(len(v) for v in bank.QUESTION_BANK[subject].values())
+
+    st.markdown(f"""
+    <div style="margin-bottom:2rem;">
+        <div style="font-size:2.5rem;">{icon}</div>
+        <h2 style="margin:0.3rem 0 0.2rem;">{subject}</h2>
+        <p style="color:rgba(255,255,255,0.4);font-size:0.85rem;margin:0;">
+            {total_q} NDA PYQ questions available
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("""
+        <div style="background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.09);
+                    border-radius:22px;padding:2rem 1.5rem;text-align:center;margin-bottom:0.8rem;min-height:160px;">
+            <div style="font-size:2rem;margin-bottom:0.6rem;">📋</div>
+            <div style="font-weight:700;color:white;font-size:1rem;">Chapter Practice</div>
+            <div style="color:rgba(255,255,255,0.4);font-size:0.78rem;margin-top:0.4rem;line-height:1.5;">
+                50 Questions<br>30 minutes · Focused drill
+            </div>
+        </div>""", unsafe_allow_html=True)
+        if st.button("Start Practice Test", key="ch_btn", use_container_width=True):
+            chapters = list(bank.QUESTION_BANK[subject].keys())
+            if len(chapters) == 1:
+                variant = draw_variant(subject, chapters[0], "chapter")
+                start_test(variant, subject, chapters[0], "chapter", 1800)
+                st.rerun()
+            else:
+                st.session_state.current_mode = "chapter"
+                st.session_state.page = "chapter_select"
+                st.rerun()
+
+    with c2:
+        st.markdown("""
+        <div style="background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.09);
+                    border-radius:22px;padding:2rem 1.5rem;text-align:center;margin-bottom:0.8rem;min-height:160px;">
+            <div style="font-size:2rem;margin-bottom:0.6rem;">🏆</div>
+            <div style="font-weight:700;color:white;font-size:1rem;">Full Mock Test</div>
+            <div style="color:rgba(255,255,255,0.4);font-size:0.78rem;margin-top:0.4rem;line-height:1.5;">
+                All questions · 60 minutes<br>Exam simulation
+            </div>
+        </div>""", unsafe_allow_html=True)
+        if st.button("Start Full Mock", key="full_btn", use_container_width=True):
+            variant = draw_variant(subject, chapter=None, mode="full")
+            start_test(variant, subject, None, "full", 3600)
+            st.rerun()
+
+    st.markdown("<div style='height:0.8rem'></div>", unsafe_allow_html=True)
+    if st.button("← Back", use_container_width=True):
+        st.session_state.page = "dashboard"; st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: CHAPTER SELECT
+# ═══════════════════════════════════════════════════════════════
+def page_chapter_select():
+    sidebar()
+    subject  = st.session_state.current_subject
+    st.markdown(f"<h2>Select Chapter — {subject}</h2>", unsafe_allow_html=True)
+    chapters = list(bank.QUESTION_BANK[subject].keys())
+    chapter  = st.selectbox("Chapter", chapters)
+
+    st.markdown("<div style='height:0.5rem'></div>", unsafe_allow_html=True)
+    _, col, _ = st.columns([1,2,1])
+    with col:
+        if st.button("▶  Begin Test", use_container_width=True):
+            variant = draw_variant(subject, chapter=chapter, mode="chapter")
+            start_test(variant, subject, chapter, "chapter", 1800)
+            st.rerun()
+
+    if st.button("← Back", use_container_width=True):
+        st.session_state.page = "mode_select"; st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: TEST
+# ═══════════════════════════════════════════════════════════════
+def page_test():
+    sidebar()
+    questions = st.session_state.questions
+    elapsed   = time.time() - st.session_state.test_start
+    remaining = max(0, st.session_state.test_duration - elapsed)
+
+    if st.session_state.test_offline:
+        return page_test_offline(questions, remaining)
+
+    if remaining == 0 and not st.session_state.test_done:
+        st.session_state.test_done = True
+        _save_result()
+        st.session_state.page = "results"
+        st.rerun()
+
+    subject = st.session_state.current_subject
+    chapter = st.session_state.current_chapter
+    mode    = st.session_state.current_mode
+    mins    = int(remaining // 60)
+    secs    = int(remaining %  60)
+    t_cls   = "timer-warn" if remaining < 300 else "timer-ok"
+
+    # Header row
+    st.markdown(f"""
+    <div style="display:flex;align-items:flex-start;justify-content:space-between;
+                flex-wrap:wrap;gap:1rem;margin-bottom:1.5rem;">
+        <div>
+            <h2 style="margin:0;font-size:1.4rem;">
+                {subject}{'  ·  ' + chapter if chapter else '  ·  Full Mock'}
+            </h2>
+            <div style="color:rgba(255,255,255,0.4);font-size:0.8rem;margin-top:0.2rem;">
+                {len(questions)} Questions
+                &nbsp;·&nbsp; <span style="color:#ffd97d;">+{MARKS_CORRECT} correct</span>
+                &nbsp;·&nbsp; <span style="color:#ff9090;">{MARKS_WRONG} wrong</span>
+                &nbsp;·&nbsp; 0 unattempted
+            </div>
+        </div>
+        <div><span class="{t_cls}">⏱ {mins:02d}:{secs:02d}</span></div>
+    </div>""", unsafe_allow_html=True)
+
+    # Questions — plain widgets rather than a form, so answers reach the
+    # server as they are picked and can be checkpointed
+    with st.container():
+        for i, q in enumerate(questions):
+            st.markdown(question_html(i, len(questions), q, mode == "paper"), unsafe_allow_html=True)
+            st.radio("", q["options"], index=None,
+                     key=f"r_{i}", label_visibility="collapsed")
+
+        st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
+        submitted = st.button("Submit Test ✓", use_container_width=True)
+
+    # Shared with the session store, so a worker that picks this session up
+    # restores the radios (see hydrate_state)
+    st.session_state.answers = {i: st.session_state.get(f"r_{i}") for i in range(len(questions))}
+    if submitted:
+        _save_result()
+        st.session_state.page = "results"
+        st.rerun()
+
+    checkpoint_test()
+    if TIMER_TICK:
+        time.sleep(TIMER_TICK)
+        st.rerun()
+
+def page_test_offline(questions, remaining):
+    token = paper_token()
+    key   = f"offline_{token}"
+    rejected = None
+    value    = st.session_state.get(key) or {}
+    if value.get("ack"):
+        st.session_state.paper_etags.add(value["ack"])
+    elif value.get("need"):
+        st.session_state.paper_etags.discard(value["need"])
+        st.session_state.paper_plain = value.get("plain", False)
+    elif value and not st.session_state.test_done:
+        codes, rejected = check_submission(value, token, questions,
+                                           st.session_state.test_start + st.session_state.test_duration)
+        if codes is not None:
+            st.session_state.answers   = decode_answers(questions, codes)
+            st.session_state.test_done = True
+            _save_result()
+            st.session_state.page = "results"
+            st.rerun()
+    # Nothing arrived well past the deadline: score what the server has
+    overdue = time.time() - st.session_state.test_start - st.session_state.test_duration
+    if overdue > OFFLINE_GRACE and not st.session_state.test_done:
+        st.session_state.test_done = True
+        _save_result()
+        st.session_state.page = "results"
+        st.rerun()
+
+    subject = st.session_state.current_subject
+    chapter = st.session_state.current_chapter
+    st.markdown(f"""
+    <div style="margin-bottom:1rem;">
+        <h2 style="margin:0;font-size:1.4rem;">{subject}{'  ·  ' + chapter if chapter else '  ·  Full Mock'}</h2>
+        <div style="color:rgba(255,255,255,0.4);font-size:0.8rem;margin-top:0.2rem;">
+            {len(questions)} Questions
+            &nbsp;·&nbsp; <span style="color:#ffd97d;">+{MARKS_CORRECT} correct</span>
+            &nbsp;·&nbsp; <span style="color:#ff9090;">{MARKS_WRONG} wrong</span>
+            &nbsp;·&nbsp; 📶 answers are kept on this device until you submit
+        </div>
+    </div>""", unsafe_allow_html=True)
+    # No server checkpoint: the answers are only in the browser (localStorage,
+    # keyed by the paper token) until submission, so one would record blanks
+    offline_component()(paper=offline_paper(token), remaining=remaining, rejected=rejected,
+                        key=key, default=None)
+
+def _save_result():
+    questions = st.session_state.questions
+    answers   = {i: st.session_state.get(f"r_{i}", st.session_state.answers.get(i))
+                 for i in range(len(questions))}
+    sd       = calculate_score(questions, answers)
+    taken_at = datetime.datetime.now().strftime("%d %b %Y %H:%M")
+    elapsed  = min(time.time() - st.session_state.test_start, st.session_state.test_duration)
+    result   = {
+        "name":        st.session_state.name,
+        "date":        taken_at,
+        "taken_at":    taken_at,
+        "subject":     st.session_state.current_subject,
+        "chapter":     st.session_state.current_chapter or "Full Mock",
+        "mode":        st.session_state.current_mode,
+        "answers":     answers,
+        "questions":   [q["id"] for q in questions],
+        "seed":        st.session_state.seed,
+        "bank_version": bank.BANK_VERSION,
+        "course":      st.session_state.course,
+        "answer_codes": encode_answers(questions, answers),
+        "time_taken":  int(elapsed),
+        **sd
+    }
+    st.session_state.results.append(result)
+    st.session_state.last_result = result
+    # Keyed by (subject, chapter) in the session; the rollup worker persists it
+    acc = fold_mastery({}, None, attempt_options({"questions": ",".join(result["questions"]),
+                                                  "answers": result["answer_codes"],
+                                                  "seed": result["seed"]}),
+                       datetime.datetime.now().strftime(MASTERY_FMT))
+    for (_, subject, chapter), (shown, answered, correct, last) in acc.items():
+        m = st.session_state.mastery.setdefault((subject, chapter), [0, 0, 0, ""])
+        m[0] += shown; m[1] += answered; m[2] += correct; m[3] = max(m[3], last)
+    try:
+        db_save_result(result)
+    except Exception:
+        # Keep the checkpoint: resuming it past the deadline submits again
+        log.exception("saving %s's result failed", st.session_state.name)
+        return
+    try:
+        checkpoint_writer().drop(st.session_state.name)
+    except Exception:
+        log.exception("dropping %s's checkpoint failed", st.session_state.name)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: RESULTS
+# ═══════════════════════════════════════════════════════════════
+# Cards are cached per question and answer state; only the "Q{n}" counter
+# is spliced in per render, so a long paper is a join of cached strings.
+HTML_CACHE = 8192
+
+@functools.lru_cache(maxsize=HTML_CACHE)
+def _review_card(version, qid, chosen, explain):
+    q         = bank.BANK_LIST[bank.BANK_POS[qid]]
+    correct_t = q["options"][q["correct"]]
+    is_ok     = chosen == correct_t
+    skipped   = chosen is None
+    bg   = "rgba(50,200,120,0.08)" if is_ok else ("rgba(255,255,255,0.03)" if skipped else "rgba(255,60,60,0.08)")
+    bdr  = "rgba(50,200,120,0.20)" if is_ok else ("rgba(255,255,255,0.07)" if skipped else "rgba(255,60,60,0.20)")
+    ico  = "✓" if is_ok else ("—" if skipped else "✗")
+    ic   = "#7fffb0" if is_ok else ("rgba(255,255,255,0.3)" if skipped else "#ff9090")
+    exp  = q.get("explanation", "") if explain else ""
+
+    wrong_line = "" if (is_ok or skipped) else \
+        f'<div style="font-size:0.8rem;color:#7fffb0;margin-top:0.3rem;">✓ Correct: {correct_t}</div>'
+    exp_line   = f'<div style="font-size:0.75rem;color:rgba(255,210,80,0.7);margin-top:0.25rem;">💡 {exp}</div>' if exp else ""
+
+    head = f"""
+    <div style="background:{bg};border:1px solid {bdr};border-radius:16px;
+                padding:1rem 1.2rem;margin-bottom:0.6rem;">
+        <div style="display:flex;align-items:flex-start;gap:0.7rem;">
+            <div style="font-size:0.95rem;font-weight:700;color:{ic};min-width:1.2rem;">{ico}</div>
+            <div style="flex:1;">
+                <div style="font-size:0.7rem;color:rgba(255,255,255,0.3);margin-bottom:0.2rem;">
+                    Q"""
+    tail = f""" &nbsp;·&nbsp; <span style="color:rgba(126,207,255,0.55);">{q.get('year','NDA PYQ')}</span>
+                </div>
+                <div style="font-weight:600;color:white;font-size:0.88rem;line-height:1.4;margin-bottom:0.3rem;">
+                    {q['question']}
+                </div>
+                <div style="font-size:0.82rem;color:rgba(255,255,255,0.5);">
+                    Your answer: <strong style="color:rgba(255,255,255,0.8);">
+                    {chosen if chosen else 'Not answered'}</strong>
+                </div>
+                {wrong_line}{exp_line}
+            </div>
+        </div>
+    </div>"""
+    return head, tail
+
+def review_html(i, q, chosen, explain=True):
+    # One answer-review card on the results page
+    head, tail = _review_card(bank.BANK_VERSION, q["id"], chosen, explain)
+    return f"{head}{i + 1}{tail}"
+
+@functools.lru_cache(maxsize=HTML_CACHE)
+def _question_card(version, qid, section):
+    # Everything of a test-page card after its "Q{n}/{total}" counter
+    q    = bank.BANK_LIST[bank.BANK_POS[qid]]
+    diff = q.get("difficulty", "Hard")
+    dc   = "diff-hard" if diff == "Hard" else "diff-medium"
+    sect = f"{q['subject']} &nbsp;·&nbsp; " if section else ""
+    return f"""
+        &nbsp;·&nbsp; {sect}
+        <span style="color:rgba(126,207,255,0.7);font-weight:700;">{q.get("year", "NDA PYQ")}</span>
+        <span class="{dc}">{diff}</span>
+    </div>
+    <div class="q-text">{q['question']}</div>
+</div>"""
+
+def question_html(i, total, q, section):
+    return f'<div class="q-wrap"><div class="q-meta">Q{i + 1}/{total}{_question_card(bank.BANK_VERSION, q["id"], section)}'
+
+PERCENTILE_MIN = 10     # attempts at a test before a percentile means much
+
+def page_results():
+    sidebar()
+    r = st.session_state.last_result
+    if not r:
+        st.session_state.page = "dashboard"; st.rerun()
+
+    pct   = r["percentage"]
+    mt    = r["time_taken"] // 60
+    ms    = r["time_taken"] %  60
+    emoji = "🏆" if pct >= 75 else "👍" if pct >= 50 else "📖"
+    clr   = "#7fffb0" if pct >= 75 else "#ffd97d" if pct >= 50 else "#ff9090"
+    verd  = "Excellent!" if pct >= 75 else "Good effort!" if pct >= 50 else "Keep going!"
+
+    # Score card
+    st.markdown(f"""
+    <div class="result-card">
+        <div style="font-size:3rem;margin-bottom:0.5rem;">{emoji}</div>
+        <div style="font-size:0.8rem;color:rgba(255,255,255,0.4);margin-bottom:0.8rem;">
+            {r['subject']} · {r['chapter']} · {r['date']}
+        </div>
+        <div style="font-size:3.2rem;font-weight:800;color:{clr};line-height:1;">
+            {r['raw_score']}<span style="font-size:1.5rem;font-weight:400;color:rgba(255,255,255,0.4);">/{r['total_marks']}</span>
+        </div>
+        <div style="font-size:1.5rem;font-weight:700;color:white;margin:0.3rem 0;">{pct}%</div>
+        <div style="font-size:0.95rem;color:{clr};font-weight:600;">{verd}</div>
+        <div style="display:flex;gap:0.6rem;justify-content:center;flex-wrap:wrap;margin-top:1.2rem;">
+            <span class="pill" style="color:#7fffb0;">✓ {r['correct']} correct</span>
+            <span class="pill" style="color:#ff9090;">✗ {r['wrong']} wrong</span>
+            <span class="pill">— {r['unattempted']} skipped</span>
+            <span class="pill">⏱ {mt}m {ms}s</span>
+        </div>
+        <div style="margin-top:0.8rem;font-size:0.75rem;color:rgba(255,255,255,0.3);">
+            💾 Result saved to leaderboard
+        </div>
+    </div>""", unsafe_allow_html=True)
+
+    # Standing among every attempt at this test, straight from the histogram
+    hist  = db_score_histogram(r["subject"], r["chapter"], r["mode"])
+    total = sum(hist.values())
+    if total >= PERCENTILE_MIN:
+        st.markdown(f"""
+        <div style="text-align:center;margin:0.8rem 0 0.2rem;font-size:0.9rem;color:rgba(255,255,255,0.6);">
+            📊 Better than <strong style="color:#7ecfff;">{percentile(hist, pct):.0f}%</strong>
+            of {total:,} attempts at this test
+        </div>""", unsafe_allow_html=True)
+        import altair as alt, pandas as pd
+        buckets = [0] * 20
+        for b, n in hist.items():
+            buckets[min(19, b // 50)] += n
+        df = pd.DataFrame({"score": [f"{5 * i}–{5 * i + 5}" for i in range(20)], "attempts": buckets,
+                           "you": [i == min(19, score_bin(pct) // 50) for i in range(20)]})
+        ax = alt.Axis(labelColor="rgba(255,255,255,0.5)", titleColor="rgba(255,255,255,0.5)",
+                      gridColor="rgba(255,255,255,0.05)", domainColor="transparent", tickColor="transparent")
+        chart = alt.Chart(df).mark_bar(cornerRadiusTopLeft=3, cornerRadiusTopRight=3).encode(
+            x=alt.X("score:N", sort=None, title="Score %", axis=ax),
+            y=alt.Y("attempts:Q", title="Attempts", axis=ax),
+            color=alt.condition("datum.you", alt.value("#7ecfff"), alt.value("rgba(255,255,255,0.18)")),
+            tooltip=["score", "attempts"]
+        ).properties(background="transparent", height=160).configure_view(strokeWidth=0)
+        st.altair_chart(chart, use_container_width=True)
+
+    # Answer review
+    st.markdown("#### Answer Review")
+    questions = st.session_state.questions
+    user_ans  = r["answers"]
+
+    # Explanations are most of the review's bytes; send them only on request
+    explain = st.toggle("💡  Show explanations", key="explain")
+    st.markdown("".join(review_html(i, q, user_ans.get(i), explain) for i, q in enumerate(questions)),
+                unsafe_allow_html=True)
+
+    st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        if st.button("🏠 Dashboard", use_container_width=True):
+            st.session_state.page = "dashboard"; st.rerun()
+    with c2:
+        if st.button("🔄 Retry", use_container_width=True):
+            st.session_state.page = "dashboard" if r["mode"] == "paper" else "mode_select"
+            st.rerun()
+    with c3:
+        if st.button("🏆 Leaderboard", use_container_width=True):
+            st.session_state.page = "leaderboard"; st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: LEADERBOARD
+# ═══════════════════════════════════════════════════════════════
+def page_leaderboard():
+    sidebar()
+    st.markdown("""
+    <div style="margin-bottom:1.8rem;">
+        <h1 style="margin:0;font-size:1.9rem;">🏆 Leaderboard</h1>
+        <p style="color:rgba(255,255,255,0.4);font-size:0.85rem;margin:0.3rem 0 0;">
+            Top scores across all users · Ranked by % then fastest time
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    rows = db_leaderboard(25)
+    if not rows:
+        st.info("No scores yet — be the first to top the board! 🎯")
+    else:
+        medals = ["🥇","🥈","🥉"]
+        for i, row in enumerate(rows):
+            rank  = medals[i] if i < 3 else f"#{i+1}"
+            pct   = row["percentage"]
+            clr   = "#7fffb0" if pct >= 75 else "#ffd97d" if pct >= 50 else "#ff9090"
+            mt    = row["time_taken"] // 60
+            ms    = row["time_taken"] %  60
+            taken = row["taken_at"][:16] if row["taken_at"] else ""
+            is_me = row["name"] == st.session_state.name
+
+            bg  = "rgba(126,207,255,0.08)" if is_me else "rgba(255,255,255,0.04)"
+            bdr = "rgba(126,207,255,0.25)" if is_me else "rgba(255,255,255,0.08)"
+
+            st.markdown(f"""
+            <div style="background:{bg};border:1px solid {bdr};border-radius:16px;
+                        padding:0.9rem 1.2rem;margin-bottom:0.45rem;
+                        display:flex;align-items:center;gap:1rem;flex-wrap:wrap;">
+                <div style="font-size:1.3rem;min-width:2rem;text-align:center;">{rank}</div>
+                <div style="flex:1;min-width:120px;">
+                    <div style="font-weight:700;color:white;font-size:0.9rem;">
+                        {row['name']}{'  <span style="font-size:0.65rem;color:#7ecfff;background:rgba(126,207,255,0.15);border-radius:999px;padding:0.1rem 0.5rem;">you</span>' if is_me else ''}
+                    </div>
+                    <div style="font-size:0.72rem;color:rgba(255,255,255,0.35);margin-top:0.1rem;">
+                        {row['subject']} · {row['chapter']}
+                    </div>
+                </div>
+                <div style="text-align:right;">
+                    <div style="font-size:1.2rem;font-weight:800;color:{clr};">{pct}%</div>
+                    <div style="font-size:0.7rem;color:rgba(255,255,255,0.35);">
+                        {row['raw_score']}/{row['total_marks']} · ⏱{mt}m{ms}s
+                    </div>
+                </div>
+            </div>""", unsafe_allow_html=True)
+
+        me  = st.session_state.name
+        pos = me and all(r["name"] != me for r in rows) and db_user_rank(me)
+        if pos:
+            st.markdown(f"""
+            <p style="text-align:center;color:rgba(255,255,255,0.45);font-size:0.8rem;margin-top:0.8rem;">
+                Your best attempt is ranked <b style="color:#7ecfff;">#{pos}</b>
+            </p>""", unsafe_allow_html=True)
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: SEARCH
+# ═══════════════════════════════════════════════════════════════
+def page_search():
+    sidebar()
+    st.markdown("""
+    <div style="margin-bottom:1.8rem;">
+        <h1 style="margin:0;font-size:1.9rem;">🔎 Search Questions</h1>
+        <p style="color:rgba(255,255,255,0.4);font-size:0.85rem;margin:0.3rem 0 0;">
+            Keywords, years (e.g. 2019) or topics · best matches first
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    c1, c2 = st.columns([3, 1])
+    text    = c1.text_input("Search", placeholder="photoelectric effect 2021", label_visibility="collapsed")
+    subject = c2.selectbox("Subject", ["All subjects"] + SUBJECTS, label_visibility="collapsed")
+    subject = None if subject == "All subjects" else subject
+    if st.session_state.get("search_key") != (text, subject):
+        st.session_state.search_key  = (text, subject)
+        st.session_state.search_page = 0
+
+    if not text.strip() and not subject:
+        st.markdown(WM_FOOTER, unsafe_allow_html=True)
+        return
+    page = st.session_state.search_page
+    t0   = time.perf_counter()
+    total, hits = search_index().search(text, subject, page * SEARCH_PAGE)
+    st.caption(f"{total} matching question{'s' * (total != 1)} · {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    for pos, highlighted in hits:
+        q = bank.BANK_LIST[pos]
+        st.markdown(f"""
+        <div style="background:rgba(255,255,255,0.04);border:1px solid rgba(255,255,255,0.08);
+                    border-radius:16px;padding:1rem 1.2rem;margin-bottom:0.3rem;">
+            <div style="font-size:0.7rem;color:rgba(255,255,255,0.35);margin-bottom:0.3rem;">
+                {q['subject']} · {q['chapter']} · <span style="color:rgba(126,207,255,0.55);">{q.get('year', 'NDA PYQ')}</span>
+            </div>
+            <div style="font-weight:600;color:white;font-size:0.9rem;line-height:1.45;">{highlighted}</div>
+        </div>""", unsafe_allow_html=True)
+        with st.expander("Options & answer"):
+            for k, opt in enumerate(q["options"]):
+                st.markdown(f"{'✅' if k == q['correct'] else '▫️'} {opt}")
+            if q.get("explanation"):
+                st.caption(f"💡 {q['explanation']}")
+
+    pages = (total + SEARCH_PAGE - 1) // SEARCH_PAGE
+    if pages > 1:
+        c1, c2, c3 = st.columns([1, 2, 1])
+        if c1.button("← Previous", disabled=page == 0, use_container_width=True):
+            st.session_state.search_page -= 1; st.rerun()
+        c2.markdown(f"<p style='text-align:center;color:rgba(255,255,255,0.45);margin-top:0.5rem;'>"
+                    f"Page {page + 1} of {pages}</p>", unsafe_allow_html=True)
+        if c3.button("Next →", disabled=page + 1 >= pages, use_container_width=True):
+            st.session_state.search_page += 1; st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: INSTRUCTOR
+# ═══════════════════════════════════════════════════════════════
+PERIODS = {"Last 24 hours": ("hour", 1), "Last 7 days": ("day", 7),
+           "Last 30 days": ("day", 30), "All time": ("day", None)}
+
+def grant_role(name, token):
+    """The highest role `token` unlocks for `name`, or None."""
+    for role, names, secret in ROLE_TOKENS:
+        if name in names and secret and hmac.compare_digest(token.encode(), secret.encode()):
+            return role
+    return None
+
+def _unlock_role():
+    token = st.session_state.staff_token
+    st.session_state.staff_token = ""
+    role  = grant_role(st.session_state.name, token)
+    st.session_state.role         = role
+    st.session_state.staff_denied = role is None
+
+def is_instructor():
+    return (st.session_state.get("role") in ("admin", "instructor")
+            and st.session_state.get("name") in INSTRUCTORS)
+
+def page_instructor():
+    sidebar()
+    if not is_instructor():
+        st.session_state.page = "dashboard"; st.rerun()
+
+    st.markdown("""
+    <div style="margin-bottom:1.8rem;">
+        <h1 style="margin:0;font-size:1.9rem;">🎓 Cohort Analytics</h1>
+        <p style="color:rgba(255,255,255,0.4);font-size:0.85rem;margin:0.3rem 0 0;">
+            All candidates · refreshed every minute from new results
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    c1, c2 = st.columns(2)
+    period = c1.selectbox("Period", list(PERIODS), index=2)
+    grain, days = PERIODS[period]
+    now   = datetime.datetime.now()
+    since = "" if days is None else (now - datetime.timedelta(days=days)).strftime(
+        "%Y-%m-%d %H:00" if grain == "hour" else "%Y-%m-%d")
+    rows  = db_load_rollups(grain, since)
+    course = c2.selectbox("Course", ["All"] + sorted({r["course"] for r in rows}))
+    if course != "All":
+        rows = [r for r in rows if r["course"] == course]
+    if not rows:
+        st.info("No attempts in this period yet.")
+        st.markdown(WM_FOOTER, unsafe_allow_html=True)
+        return
+
+    import altair as alt, pandas as pd
+    df = pd.DataFrame(rows)
+    attempts = int(df["attempts"].sum())
+    answered = int(df["correct"].sum() + df["wrong"].sum())
+    cs = "background:rgba(255,255,255,0.05);border:1px solid rgba(255,255,255,0.08);border-radius:18px;padding:1.1rem;text-align:center;"
+    k1, k2, k3 = st.columns(3)
+    with k1: st.markdown(f'<div style="{cs}"><div class="stat-num">{attempts:,}</div><div class="stat-label">Attempts</div></div>', unsafe_allow_html=True)
+    with k2: st.markdown(f'<div style="{cs}"><div class="stat-num" style="color:#7ecfff;">{df["pct_sum"].sum() / attempts:.0f}%</div><div class="stat-label">Average</div></div>', unsafe_allow_html=True)
+    with k3: st.markdown(f'<div style="{cs}"><div class="stat-num" style="color:#7fffb0;">{df["correct"].sum() / max(1, answered):.0%}</div><div class="stat-label">Accuracy</div></div>', unsafe_allow_html=True)
+
+    st.markdown("<div style='height:1rem'></div>", unsafe_allow_html=True)
+    ax = alt.Axis(labelColor="rgba(255,255,255,0.5)", titleColor="rgba(255,255,255,0.5)",
+                  gridColor="rgba(255,255,255,0.05)", domainColor="transparent", tickColor="transparent")
+    dist = df.groupby(["course", "decile"], as_index=False)["attempts"].sum()
+    dist["score"] = dist["decile"].map(lambda d: f"{d * 10}–{d * 10 + 9}%" if d < 9 else "90–100%")
+    chart = alt.Chart(dist).mark_bar().encode(
+        x=alt.X("score:N", title="Score band", axis=ax, sort=None),
+        y=alt.Y("attempts:Q", title="Attempts", axis=ax),
+        color=alt.Color("course:N", legend=alt.Legend(labelColor="rgba(255,255,255,0.6)", title=None)),
+        tooltip=["course", "score", "attempts"]
+    ).properties(
+        background="transparent", height=220,
+        title=alt.TitleParams("Score Distribution by Course", color="rgba(255,255,255,0.6)", fontSize=12)
+    ).configure_view(strokeWidth=0)
+    st.altair_chart(chart, use_container_width=True)
+
+    st.markdown("#### Chapter Accuracy")
+    ch = df[df["mode"] == "chapter"].groupby(["subject", "chapter"], as_index=False)[
+        ["attempts", "pct_sum", "correct", "wrong"]].sum()
+    ch["average %"] = (ch["pct_sum"] / ch["attempts"]).round(1)
+    ch["accuracy %"] = (100 * ch["correct"] / (ch["correct"] + ch["wrong"]).clip(lower=1)).round(1)
+    st.dataframe(ch.sort_values("accuracy %")[["subject", "chapter", "attempts", "average %", "accuracy %"]],
+                 use_container_width=True, hide_index=True)
+
+    st.markdown("#### Weakest Questions")
+    st.caption("All time, across every course · questions answered at least 20 times")
+    weak = []
+    for qid, shown, answered_q, correct in db_weakest_questions():
+        if qid not in bank.BANK_POS: continue
+        q = bank.BANK_LIST[bank.BANK_POS[qid]]
+        weak.append({"question": q["question"][:90], "subject": q["subject"], "chapter": q["chapter"],
+                     "year": q.get("year", ""), "answered": answered_q,
+                     "skipped %": round(100 * (shown - answered_q) / shown, 1),
+                     "accuracy %": round(100 * correct / answered_q, 1)})
+    if weak:
+        st.dataframe(weak, use_container_width=True, hide_index=True)
+    else:
+        st.info("Not enough answers yet.")
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# PAGE: ADMIN
+# ═══════════════════════════════════════════════════════════════
+def is_admin():
+    return st.session_state.get("role") == "admin" and st.session_state.get("name") in ADMINS
+
+ENGAGEMENT_DAYS = 30
+
+def page_admin():
+    sidebar()
+    if not is_admin():
+        st.session_state.page = "dashboard"; st.rerun()
+
+    st.markdown("""
+    <div style="margin-bottom:1.8rem;">
+        <h1 style="margin:0;font-size:1.9rem;">📈 Admin</h1>
+        <p style="color:rgba(255,255,255,0.4);font-size:0.85rem;margin:0.3rem 0 0;">
+            Engagement, plus rerun, page and database timings for this process
+        </p>
+    </div>""", unsafe_allow_html=True)
+
+    st.markdown("#### Engagement")
+    daily, totals = engagement(ENGAGEMENT_DAYS)
+    _, week = engagement(7)
+    today   = datetime.date.today().isoformat()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Active today", dict(daily).get(today, 0))
+    c2.metric("Active 7 days", week.get(("all", "all"), (0, 0))[1])
+    c3.metric(f"Active {ENGAGEMENT_DAYS} days", totals.get(("all", "all"), (0, 0))[1])
+    c4.metric(f"Tests {ENGAGEMENT_DAYS} days", totals.get(("all", "all"), (0, 0))[0])
+    if daily:
+        import pandas as pd
+        st.line_chart(pd.DataFrame(daily, columns=["day", "active"]).set_index("day"), height=160)
+    c1, c2 = st.columns(2)
+    for col, dim, label in ((c1, "subject", "Subject / paper"), (c2, "course", "Course")):
+        col.dataframe([{label: key, "tests": n, "candidates": u}
+                       for (d, key), (n, u) in sorted(totals.items(), key=lambda kv: -kv[1][0]) if d == dim],
+                      use_container_width=True, hide_index=True)
+    st.caption(f"Distinct candidates are HyperLogLog estimates (±{1.04 / math.sqrt(HLL_M):.1%}); "
+               f"counters lag saves by up to {ROLLUP_INTERVAL}s")
+
+    st.markdown("#### Timings")
+    if not METRICS_ENABLED:
+        st.info("Timing is off — start the app with GRADEUP_METRICS=1 to collect it.")
+    else:
+        m = metrics()
+        with m.lock:
+            rows = [{"metric": family, "name": label, "count": h.count,
+                     "mean ms": round(h.sum / h.count * 1e3, 2) if h.count else 0,
+                     "p50 ms": round(h.quantile(0.50) * 1e3, 2),
+                     "p95 ms": round(h.quantile(0.95) * 1e3, 2),
+                     "p99 ms": round(h.quantile(0.99) * 1e3, 2)}
+                    for family, hists in sorted(m.families.items())
+                    for label, h in sorted(hists.items())]
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.download_button("⬇  Prometheus metrics", m.prometheus(), "gradeup.prom",
+                           use_container_width=True)
+        st.caption(f"Also written every {METRICS_INTERVAL}s to {METRICS_FILE}")
+
+    st.markdown("#### Session profiler")
+    st.toggle("Sample every rerun of my session", key="profile")
+    stacks = st.session_state.get("profile_stacks")
+    if stacks:
+        leaf = collections.Counter()
+        for stack, n in stacks.items():
+            leaf[stack.rsplit(";", 1)[-1]] += n
+        total = sum(stacks.values())
+        st.dataframe([{"function": fn, "samples": n, "share": f"{n / total:.1%}"}
+                      for fn, n in leaf.most_common(25)], use_container_width=True, hide_index=True)
+        st.download_button("⬇  Collapsed stacks (flamegraph)",
+                           "\n".join(f"{k} {v}" for k, v in stacks.items()),
+                           "gradeup.folded", use_container_width=True)
+        if st.button("Clear samples", use_container_width=True):
+            del st.session_state["profile_stacks"]; st.rerun()
+
+    st.markdown(WM_FOOTER, unsafe_allow_html=True)
+
+# ═══════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════
+def main():
+    with timer("rerun", "all"):
+        run_page()
+
+def run_page():
+    st.set_page_config(
+        page_title="GradeUP — NDA/CDS Prep",
+        page_icon="🎖️",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(stylesheet(), unsafe_allow_html=True)
+    start()
+    init_state()
+
+    page = st.session_state.page
+    try:
+        with timer("page", page), profiling():
+            if   page == "landing":        page_landing()
+            elif page == "dashboard":      page_dashboard()
+            elif page == "mode_select":    page_mode_select()
+            elif page == "chapter_select": page_chapter_select()
+            elif page == "test":           page_test()
+            elif page == "results":        page_results()
+            elif page == "leaderboard":    page_leaderboard()
+            elif page == "search":         page_search()
+            elif page == "instructor":     page_instructor()
+            elif page == "admin":          page_admin()
+            else:
+                st.session_state.page = "landing"; st.rerun()
+    finally:
+        persist_state()   # st.rerun() raises, so this also runs on reruns
@@ -0,0 +1,25 @@
+"""
+GradeUP marking scheme.
+"""
+
+# ═══════════════════════════════════════════════════════════════
+# SCORING
+# ═══════════════════════════════════════════════════════════════
+MARKS_CORRECT = 4
+MARKS_WRONG   = -1.33   # NDA: -1/3 of 4
+
+def calculate_score(questions, answers):
+    correct = wrong = unattempted = 0
+    for i, q in enumerate(questions):
+        chosen = answers.get(i)
+        if chosen is None:
+            unattempted += 1
+        elif chosen == q["options"][q["correct"]]:
+            correct += 1
+        else:
+            wrong += 1
+    raw         = correct * MARKS_CORRECT + wrong * MARKS_WRONG
+    total_marks = len(questions) * MARKS_CORRECT
+    pct         = round(max(0, raw) / total_marks * 100, 1) if total_marks else 0
+    return {"correct": correct, "wrong": wrong, "unattempted": unattempted,
+            "raw_score": round(raw, 2), "total_marks": total_marks, "percentage": pct}
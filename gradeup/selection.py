@@ -0,0 +1,303 @@
+"""
+GradeUP question selection: seeded papers, full-length blueprints and the paper pool.
+"""
+
+import streamlit as st
+import array, bisect, collections, itertools, queue, random, secrets, threading, time
+
+from . import bank
+from .storage import db_load_attempt, db_recent_question_ids
+from .bank import SUBJECTS
+from .scoring import calculate_score
+
+# ═══════════════════════════════════════════════════════════════
+# QUESTION SELECTION
+# ═══════════════════════════════════════════════════════════════
+def select_questions(subject, chapter=None, mode="chapter", rng=random):
+    if chapter and chapter in bank.QUESTION_BANK.get(subject, {}):
+        pools = [bank.QUESTION_BANK[subject][chapter]]
+    else:
+        pools = list(bank.QUESTION_BANK.get(subject, {}).values())
+    ends = list(itertools.accumulate(len(p) for p in pools))
+    n    = ends[-1] if ends else 0
+
+    # Target: 50 for chapter, all for full mock. Positions are sampled (the
+    # same draw as sampling the pool) so a mapped bank decodes only the k chosen
+    k = min(50, n) if mode == "chapter" else n
+    out = []
+    for i in rng.sample(range(n), k):
+        c = bisect.bisect_right(ends, i)
+        out.append(pools[c][i - (ends[c - 1] if c else 0)])
+    return out
+
+def get_questions(subject, chapter=None, mode="chapter", seed=None):
+    """Questions for one test with shuffled options; reproducible given `seed`."""
+    seed    = secrets.randbits(32) if seed is None else seed
+    chapter = chapter if mode == "chapter" else None
+    return materialize(build_variant((mode, subject, chapter), seed))
+
+def _permuted(q, order):
+    # Options re-ordered by `order`, correct pointer kept
+    return {**q, "options": [q["options"][j] for j in order],
+            "correct": order.index(q["correct"])}
+
+# ═══════════════════════════════════════════════════════════════
+# FULL-LENGTH PAPERS — blueprint-driven, multi-subject
+# Each section is (subject, optional chapter, question count). Difficulty
+# mix defaults to the bank's own proportions within the section.
+# ═══════════════════════════════════════════════════════════════
+BLUEPRINTS = {
+    "NDA GAT": {
+        "icon": "🎖️", "duration": 9000, "recent_papers": 5,
+        "difficulty": {"Hard": 0.7, "Medium": 0.3},
+        "sections": [
+            {"subject": "English",         "count": 50},
+            {"subject": "General Science", "chapter": "Physics",   "count": 25},
+            {"subject": "General Science", "chapter": "Chemistry", "count": 15},
+            {"subject": "General Science", "chapter": "Biology",   "count": 10},
+            {"subject": "History",         "count": 20},
+            {"subject": "Geography",       "count": 20},
+            {"subject": "Economics",       "count": 10},
+        ],
+    },
+    "NDA GAT Mini": {
+        "icon": "⚡", "duration": 1800, "recent_papers": 3,
+        "sections": [
+            {"subject": "English",         "count": 10},
+            {"subject": "General Science", "count": 10},
+            {"subject": "History",         "count": 4},
+            {"subject": "Geography",       "count": 4},
+            {"subject": "Economics",       "count": 2},
+        ],
+    },
+}
+
+def blueprint_size(name):
+    return sum(sec["count"] for sec in BLUEPRINTS[name]["sections"])
+
+@st.cache_resource
+def blueprint_index(name):
+    """Per-section candidate ids bucketed difficulty → year → [qid].
+
+    Built once per blueprint and shared by every session in the process.
+    """
+    index = []
+    for sec in BLUEPRINTS[name]["sections"]:
+        chapters = bank.QUESTION_BANK[sec["subject"]]
+        if sec.get("chapter"):
+            chapters = {sec["chapter"]: chapters[sec["chapter"]]}
+        buckets = {}
+        for qs in chapters.values():
+            for q in qs:
+                buckets.setdefault(q["difficulty"], {}).setdefault(q["year"], []).append(q["id"])
+        index.append(buckets)
+    return index
+
+def _apportion(n, weights):
+    # Largest-remainder split of n across weighted keys
+    total = sum(weights.values()) or 1
+    raw   = {k: n * w / total for k, w in weights.items()}
+    out   = {k: int(v) for k, v in raw.items()}
+    for k in sorted(raw, key=lambda k: raw[k] - out[k], reverse=True)[:n - sum(out.values())]:
+        out[k] += 1
+    return out
+
+def _pick_year_balanced(by_year, n, exclude, rng, year_used):
+    # Round-robin over years, least-used-so-far in this paper first,
+    # so no single year dominates
+    lanes = []
+    for year, ids in by_year.items():
+        fresh = [qid for qid in ids if qid not in exclude]
+        rng.shuffle(fresh)
+        if fresh: lanes.append((year, fresh))
+    rng.shuffle(lanes)
+    lanes.sort(key=lambda lane: year_used[lane[0]])
+    picked = []
+    while lanes and len(picked) < n:
+        for lane in list(lanes):
+            picked.append(lane[1].pop())
+            year_used[lane[0]] += 1
+            if not lane[1]: lanes.remove(lane)
+            if len(picked) == n: break
+    return picked
+
+def generate_paper(name, exclude=(), rng=random):
+    """Question ids for one paper of blueprint `name`, in section order.
+
+    Greedy: fill each section's difficulty quota year-balanced from
+    questions not in `exclude`. Repair: top up any shortfall from other
+    difficulties, then fall back to excluded (recently seen) questions.
+    """
+    bp      = BLUEPRINTS[name]
+    exclude = set(exclude)
+    paper   = []
+    years   = collections.Counter()
+    for sec, buckets in zip(bp["sections"], blueprint_index(name)):
+        weights = bp.get("difficulty") or {d: sum(map(len, by_year.values()))
+                                           for d, by_year in buckets.items()}
+        picked = []
+        for diff, n in _apportion(sec["count"], weights).items():
+            picked += _pick_year_balanced(buckets.get(diff, {}), n, exclude, rng, years)
+
+        short = sec["count"] - len(picked)
+        if short > 0:
+            chosen = set(picked)
+            rest   = [qid for by_year in buckets.values() for ids in by_year.values()
+                      for qid in ids if qid not in chosen]
+            rng.shuffle(rest)
+            rest.sort(key=lambda qid: qid in exclude)   # stable: fresh first
+            picked += rest[:short]
+        rng.shuffle(picked)
+        paper += picked
+    return paper
+
+def get_paper(name, user=None):
+    """Variant for a new blueprint paper, avoiding `user`'s recent questions."""
+    recent = db_recent_question_ids(user, BLUEPRINTS[name]["recent_papers"]) if user else ()
+    return build_variant(("paper", name, None), secrets.randbits(32), recent)
+
+# ═══════════════════════════════════════════════════════════════
+# SEEDED PAPERS — every attempt is reproducible from (seed, bank version)
+# A variant is (seed, bank positions, option-permutation indices): about
+# 5 bytes per question. Selection draws from Random(seed); option order
+# from a separate stream, so it can be replayed over a stored question list.
+# ═══════════════════════════════════════════════════════════════
+# Positions are uint32: "I" is 4 bytes wherever CPython runs ("L" is 8 on
+# 64-bit Linux), and uint16 would wrap past 65,535 questions
+POSITION_TYPE = "I"
+OPTION_PERMS = list(itertools.permutations(range(4)))   # every question has 4 options
+PERM_INDEX   = {p: i for i, p in enumerate(OPTION_PERMS)}
+
+def option_orders(seed, n):
+    """Displayed → original option index for each of a seeded paper's `n` questions."""
+    rng = random.Random(f"{seed}:options")
+    for _ in range(n):
+        order = list(range(4))
+        rng.shuffle(order)
+        yield order
+
+def attempt_options(row):
+    """[(question id, original option index or None)] for a stored attempt."""
+    qids, codes = (row["questions"] or "").split(","), row["answers"] or ""
+    if row["seed"] is None or not codes:
+        return []
+    return [(qid, None if code == "-" else order[int(code)])
+            for qid, code, order in zip(qids, codes, option_orders(row["seed"], len(qids)))]
+
+def variant_from_ids(ids, seed):
+    perms = bytes(PERM_INDEX[tuple(order)] for order in option_orders(seed, len(ids)))
+    return seed, array.array(POSITION_TYPE, (bank.BANK_POS[qid] for qid in ids)), perms
+
+def build_variant(key, seed, exclude=()):
+    mode, subject, chapter = key
+    rng = random.Random(seed)
+    if mode == "paper":
+        ids = generate_paper(subject, exclude, rng)
+    else:
+        ids = [q["id"] for q in select_questions(subject, chapter, mode, rng)]
+    return variant_from_ids(ids, seed)
+
+def materialize(variant):
+    _, positions, perms = variant
+    return [_permuted(bank.BANK_LIST[p], OPTION_PERMS[k]) for p, k in zip(positions, perms)]
+
+def encode_answers(questions, answers):
+    # One char per question: displayed option index, or "-" if skipped
+    return "".join("-" if answers.get(i) is None else str(q["options"].index(answers[i]))
+                   for i, q in enumerate(questions))
+
+def decode_answers(questions, key):
+    return {i: None if c == "-" else q["options"][int(c)]
+            for i, (q, c) in enumerate(zip(questions, key or ""))}
+
+def rebuild_attempt(row):
+    """(questions, answers) exactly as shown to the candidate in a stored attempt.
+
+    Blueprint papers avoid the user's recent questions at generation time,
+    so their question list is read from the row; every other mode is
+    re-drawn from the seed.
+    """
+    if row["bank_version"] != bank.BANK_VERSION:
+        raise ValueError(f"attempt {row['id']} used bank {row['bank_version']}, "
+                         f"current bank is {bank.BANK_VERSION}")
+    if row["mode"] == "paper":
+        variant = variant_from_ids(row["questions"].split(","), row["seed"])
+    else:
+        chapter = row["chapter"] if row["mode"] == "chapter" else None
+        variant = build_variant((row["mode"], row["subject"], chapter), row["seed"])
+    questions = materialize(variant)
+    return questions, decode_answers(questions, row["answers"])
+
+def rescore_attempt(result_id):
+    questions, answers = rebuild_attempt(db_load_attempt(result_id))
+    return calculate_score(questions, answers)
+
+# ═══════════════════════════════════════════════════════════════
+# PAPER POOL — pre-generated variants for mass test starts
+# A daemon thread keeps each pool topped up so a start pops a ready
+# variant in O(1) instead of sampling and shuffling in the request path.
+# ═══════════════════════════════════════════════════════════════
+POOL_SIZE    = 64    # variants kept ready per test key
+POOL_LOW     = 16    # refill once a pool drops below this
+
+def pool_keys():
+    """Every (mode, subject, chapter) a pooled test can start with."""
+    keys = [("full", s, None) for s in SUBJECTS]
+    keys += [("chapter", s, ch) for s in SUBJECTS for ch in bank.QUESTION_BANK[s]]
+    return keys
+
+class PaperPool:
+    def __init__(self, key, refill):
+        self.key      = key
+        self.refill   = refill
+        self.variants = collections.deque()
+
+    def fill(self):
+        while len(self.variants) < POOL_SIZE:
+            self.variants.append(build_variant(self.key, secrets.randbits(32)))
+
+    def take(self):
+        try:
+            variant = self.variants.popleft()
+        except IndexError:   # drained faster than the refill thread keeps up
+            variant = build_variant(self.key, secrets.randbits(32))
+        if len(self.variants) < POOL_LOW:
+            self.refill.put(self)
+        return variant
+
+@st.cache_resource
+def paper_pools():
+    """Process-wide {key: PaperPool}, pre-filled by a background thread."""
+    refill = queue.Queue()
+    pools  = {key: PaperPool(key, refill) for key in pool_keys()}
+
+    def worker():
+        while True:
+            refill.get().fill()
+
+    threading.Thread(target=worker, name="paper-pool", daemon=True).start()
+    for pool in pools.values():
+        refill.put(pool)
+    return pools
+
+def draw_variant(subject, chapter=None, mode="chapter"):
+    """Variant for a new test, taken from the pre-generated pool."""
+    chapter = chapter if mode == "chapter" else None
+    return paper_pools()[(mode, subject, chapter)].take()
+
+def start_test(variant, subject, chapter, mode, duration, offline=None):
+    """Open the test page on `variant`; `offline` defaults to the sidebar toggle."""
+    for k in [k for k in st.session_state if k.startswith("r_")]:
+        del st.session_state[k]
+    st.session_state.variant          = variant
+    st.session_state.seed             = variant[0]
+    st.session_state.current_subject  = subject
+    st.session_state.current_chapter  = chapter
+    st.session_state.current_mode     = mode
+    st.session_state.questions        = materialize(variant)
+    st.session_state.answers          = {}
+    st.session_state.test_start       = time.time()
+    st.session_state.test_duration    = duration
+    st.session_state.test_done        = False
+    st.session_state.test_offline     = st.session_state.get("offline", False) if offline is None else offline
+    st.session_state.page             = "test"
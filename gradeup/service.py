@@ -0,0 +1,24 @@
+"""
+GradeUP service layer: the process-wide resources the pages run on.
+"""
+
+import streamlit as st
+
+from .storage import db_init
+from .selection import paper_pools
+from .analytics import rollup_worker
+
+# ═══════════════════════════════════════════════════════════════
+# START-UP
+# The page script re-executes on every rerun, but the package modules are
+# imported once per process, and everything shared between sessions is a
+# process resource: the storage backend, the bank (bank.py, on import),
+# the paper pools, the rollup worker, the search index, the session store
+# and the checkpoint writer. start() brings up the ones every page needs,
+# once; the rest are created on first use.
+# ═══════════════════════════════════════════════════════════════
+@st.cache_resource
+def start():
+    db_init()          # schema and migrations, not repeated per rerun
+    paper_pools()      # starts background pre-generation
+    rollup_worker()
@@ -0,0 +1,392 @@
+"""
+GradeUP session state: defaults, shared session backends and test checkpoints.
+"""
+
+import streamlit as st
+import array, base64, hashlib, hmac, json, logging, os, pathlib, secrets, sqlite3, threading, time
+
+from . import BASE_DIR, bank
+from .storage import (db_archived_stats, db_delete_checkpoint, db_load_checkpoint,
+                      db_load_mastery, db_load_user_results, db_save_checkpoints)
+from .selection import POSITION_TYPE, decode_answers, encode_answers, materialize, start_test
+
+log = logging.getLogger(__name__)
+
+# ═══════════════════════════════════════════════════════════════
+# SESSION BACKENDS — session state shared across app processes
+# Each browser session carries a random id in the URL (?sid=<id>.<hmac>);
+# ids whose signature does not verify start a fresh session. Shared keys
+# are stored as JSON per key and written back only when their text
+# changes; a process that has not seen the session yet pulls them on its
+# first rerun. Select with GRADEUP_SESSION_BACKEND = memory | sqlite | redis.
+# ═══════════════════════════════════════════════════════════════
+SESSION_BACKEND = os.environ.get("GRADEUP_SESSION_BACKEND", "memory")
+SESSION_DB_PATH = pathlib.Path(os.environ.get("GRADEUP_SESSION_DB", BASE_DIR / "sessions.db"))
+REDIS_URL       = os.environ.get("GRADEUP_REDIS_URL")
+SESSION_TTL     = 12 * 3600    # since a session last saved; older ones are dropped
+SESSION_PRUNE   = 60           # seconds between sweeps for expired sessions
+
+# Workers sharing a session store must share the key (serve.py sets one);
+# without it each process signs with its own and sessions stay per process
+SESSION_SECRET  = os.environ.get("GRADEUP_SESSION_SECRET", "").encode() or secrets.token_bytes(32)
+
+# Everything else is rebuilt: questions from the variant, results from the DB
+SHARED_KEYS = ["page", "name", "course", "current_subject", "current_chapter",
+               "current_mode", "answers", "test_start", "test_duration",
+               "test_done", "last_result", "seed", "variant", "test_offline"]
+
+class MemorySessionStore:
+    def __init__(self):
+        self.data   = {}    # sid -> (last saved, {key: value})
+        self.pruned = time.time()
+        self.lock   = threading.Lock()
+
+    def load(self, sid):
+        with self.lock:
+            seen, values = self.data.get(sid, (0, {}))
+            return dict(values) if seen > time.time() - SESSION_TTL else {}
+
+    def save(self, sid, changed):
+        now = time.time()
+        with self.lock:
+            seen, values = self.data.get(sid, (0, {}))
+            if seen <= now - SESSION_TTL:
+                values = {}
+            self.data[sid] = (now, {**values, **changed})
+            if now - self.pruned > SESSION_PRUNE:
+                self.data   = {k: v for k, v in self.data.items() if v[0] > now - SESSION_TTL}
+                self.pruned = now
+
+    def delete(self, sid):
+        with self.lock:
+            self.data.pop(sid, None)
+
+class SQLiteSessionStore:
+    def __init__(self, path):
+        self.path   = path
+        self.pruned = time.time()
+        con = sqlite3.connect(path)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("""CREATE TABLE IF NOT EXISTS sessions (
+                           sid        TEXT,
+                           key        TEXT,
+                           value      BLOB,
+                           updated_at REAL,
+                           PRIMARY KEY (sid, key)
+                       ) WITHOUT ROWID""")
+        con.commit(); con.close()
+
+    def load(self, sid):
+        con  = sqlite3.connect(self.path)
+        rows = con.execute("SELECT key,value FROM sessions WHERE sid=? AND updated_at>?",
+                           (sid, time.time() - SESSION_TTL)).fetchall()
+        con.close()
+        return dict(rows)
+
+    def save(self, sid, changed):
+        # Every key of the session shares its last-saved time, so keys that
+        # never change do not expire out from under a live session
+        now = time.time()
+        con = sqlite3.connect(self.path)
+        con.execute("DELETE FROM sessions WHERE sid=? AND updated_at<=?", (sid, now - SESSION_TTL))
+        con.execute("UPDATE sessions SET updated_at=? WHERE sid=?", (now, sid))
+        con.executemany("INSERT OR REPLACE INTO sessions VALUES(?,?,?,?)",
+                        [(sid, k, v, now) for k, v in changed.items()])
+        if now - self.pruned > SESSION_PRUNE:
+            con.execute("DELETE FROM sessions WHERE updated_at<=?", (now - SESSION_TTL,))
+            self.pruned = now
+        con.commit(); con.close()
+
+    def delete(self, sid):
+        con = sqlite3.connect(self.path)
+        con.execute("DELETE FROM sessions WHERE sid=?", (sid,))
+        con.commit(); con.close()
+
+class LocalRedis:
+    """In-process stand-in for the few redis-py hash commands RedisSessionStore uses."""
+    def __init__(self):
+        self.hashes = {}
+        self.expiry = {}
+        self.lock   = threading.Lock()
+
+    def _live(self, name):
+        if self.expiry.get(name, float("inf")) < time.time():
+            self.hashes.pop(name, None); self.expiry.pop(name, None)
+        return self.hashes.get(name, {})
+
+    def hgetall(self, name):
+        with self.lock:
+            return {k.encode(): v for k, v in self._live(name).items()}
+
+    def hset(self, name, mapping):
+        with self.lock:
+            self._live(name)
+            self.hashes.setdefault(name, {}).update(mapping)
+
+    def expire(self, name, seconds):
+        with self.lock:
+            self.expiry[name] = time.time() + seconds
+
+    def delete(self, name):
+        with self.lock:
+            self.hashes.pop(name, None); self.expiry.pop(name, None)
+
+class RedisSessionStore:
+    def __init__(self, client):
+        self.client = client
+
+    def load(self, sid):
+        return {k.decode(): v for k, v in self.client.hgetall(f"gradeup:session:{sid}").items()}
+
+    def save(self, sid, changed):
+        self.client.hset(f"gradeup:session:{sid}", mapping=changed)
+        self.client.expire(f"gradeup:session:{sid}", SESSION_TTL)
+
+    def delete(self, sid):
+        self.client.delete(f"gradeup:session:{sid}")
+
+@st.cache_resource
+def session_store():
+    if SESSION_BACKEND == "sqlite":
+        return SQLiteSessionStore(SESSION_DB_PATH)
+    if SESSION_BACKEND == "redis":
+        if REDIS_URL:
+            import redis
+            return RedisSessionStore(redis.Redis.from_url(REDIS_URL))
+        return RedisSessionStore(LocalRedis())
+    return MemorySessionStore()
+
+def _sign(token):
+    return hmac.new(SESSION_SECRET, token.encode(), hashlib.sha256).hexdigest()[:32]
+
+def _session_id():
+    """Store key of this browser session; the URL carries it signed."""
+    token, _, sig = st.query_params.get("sid", "").partition(".")
+    if not (token and hmac.compare_digest(sig, _sign(token))):
+        token = secrets.token_urlsafe(16)
+        st.query_params["sid"] = f"{token}.{_sign(token)}"
+    return token
+
+def _jsonable(value):
+    # Shared values are str/number/bool/None, lists and dicts, plus a few
+    # types JSON lacks: int-keyed dicts (answers), arrays and bytes (variant)
+    if isinstance(value, dict):
+        if value and all(isinstance(k, int) for k in value):
+            return {"__int_keys__": [[k, _jsonable(v)] for k, v in value.items()]}
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, array.array):
+        return {"__array__": value.typecode, "items": value.tolist()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    return value
+
+def _revive(obj):
+    if "__int_keys__" in obj:
+        return {k: v for k, v in obj["__int_keys__"]}
+    if "__array__" in obj:
+        return array.array(obj["__array__"], obj["items"])
+    if "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+def dump_value(value):
+    return json.dumps(_jsonable(value), separators=(",", ":"))
+
+def load_value(text):
+    return json.loads(text, object_hook=_revive)
+
+def hydrate_state():
+    """Pull shared keys from the store the first time this process sees the session."""
+    if "_shared" in st.session_state: return
+    sid    = _session_id()
+    stored = {}
+    for k, blob in session_store().load(sid).items():
+        if k not in SHARED_KEYS: continue
+        try:
+            st.session_state[k] = load_value(blob)
+        except ValueError:    # written by an older release; rebuilt from defaults
+            continue
+        stored[k] = blob.decode() if isinstance(blob, bytes) else blob    # redis hands back bytes
+    # The test page mirrors its radios into `answers` every rerun; put them
+    # back, or the next checkpoint would overwrite the real one with blanks
+    if st.session_state.get("page") == "test" and not st.session_state.get("test_offline"):
+        for i, chosen in (st.session_state.get("answers") or {}).items():
+            if chosen is not None:
+                st.session_state[f"r_{i}"] = chosen
+    st.session_state._sid    = sid
+    st.session_state._shared = stored
+
+def persist_state():
+    """Write back shared keys whose serialized value changed this rerun."""
+    if "_shared" not in st.session_state: return
+    snapshot = st.session_state._shared
+    changed  = {}
+    for k in SHARED_KEYS:
+        blob = dump_value(st.session_state.get(k))
+        if snapshot.get(k) != blob:
+            changed[k] = blob
+    if changed:
+        session_store().save(st.session_state._sid, changed)
+        snapshot.update(changed)
+
+def clear_shared_state():
+    session_store().delete(st.session_state._sid)
+    st.query_params.clear()
+
+# ═══════════════════════════════════════════════════════════════
+# SESSION STATE
+# ═══════════════════════════════════════════════════════════════
+def init_state():
+    hydrate_state()
+    defaults = {
+        "page": "landing",
+        "name": "", "course": "NDA",
+        "results": [], "db_loaded": False,
+        "current_subject": None, "current_chapter": None,
+        "current_mode": None, "questions": [], "answers": {},
+        "test_start": None, "test_duration": 1800,
+        "test_done": False, "last_result": None, "seed": None,
+        "variant": None, "archived": {}, "mastery": {},
+        "offline": False, "test_offline": False, "paper_etags": set(),
+    }
+    for k, v in defaults.items():
+        if k not in st.session_state:
+            st.session_state[k] = v
+    if st.session_state.variant and not st.session_state.questions:
+        st.session_state.questions = materialize(st.session_state.variant)
+
+def load_db_results():
+    if not st.session_state.db_loaded and st.session_state.name:
+        rows = db_load_user_results(st.session_state.name)
+        existing = {r.get("date") for r in st.session_state.results}
+        for row in rows:
+            if row.get("date") not in existing:
+                st.session_state.results.append(row)
+        st.session_state.archived  = db_archived_stats(st.session_state.name)
+        st.session_state.mastery   = {(m["subject"], m["chapter"]): [m["shown"], m["answered"],
+                                                                     m["correct"], m["last_taken"]]
+                                      for m in db_load_mastery(st.session_state.name)}
+        st.session_state.db_loaded = True
+
+def load_archived_results():
+    """Swap the archived totals for the archived attempts themselves."""
+    st.session_state.results  = db_load_user_results(st.session_state.name, archived=True)
+    st.session_state.archived = {}
+
+def performance_summary():
+    """(tests, average %, wrong answers, {subject: average %}) over the
+    session's results plus any archived totals not loaded into it."""
+    per = {subj: [tests, pct, wrong] for subj, (tests, pct, wrong) in st.session_state.archived.items()}
+    for r in st.session_state.results:
+        acc = per.setdefault(r["subject"], [0, 0.0, 0])
+        acc[0] += 1; acc[1] += r["percentage"]; acc[2] += r.get("wrong", 0)
+    tests = sum(a[0] for a in per.values())
+    if not tests:
+        return 0, 0.0, 0, {}
+    return (tests, sum(a[1] for a in per.values()) / tests, int(sum(a[2] for a in per.values())),
+            {subj: a[1] / a[0] for subj, a in per.items() if a[0]})
+
+# ═══════════════════════════════════════════════════════════════
+# CHECKPOINTS — resumable tests
+# Progress (variant, answers, elapsed) is queued on every rerun of the
+# test page; a background thread writes the latest checkpoint per user in
+# one transaction every CHECKPOINT_INTERVAL seconds. Any worker sharing
+# the DB can resume the test without re-running selection.
+# ═══════════════════════════════════════════════════════════════
+CHECKPOINT_INTERVAL = 5
+
+class CheckpointWriter:
+    def __init__(self, interval):
+        self.pending    = {}
+        self.generation = {}    # name -> drops so far; a flush compares it across its write
+        self.lock       = threading.Lock()
+        threading.Thread(target=self._run, args=(interval,),
+                         name="checkpoints", daemon=True).start()
+
+    def _run(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception:    # keep the thread alive; the next flush retries
+                log.exception("checkpoint flush failed")
+
+    def put(self, checkpoint):
+        with self.lock:
+            self.pending[checkpoint["name"]] = checkpoint
+
+    def drop(self, name):
+        with self.lock:
+            self.pending.pop(name, None)
+            self.generation[name] = self.generation.get(name, 0) + 1
+        db_delete_checkpoint(name)
+
+    def flush(self):
+        """Write the queued checkpoints outside the lock, so put() and drop()
+        never wait on the database."""
+        with self.lock:
+            batch, self.pending = self.pending, {}
+            seen = {name: self.generation.get(name, 0) for name in batch}
+        if not batch:
+            return
+        try:
+            db_save_checkpoints(list(batch.values()))
+        except Exception:
+            log.exception("writing %d checkpoints failed; retrying next flush", len(batch))
+            with self.lock:
+                for name, cp in batch.items():
+                    if self.generation.get(name, 0) == seen[name]:
+                        self.pending.setdefault(name, cp)
+            return
+        # A drop() that raced the write may have deleted before we saved
+        with self.lock:
+            dropped = [name for name in batch if self.generation.get(name, 0) != seen[name]]
+        for name in dropped:
+            db_delete_checkpoint(name)
+
+@st.cache_resource
+def checkpoint_writer():
+    return CheckpointWriter(CHECKPOINT_INTERVAL)
+
+def checkpoint_test():
+    seed, positions, perms = st.session_state.variant
+    questions = st.session_state.questions
+    answers   = {i: st.session_state.get(f"r_{i}") for i in range(len(questions))}
+    checkpoint_writer().put({
+        "name":         st.session_state.name,
+        "subject":      st.session_state.current_subject,
+        "chapter":      st.session_state.current_chapter,
+        "mode":         st.session_state.current_mode,
+        "seed":         seed,
+        "bank_version": bank.BANK_VERSION,
+        "positions":    positions.tobytes(),
+        "perms":        perms,
+        "answers":      encode_answers(questions, answers),
+        "elapsed":      time.time() - st.session_state.test_start,
+        "duration":     st.session_state.test_duration,
+        "updated_at":   time.time(),
+    })
+
+def load_checkpoint(name):
+    """Resumable checkpoint for `name`, or None (stale bank versions are discarded)."""
+    cp = db_load_checkpoint(name)
+    if cp and cp["bank_version"] != bank.BANK_VERSION:
+        checkpoint_writer().drop(name)
+        return None
+    return cp
+
+def resume_test(cp):
+    """Reopen a checkpointed test on its original deadline: the clock keeps
+    running while the candidate is away, and a test resumed after time ran
+    out is submitted with the checkpointed answers on the next rerun."""
+    positions = array.array(POSITION_TYPE)
+    positions.frombytes(cp["positions"])
+    # Only the widget page checkpoints, and its restored r_* radios live there
+    start_test((cp["seed"], positions, cp["perms"]),
+               cp["subject"], cp["chapter"], cp["mode"], cp["duration"], offline=False)
+    st.session_state.test_start = cp["updated_at"] - cp["elapsed"]
+    for i, chosen in decode_answers(st.session_state.questions, cp["answers"]).items():
+        if chosen is not None:
+            st.session_state[f"r_{i}"] = chosen
@@ -0,0 +1,998 @@
+"""
+GradeUP storage: the SQLite and PostgreSQL backends behind the db_* helpers.
+"""
+
+import streamlit as st
+import abc, collections, contextlib, datetime, os, pathlib, sqlite3
+
+from . import BASE_DIR
+from .metrics import timed
+
+# Read as storage.DB_PATH outside this module; the benchmarks repoint it
+DB_PATH     = pathlib.Path(os.environ.get("GRADEUP_DB", BASE_DIR / "gradeup.db"))
+# Monthly archive DBs written by archive_results() (gradeup.analytics)
+ARCHIVE_DIR = pathlib.Path(os.environ.get("GRADEUP_ARCHIVE_DIR", BASE_DIR / "archive"))
+
+# Columns added to `results` after the first release, migrated by db_init()
+RESULT_EXTRA_COLUMNS = [("questions", "TEXT"), ("seed", "INTEGER"),
+                        ("bank_version", "TEXT"), ("answers", "TEXT"), ("course", "TEXT")]
+
+# ═══════════════════════════════════════════════════════════════
+# DATABASE
+# The db_* helpers below are the app's only way to the database. They
+# delegate to backend(): SQLiteStorage on DB_PATH (default) or, with
+# GRADEUP_STORAGE=postgres, PostgresStorage on GRADEUP_DATABASE_URL.
+# Both implement the Storage interface with their own pooling, batching
+# and ranking; archival (archive_results) is SQLite-only.
+# ═══════════════════════════════════════════════════════════════
+STORAGE_BACKEND = os.environ.get("GRADEUP_STORAGE", "sqlite")
+DATABASE_URL    = os.environ.get("GRADEUP_DATABASE_URL")
+DB_POOL_SIZE    = int(os.environ.get("GRADEUP_DB_POOL", 10))
+
+RESULT_COLUMNS = ["name","subject","chapter","mode","correct","wrong","unattempted",
+                  "raw_score","total_marks","percentage","time_taken","taken_at",
+                  "questions","seed","bank_version","answers","course"]
+# Rows saved before results had a course take the user's current one
+EXPORT_SELECT  = ",".join("coalesce(r.course, u.course)" if c == "course" else f"r.{c}"
+                          for c in RESULT_COLUMNS)
+ATTEMPT_KEYS   = ["id","name","subject","chapter","mode","questions","seed",
+                  "bank_version","answers"]
+HISTORY_KEYS   = ["subject","chapter","mode","correct","wrong","unattempted",
+                  "raw_score","total_marks","percentage","time_taken","date"]
+BOARD_KEYS     = ["name","subject","chapter","mode","raw_score","total_marks",
+                  "percentage","time_taken","taken_at"]
+CHECKPOINT_KEYS = ["name","subject","chapter","mode","seed","bank_version",
+                   "positions","perms","answers","elapsed","duration","updated_at"]
+MASTERY_KEYS   = ["subject","chapter","shown","answered","correct","last_taken"]
+ROLLUP_KEYS    = ["bucket","course","subject","chapter","mode","decile",
+                  "attempts","pct_sum","correct","wrong","unattempted"]
+
+def _result_row(r):
+    return (r["name"],r["subject"],r["chapter"],r["mode"],
+            r["correct"],r["wrong"],r["unattempted"],
+            r["raw_score"],r["total_marks"],r["percentage"],
+            r["time_taken"],r["taken_at"],",".join(r.get("questions", [])),
+            r.get("seed"),r.get("bank_version"),r.get("answer_codes"),r.get("course"))
+
+# Score distribution per (subject, chapter, mode): one counter per 0.1%
+# step, which is exact for stored percentages. Updated with every save,
+# so a percentile costs at most HIST_BINS rows, however many attempts.
+HIST_BINS = 1001
+
+def score_bin(pct):
+    return min(HIST_BINS - 1, max(0, round(pct * 10)))
+
+def percentile(hist, pct):
+    """Share of attempts in `hist` scoring below `pct` (ties count half)."""
+    b     = score_bin(pct)
+    below = sum(n for k, n in hist.items() if k < b)
+    return 100 * (below + hist.get(b, 0) / 2) / (sum(hist.values()) or 1)
+
+def _hist_rows(rows):
+    counts = collections.Counter((r["subject"], r["chapter"] or "", r["mode"], score_bin(r["percentage"]))
+                                 for r in rows)
+    return [(*k, n) for k, n in counts.items()]
+
+class Storage(abc.ABC):
+    """What every backend provides to the db_* helpers. Rows come back as
+    dicts keyed by the *_KEYS lists above unless noted."""
+    Error: type[Exception]    # the driver's base error, caught by callers that can retry
+
+    @abc.abstractmethod
+    def init(self):
+        """Create or migrate the schema; safe to call on every start."""
+
+    @abc.abstractmethod
+    def save_user(self, name, course): ...
+
+    @abc.abstractmethod
+    def load_user(self, name):
+        """(course,) or None."""
+
+    @abc.abstractmethod
+    def delete_user(self, name): ...
+
+    @abc.abstractmethod
+    def save_results(self, rows):
+        """Insert result dicts (see _result_row) and count them in score_hist."""
+
+    @abc.abstractmethod
+    def load_attempt(self, result_id):
+        """ATTEMPT_KEYS dict, archived attempts included, or None."""
+
+    @abc.abstractmethod
+    def save_checkpoints(self, rows):
+        """Upsert CHECKPOINT_KEYS dicts by name."""
+
+    @abc.abstractmethod
+    def load_checkpoint(self, name):
+        """CHECKPOINT_KEYS dict with bytes positions/perms, or None."""
+
+    @abc.abstractmethod
+    def delete_checkpoint(self, name): ...
+
+    @abc.abstractmethod
+    def recent_question_ids(self, name, papers):
+        """Set of question ids in `name`'s last `papers` attempts."""
+
+    @abc.abstractmethod
+    def load_user_results(self, name, archived):
+        """HISTORY_KEYS dicts in attempt order; `archived` adds archived months."""
+
+    @abc.abstractmethod
+    def leaderboard(self, limit):
+        """BOARD_KEYS dicts, best percentage first, faster first on ties.
+        Hot attempts plus, where the backend archives, each archived
+        (name, subject) pair's best attempt."""
+
+    @abc.abstractmethod
+    def rank(self, name):
+        """1-based position of `name`'s best attempt among the attempts
+        leaderboard() ranks, or None."""
+
+    @abc.abstractmethod
+    def export_rows(self, after_id, limit):
+        """id + RESULT_COLUMNS dicts with id > after_id, in id order."""
+
+    @abc.abstractmethod
+    def rollup_watermark(self, name="rollups"):
+        """Last result id folded by rollup `name` (0 if never run)."""
+
+    @abc.abstractmethod
+    def apply_rollups(self, old_id, new_id, scores, questions, prune_before):
+        """Fold a batch if the watermark is still old_id; False if another process won."""
+
+    @abc.abstractmethod
+    def apply_mastery(self, old_id, new_id, rows):
+        """As apply_rollups, for user_mastery."""
+
+    @abc.abstractmethod
+    def score_histogram(self, subject, chapter, mode):
+        """{score bin: attempts}."""
+
+    @abc.abstractmethod
+    def backfill_histograms(self, batch):
+        """Count the next `batch` ids of results that predate score_hist;
+        False once there is nothing left to count."""
+
+    @abc.abstractmethod
+    def apply_engagement(self, old_id, new_id, rows):
+        """As apply_rollups, replacing the merged engagement rows."""
+
+    @abc.abstractmethod
+    def load_engagement(self, since):
+        """(day, dim, key, tests, sketch) rows from `since` on."""
+
+    @abc.abstractmethod
+    def load_mastery(self, name):
+        """MASTERY_KEYS dicts for `name`."""
+
+    @abc.abstractmethod
+    def load_rollups(self, grain, since):
+        """ROLLUP_KEYS dicts for `grain` buckets from `since` on."""
+
+    @abc.abstractmethod
+    def weakest_questions(self, min_answered, limit):
+        """(question id, shown, answered, correct), lowest accuracy first."""
+
+    @abc.abstractmethod
+    def archived_stats(self, name):
+        """{subject: (tests, percentage sum, wrong)} over archived months."""
+
+class SQLiteStorage(Storage):
+    """One short-lived connection per call; DB_PATH is read each time so
+    tools can point the app at another file."""
+    Error = sqlite3.Error
+
+    def connect(self):
+        return sqlite3.connect(DB_PATH)
+
+    def init(self):
+        con = self.connect()
+        con.executescript("""
+            CREATE TABLE IF NOT EXISTS users (
+                name TEXT PRIMARY KEY,
+                course TEXT NOT NULL,
+                registered_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                name        TEXT NOT NULL,
+                subject     TEXT,
+                chapter     TEXT,
+                mode        TEXT,
+                correct     INTEGER,
+                wrong       INTEGER,
+                unattempted INTEGER,
+                raw_score   REAL,
+                total_marks REAL,
+                percentage  REAL,
+                time_taken  INTEGER,
+                taken_at    TEXT,
+                questions   TEXT,
+                seed        INTEGER,
+                bank_version TEXT,
+                answers     TEXT,
+                course      TEXT
+            );
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                name         TEXT PRIMARY KEY,
+                subject      TEXT,
+                chapter      TEXT,
+                mode         TEXT,
+                seed         INTEGER,
+                bank_version TEXT,
+                positions    BLOB,
+                perms        BLOB,
+                answers      TEXT,
+                elapsed      REAL,
+                duration     INTEGER,
+                updated_at   REAL
+            );
+            CREATE TABLE IF NOT EXISTS archives (
+                month       TEXT PRIMARY KEY,
+                file        TEXT NOT NULL,
+                first_id    INTEGER,
+                last_id     INTEGER,
+                rows        INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS archived_stats (
+                name          TEXT NOT NULL,
+                subject       TEXT NOT NULL,
+                tests         INTEGER,
+                pct_sum       REAL,
+                wrong         INTEGER,
+                best_chapter  TEXT,
+                best_mode     TEXT,
+                best_raw      REAL,
+                best_total    REAL,
+                best_pct      REAL,
+                best_time     INTEGER,
+                best_taken_at TEXT,
+                PRIMARY KEY (name, subject)
+            );
+            CREATE TABLE IF NOT EXISTS rollup_state (
+                name        TEXT PRIMARY KEY,
+                last_id     INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS rollup_scores (
+                grain       TEXT,
+                bucket      TEXT,
+                course      TEXT,
+                subject     TEXT,
+                chapter     TEXT,
+                mode        TEXT,
+                decile      INTEGER,
+                attempts    INTEGER,
+                pct_sum     REAL,
+                correct     INTEGER,
+                wrong       INTEGER,
+                unattempted INTEGER,
+                PRIMARY KEY (grain, bucket, course, subject, chapter, mode, decile)
+            );
+            CREATE TABLE IF NOT EXISTS rollup_questions (
+                question_id TEXT PRIMARY KEY,
+                shown       INTEGER,
+                answered    INTEGER,
+                correct     INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS user_mastery (
+                name        TEXT NOT NULL,
+                subject     TEXT NOT NULL,
+                chapter     TEXT NOT NULL,
+                shown       INTEGER,
+                answered    INTEGER,
+                correct     INTEGER,
+                last_taken  TEXT,
+                PRIMARY KEY (name, subject, chapter)
+            );
+            CREATE TABLE IF NOT EXISTS score_hist (
+                subject     TEXT NOT NULL,
+                chapter     TEXT NOT NULL,
+                mode        TEXT NOT NULL,
+                bin         INTEGER NOT NULL,
+                n           INTEGER,
+                PRIMARY KEY (subject, chapter, mode, bin)
+            );
+            CREATE TABLE IF NOT EXISTS engagement (
+                day         TEXT NOT NULL,
+                dim         TEXT NOT NULL,
+                key         TEXT NOT NULL,
+                tests       INTEGER,
+                sketch      BLOB,
+                PRIMARY KEY (day, dim, key)
+            );
+        """)
+        # Older databases predate these columns — add them in place
+        have = {row[1] for row in con.execute("PRAGMA table_info(results)")}
+        for col, typ in RESULT_EXTRA_COLUMNS:
+            if col not in have:
+                con.execute(f"ALTER TABLE results ADD COLUMN {col} {typ}")
+        # History reads by user; the leaderboard walks the ranking index
+        con.executescript("""
+            CREATE INDEX IF NOT EXISTS results_name ON results(name, id);
+            CREATE INDEX IF NOT EXISTS results_rank ON results(percentage DESC, time_taken);
+        """)
+        # First start with histograms: save_results counts ids past this
+        # mark; the ones before it are left to backfill_histograms
+        if not con.execute("SELECT 1 FROM rollup_state WHERE name='histograms'").fetchone():
+            if con.execute("""INSERT OR IGNORE INTO rollup_state
+                              SELECT 'histograms', coalesce(max(id), 0) FROM results""").rowcount:
+                con.execute("INSERT OR IGNORE INTO rollup_state VALUES('histogram_backfill', 0)")
+        con.commit(); con.close()
+
+    def save_user(self, name, course):
+        con = self.connect()
+        con.execute("""INSERT INTO users(name,course,registered_at) VALUES(?,?,?)
+                       ON CONFLICT(name) DO UPDATE SET course=excluded.course""",
+                    (name, course, datetime.datetime.now().isoformat()))
+        con.commit(); con.close()
+
+    def load_user(self, name):
+        if not DB_PATH.exists(): return None
+        con = self.connect()
+        row = con.execute("SELECT course FROM users WHERE name=?", (name,)).fetchone()
+        con.close()
+        return row
+
+    def delete_user(self, name):
+        con = self.connect()
+        con.execute("DELETE FROM users WHERE name=?", (name,))
+        con.commit(); con.close()
+
+    HIST_UPSERT = """INSERT INTO score_hist VALUES(?,?,?,?,?)
+        ON CONFLICT(subject,chapter,mode,bin) DO UPDATE SET n = score_hist.n + excluded.n"""
+    HIST_BACKFILL = """INSERT INTO score_hist
+        SELECT subject, coalesce(chapter, ''), mode, CAST(round(percentage * 10) AS INTEGER), count(*)
+        FROM results WHERE id > ? AND id <= ? GROUP BY 1, 2, 3, 4
+        ON CONFLICT(subject,chapter,mode,bin) DO UPDATE SET n = score_hist.n + excluded.n"""
+
+    def save_results(self, rows):
+        con = self.connect()
+        con.executemany(f"""INSERT INTO results({",".join(RESULT_COLUMNS)})
+                            VALUES({",".join("?" * len(RESULT_COLUMNS))})""",
+                        [_result_row(r) for r in rows])
+        con.executemany(self.HIST_UPSERT, _hist_rows(rows))
+        con.commit(); con.close()
+
+    def load_attempt(self, result_id):
+        if not DB_PATH.exists(): return None
+        con = self.connect()
+        sql = f"SELECT {','.join(ATTEMPT_KEYS)} FROM results WHERE id=?"
+        row = con.execute(sql, (result_id,)).fetchone()
+        if not row:
+            arc = con.execute("SELECT file FROM archives WHERE ? BETWEEN first_id AND last_id",
+                              (result_id,)).fetchone()
+            if arc and (ARCHIVE_DIR / arc[0]).exists():
+                with contextlib.closing(sqlite3.connect(ARCHIVE_DIR / arc[0])) as acon:
+                    row = acon.execute(sql, (result_id,)).fetchone()
+        con.close()
+        return dict(zip(ATTEMPT_KEYS,row)) if row else None
+
+    def save_checkpoints(self, rows):
+        con = self.connect()
+        con.executemany(f"""INSERT OR REPLACE INTO checkpoints({",".join(CHECKPOINT_KEYS)})
+                            VALUES({",".join("?" * len(CHECKPOINT_KEYS))})""",
+                        [tuple(r[k] for k in CHECKPOINT_KEYS) for r in rows])
+        con.commit(); con.close()
+
+    def load_checkpoint(self, name):
+        if not DB_PATH.exists(): return None
+        con = self.connect()
+        row = con.execute(f"SELECT {','.join(CHECKPOINT_KEYS)} FROM checkpoints WHERE name=?",
+                          (name,)).fetchone()
+        con.close()
+        return dict(zip(CHECKPOINT_KEYS,row)) if row else None
+
+    def delete_checkpoint(self, name):
+        con = self.connect()
+        con.execute("DELETE FROM checkpoints WHERE name=?", (name,))
+        con.commit(); con.close()
+
+    def recent_question_ids(self, name, papers):
+        if not DB_PATH.exists(): return set()
+        con = self.connect()
+        rows = con.execute("""SELECT questions FROM results
+                   WHERE name=? AND questions IS NOT NULL AND questions != ''
+                   ORDER BY id DESC LIMIT ?""", (name, papers)).fetchall()
+        con.close()
+        return {qid for (qs,) in rows for qid in qs.split(",")}
+
+    def load_user_results(self, name, archived):
+        if not DB_PATH.exists(): return []
+        sql = """SELECT subject,chapter,mode,correct,wrong,unattempted,
+                 raw_score,total_marks,percentage,time_taken,taken_at
+                 FROM results WHERE name=? ORDER BY id"""
+        con  = self.connect()
+        rows = con.execute(sql, (name,)).fetchall()
+        if archived:
+            old = []
+            for (file,) in con.execute("SELECT file FROM archives ORDER BY first_id"):
+                if (ARCHIVE_DIR / file).exists():
+                    with contextlib.closing(sqlite3.connect(ARCHIVE_DIR / file)) as acon:
+                        old += acon.execute(sql, (name,)).fetchall()
+            rows = old + rows
+        con.close()
+        return [dict(zip(HISTORY_KEYS,r)) for r in rows]
+
+    # Archived months only keep each candidate's best attempt per subject
+    RANKED = """SELECT name,subject,chapter,mode,raw_score,total_marks,
+                percentage,time_taken,taken_at FROM results
+                UNION ALL
+                SELECT name,subject,best_chapter,best_mode,best_raw,best_total,
+                best_pct,best_time,best_taken_at FROM archived_stats"""
+
+    def leaderboard(self, limit):
+        if not DB_PATH.exists(): return []
+        con = self.connect()
+        rows = con.execute(f"{self.RANKED} ORDER BY percentage DESC, time_taken ASC LIMIT ?",
+                           (limit,)).fetchall()
+        con.close()
+        return [dict(zip(BOARD_KEYS,r)) for r in rows]
+
+    def rank(self, name):
+        if not DB_PATH.exists(): return None
+        con  = self.connect()
+        best = con.execute(f"""SELECT percentage, time_taken FROM ({self.RANKED}) WHERE name=?
+                               ORDER BY percentage DESC, time_taken ASC LIMIT 1""",
+                           (name,)).fetchone()
+        row  = best and con.execute(f"""SELECT count(*) + 1 FROM ({self.RANKED})
+                   WHERE percentage > ? OR (percentage = ? AND time_taken < ?)""",
+                   (best[0], best[0], best[1])).fetchone()
+        con.close()
+        return row[0] if row else None
+
+    def export_rows(self, after_id, limit):
+        if not DB_PATH.exists(): return []
+        con  = self.connect()
+        rows = con.execute(f"""SELECT r.id,{EXPORT_SELECT} FROM results r
+                               LEFT JOIN users u ON u.name = r.name
+                               WHERE r.id>? ORDER BY r.id LIMIT ?""", (after_id, limit)).fetchall()
+        con.close()
+        return [dict(zip(["id", *RESULT_COLUMNS], r)) for r in rows]
+
+    ROLLUP_UPSERT = """INSERT INTO rollup_scores VALUES(?,?,?,?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(grain,bucket,course,subject,chapter,mode,decile) DO UPDATE SET
+            attempts    = rollup_scores.attempts + excluded.attempts,
+            pct_sum     = rollup_scores.pct_sum + excluded.pct_sum,
+            correct     = rollup_scores.correct + excluded.correct,
+            wrong       = rollup_scores.wrong + excluded.wrong,
+            unattempted = rollup_scores.unattempted + excluded.unattempted"""
+    QUESTION_UPSERT = """INSERT INTO rollup_questions VALUES(?,?,?,?)
+        ON CONFLICT(question_id) DO UPDATE SET
+            shown    = rollup_questions.shown + excluded.shown,
+            answered = rollup_questions.answered + excluded.answered,
+            correct  = rollup_questions.correct + excluded.correct"""
+    # Dates are stored sortable (YYYY-MM-DD HH:MM), so the later one wins on text
+    MASTERY_UPSERT = """INSERT INTO user_mastery VALUES(?,?,?,?,?,?,?)
+        ON CONFLICT(name,subject,chapter) DO UPDATE SET
+            shown      = user_mastery.shown + excluded.shown,
+            answered   = user_mastery.answered + excluded.answered,
+            correct    = user_mastery.correct + excluded.correct,
+            last_taken = CASE WHEN excluded.last_taken > user_mastery.last_taken
+                              THEN excluded.last_taken ELSE user_mastery.last_taken END"""
+
+    def rollup_watermark(self, name="rollups"):
+        if not DB_PATH.exists(): return 0
+        con = self.connect()
+        row = con.execute("SELECT last_id FROM rollup_state WHERE name=?", (name,)).fetchone()
+        con.close()
+        return row[0] if row else 0
+
+    def apply_rollups(self, old_id, new_id, scores, questions, prune_before):
+        con = self.connect()
+        con.isolation_level = None
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("INSERT OR IGNORE INTO rollup_state VALUES('rollups', 0)")
+        # Compare-and-set: only one process folds a given batch
+        if not con.execute("UPDATE rollup_state SET last_id=? WHERE name='rollups' AND last_id=?",
+                           (new_id, old_id)).rowcount:
+            con.execute("ROLLBACK"); con.close()
+            return False
+        con.executemany(self.ROLLUP_UPSERT, scores)
+        con.executemany(self.QUESTION_UPSERT, questions)
+        con.execute("DELETE FROM rollup_scores WHERE grain='hour' AND bucket<?", (prune_before,))
+        con.execute("COMMIT"); con.close()
+        return True
+
+    def apply_mastery(self, old_id, new_id, rows):
+        con = self.connect()
+        con.isolation_level = None
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("INSERT OR IGNORE INTO rollup_state VALUES('mastery', 0)")
+        if not con.execute("UPDATE rollup_state SET last_id=? WHERE name='mastery' AND last_id=?",
+                           (new_id, old_id)).rowcount:
+            con.execute("ROLLBACK"); con.close()
+            return False
+        con.executemany(self.MASTERY_UPSERT, rows)
+        con.execute("COMMIT"); con.close()
+        return True
+
+    def score_histogram(self, subject, chapter, mode):
+        if not DB_PATH.exists(): return {}
+        con  = self.connect()
+        rows = con.execute("SELECT bin, n FROM score_hist WHERE subject=? AND chapter=? AND mode=?",
+                           (subject, chapter or "", mode)).fetchall()
+        con.close()
+        return dict(rows)
+
+    def backfill_histograms(self, batch):
+        con = self.connect()
+        con.isolation_level = None
+        con.execute("BEGIN IMMEDIATE")
+        row = con.execute("""SELECT b.last_id, h.last_id FROM rollup_state b, rollup_state h
+                             WHERE b.name='histogram_backfill' AND h.name='histograms'""").fetchone()
+        if not row:
+            con.execute("ROLLBACK"); con.close()
+            return False
+        done, end = row
+        hi = min(done + batch, end)
+        con.execute(self.HIST_BACKFILL, (done, hi))
+        if hi < end:
+            con.execute("UPDATE rollup_state SET last_id=? WHERE name='histogram_backfill'", (hi,))
+        else:
+            con.execute("DELETE FROM rollup_state WHERE name='histogram_backfill'")
+        con.execute("COMMIT"); con.close()
+        return hi < end
+
+    # Rows carry merged totals, so a write replaces what was there
+    ENGAGEMENT_UPSERT = """INSERT INTO engagement VALUES(?,?,?,?,?)
+        ON CONFLICT(day,dim,key) DO UPDATE SET tests = excluded.tests, sketch = excluded.sketch"""
+
+    def apply_engagement(self, old_id, new_id, rows):
+        con = self.connect()
+        con.isolation_level = None
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("INSERT OR IGNORE INTO rollup_state VALUES('engagement', 0)")
+        if not con.execute("UPDATE rollup_state SET last_id=? WHERE name='engagement' AND last_id=?",
+                           (new_id, old_id)).rowcount:
+            con.execute("ROLLBACK"); con.close()
+            return False
+        con.executemany(self.ENGAGEMENT_UPSERT, rows)
+        con.execute("COMMIT"); con.close()
+        return True
+
+    def load_engagement(self, since):
+        if not DB_PATH.exists(): return []
+        con  = self.connect()
+        rows = con.execute("SELECT day, dim, key, tests, sketch FROM engagement WHERE day>=?",
+                           (since,)).fetchall()
+        con.close()
+        return rows
+
+    def load_mastery(self, name):
+        if not DB_PATH.exists(): return []
+        con  = self.connect()
+        rows = con.execute(f"SELECT {','.join(MASTERY_KEYS)} FROM user_mastery WHERE name=?",
+                           (name,)).fetchall()
+        con.close()
+        return [dict(zip(MASTERY_KEYS, r)) for r in rows]
+
+    def load_rollups(self, grain, since):
+        if not DB_PATH.exists(): return []
+        con  = self.connect()
+        rows = con.execute(f"SELECT {','.join(ROLLUP_KEYS)} FROM rollup_scores WHERE grain=? AND bucket>=?",
+                           (grain, since)).fetchall()
+        con.close()
+        return [dict(zip(ROLLUP_KEYS, r)) for r in rows]
+
+    def weakest_questions(self, min_answered, limit):
+        if not DB_PATH.exists(): return []
+        con  = self.connect()
+        rows = con.execute("""SELECT question_id, shown, answered, correct FROM rollup_questions
+                              WHERE answered>=? ORDER BY 1.0 * correct / answered, answered DESC
+                              LIMIT ?""", (min_answered, limit)).fetchall()
+        con.close()
+        return rows
+
+    def archived_stats(self, name):
+        if not DB_PATH.exists(): return {}
+        con = self.connect()
+        rows = con.execute("SELECT subject,tests,pct_sum,wrong FROM archived_stats WHERE name=?",
+                           (name,)).fetchall()
+        con.close()
+        return {subj: (tests, pct, wrong) for subj, tests, pct, wrong in rows}
+
+class PostgresStorage(Storage):
+    """A bounded connection pool shared by every session in the process.
+
+    Schema mirrors SQLite with native types. Old attempts are expected to
+    be handled by the server's own partitioning, so there is no archive
+    here and archived_stats is always empty.
+    """
+    def __init__(self, url, pool_size=DB_POOL_SIZE):
+        import psycopg, psycopg_pool
+        self.Error = psycopg.Error
+        self.pool  = psycopg_pool.ConnectionPool(url, min_size=1, max_size=pool_size, open=True)
+        self.ready = False
+
+    def init(self):
+        if self.ready: return
+        with self.pool.connection() as con:
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    name TEXT PRIMARY KEY,
+                    course TEXT NOT NULL,
+                    registered_at TEXT
+                );
+                CREATE TABLE IF NOT EXISTS results (
+                    id          BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                    name        TEXT NOT NULL,
+                    subject     TEXT,
+                    chapter     TEXT,
+                    mode        TEXT,
+                    correct     INTEGER,
+                    wrong       INTEGER,
+                    unattempted INTEGER,
+                    raw_score   DOUBLE PRECISION,
+                    total_marks DOUBLE PRECISION,
+                    percentage  DOUBLE PRECISION,
+                    time_taken  INTEGER,
+                    taken_at    TEXT,
+                    questions   TEXT,
+                    seed        BIGINT,
+                    bank_version TEXT,
+                    answers     TEXT,
+                    course      TEXT
+                );
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    name         TEXT PRIMARY KEY,
+                    subject      TEXT,
+                    chapter      TEXT,
+                    mode         TEXT,
+                    seed         BIGINT,
+                    bank_version TEXT,
+                    positions    BYTEA,
+                    perms        BYTEA,
+                    answers      TEXT,
+                    elapsed      DOUBLE PRECISION,
+                    duration     INTEGER,
+                    updated_at   DOUBLE PRECISION
+                );
+                ALTER TABLE results ADD COLUMN IF NOT EXISTS course TEXT;
+                CREATE INDEX IF NOT EXISTS results_name ON results(name, id);
+                CREATE INDEX IF NOT EXISTS results_rank ON results(percentage DESC, time_taken);
+                CREATE TABLE IF NOT EXISTS rollup_state (
+                    name        TEXT PRIMARY KEY,
+                    last_id     BIGINT
+                );
+                CREATE TABLE IF NOT EXISTS rollup_scores (
+                    grain       TEXT,
+                    bucket      TEXT,
+                    course      TEXT,
+                    subject     TEXT,
+                    chapter     TEXT,
+                    mode        TEXT,
+                    decile      INTEGER,
+                    attempts    INTEGER,
+                    pct_sum     DOUBLE PRECISION,
+                    correct     INTEGER,
+                    wrong       INTEGER,
+                    unattempted INTEGER,
+                    PRIMARY KEY (grain, bucket, course, subject, chapter, mode, decile)
+                );
+                CREATE TABLE IF NOT EXISTS rollup_questions (
+                    question_id TEXT PRIMARY KEY,
+                    shown       INTEGER,
+                    answered    INTEGER,
+                    correct     INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS user_mastery (
+                    name        TEXT NOT NULL,
+                    subject     TEXT NOT NULL,
+                    chapter     TEXT NOT NULL,
+                    shown       INTEGER,
+                    answered    INTEGER,
+                    correct     INTEGER,
+                    last_taken  TEXT,
+                    PRIMARY KEY (name, subject, chapter)
+                );
+                CREATE TABLE IF NOT EXISTS score_hist (
+                    subject     TEXT NOT NULL,
+                    chapter     TEXT NOT NULL,
+                    mode        TEXT NOT NULL,
+                    bin         INTEGER NOT NULL,
+                    n           BIGINT,
+                    PRIMARY KEY (subject, chapter, mode, bin)
+                );
+                CREATE TABLE IF NOT EXISTS engagement (
+                    day         TEXT NOT NULL,
+                    dim         TEXT NOT NULL,
+                    key         TEXT NOT NULL,
+                    tests       BIGINT,
+                    sketch      BYTEA,
+                    PRIMARY KEY (day, dim, key)
+                );
+            """)
+            with con.transaction(), con.cursor() as cur:
+                cur.execute("""INSERT INTO rollup_state SELECT 'histograms', coalesce(max(id), 0) FROM results
+                               ON CONFLICT DO NOTHING RETURNING last_id""")
+                if cur.fetchone() is not None:
+                    cur.execute("INSERT INTO rollup_state VALUES('histogram_backfill', 0) ON CONFLICT DO NOTHING")
+        self.ready = True
+
+    def _fetch(self, sql, args=()):
+        with self.pool.connection() as con:
+            return con.execute(sql, args).fetchall()
+
+    def _write(self, sql, args=()):
+        with self.pool.connection() as con:
+            con.execute(sql, args)
+
+    def save_user(self, name, course):
+        self._write("""INSERT INTO users(name,course,registered_at) VALUES(%s,%s,%s)
+                       ON CONFLICT(name) DO UPDATE SET course=excluded.course""",
+                    (name, course, datetime.datetime.now().isoformat()))
+
+    def load_user(self, name):
+        rows = self._fetch("SELECT course FROM users WHERE name=%s", (name,))
+        return rows[0] if rows else None
+
+    def delete_user(self, name):
+        self._write("DELETE FROM users WHERE name=%s", (name,))
+
+    def save_results(self, rows):
+        # executemany pipelines the statements: one round trip per batch
+        with self.pool.connection() as con, con.cursor() as cur:
+            cur.executemany(f"""INSERT INTO results({",".join(RESULT_COLUMNS)})
+                                VALUES({",".join(["%s"] * len(RESULT_COLUMNS))})""",
+                            [_result_row(r) for r in rows])
+            cur.executemany(SQLiteStorage.HIST_UPSERT.replace("?", "%s"), _hist_rows(rows))
+
+    def load_attempt(self, result_id):
+        rows = self._fetch(f"SELECT {','.join(ATTEMPT_KEYS)} FROM results WHERE id=%s", (result_id,))
+        return dict(zip(ATTEMPT_KEYS,rows[0])) if rows else None
+
+    def save_checkpoints(self, rows):
+        cols = ",".join(CHECKPOINT_KEYS)
+        news = ",".join(f"excluded.{k}" for k in CHECKPOINT_KEYS)
+        with self.pool.connection() as con, con.cursor() as cur:
+            cur.executemany(f"""INSERT INTO checkpoints({cols})
+                                VALUES({",".join(["%s"] * len(CHECKPOINT_KEYS))})
+                                ON CONFLICT(name) DO UPDATE SET ({cols}) = ROW({news})""",
+                            [tuple(r[k] for k in CHECKPOINT_KEYS) for r in rows])
+
+    def load_checkpoint(self, name):
+        rows = self._fetch(f"SELECT {','.join(CHECKPOINT_KEYS)} FROM checkpoints WHERE name=%s", (name,))
+        if not rows: return None
+        cp = dict(zip(CHECKPOINT_KEYS,rows[0]))
+        cp["positions"], cp["perms"] = bytes(cp["positions"]), bytes(cp["perms"])
+        return cp
+
+    def delete_checkpoint(self, name):
+        self._write("DELETE FROM checkpoints WHERE name=%s", (name,))
+
+    def recent_question_ids(self, name, papers):
+        rows = self._fetch("""SELECT questions FROM results
+                   WHERE name=%s AND questions IS NOT NULL AND questions != ''
+                   ORDER BY id DESC LIMIT %s""", (name, papers))
+        return {qid for (qs,) in rows for qid in qs.split(",")}
+
+    def load_user_results(self, name, archived):
+        rows = self._fetch("""SELECT subject,chapter,mode,correct,wrong,unattempted,
+                   raw_score,total_marks,percentage,time_taken,taken_at
+                   FROM results WHERE name=%s ORDER BY id""", (name,))
+        return [dict(zip(HISTORY_KEYS,r)) for r in rows]
+
+    # No archive here, so results alone is what SQLiteStorage.RANKED ranks
+    def leaderboard(self, limit):
+        rows = self._fetch(f"""SELECT {','.join(BOARD_KEYS)} FROM results
+                   ORDER BY percentage DESC, time_taken ASC LIMIT %s""", (limit,))
+        return [dict(zip(BOARD_KEYS,r)) for r in rows]
+
+    def rank(self, name):
+        # Both steps are range scans on results_rank
+        rows = self._fetch("""WITH best AS (
+                   SELECT percentage, time_taken FROM results WHERE name=%s
+                   ORDER BY percentage DESC, time_taken ASC LIMIT 1)
+                   SELECT (SELECT count(*) + 1 FROM results r
+                           WHERE r.percentage > b.percentage
+                              OR (r.percentage = b.percentage AND r.time_taken < b.time_taken))
+                   FROM best b""", (name,))
+        return rows[0][0] if rows else None
+
+    def export_rows(self, after_id, limit):
+        rows = self._fetch(f"""SELECT r.id,{EXPORT_SELECT} FROM results r
+                               LEFT JOIN users u ON u.name = r.name
+                               WHERE r.id>%s ORDER BY r.id LIMIT %s""", (after_id, limit))
+        return [dict(zip(["id", *RESULT_COLUMNS], r)) for r in rows]
+
+    def rollup_watermark(self, name="rollups"):
+        rows = self._fetch("SELECT last_id FROM rollup_state WHERE name=%s", (name,))
+        return rows[0][0] if rows else 0
+
+    def apply_rollups(self, old_id, new_id, scores, questions, prune_before):
+        with self.pool.connection() as con, con.transaction(), con.cursor() as cur:
+            cur.execute("INSERT INTO rollup_state VALUES('rollups', 0) ON CONFLICT DO NOTHING")
+            # Compare-and-set: a concurrent fold of the same batch updates nothing here
+            cur.execute("UPDATE rollup_state SET last_id=%s WHERE name='rollups' AND last_id=%s",
+                        (new_id, old_id))
+            if not cur.rowcount:
+                return False
+            cur.executemany(SQLiteStorage.ROLLUP_UPSERT.replace("?", "%s"), scores)
+            cur.executemany(SQLiteStorage.QUESTION_UPSERT.replace("?", "%s"), questions)
+            cur.execute("DELETE FROM rollup_scores WHERE grain='hour' AND bucket<%s", (prune_before,))
+        return True
+
+    def apply_mastery(self, old_id, new_id, rows):
+        with self.pool.connection() as con, con.transaction(), con.cursor() as cur:
+            cur.execute("INSERT INTO rollup_state VALUES('mastery', 0) ON CONFLICT DO NOTHING")
+            cur.execute("UPDATE rollup_state SET last_id=%s WHERE name='mastery' AND last_id=%s",
+                        (new_id, old_id))
+            if not cur.rowcount:
+                return False
+            cur.executemany(SQLiteStorage.MASTERY_UPSERT.replace("?", "%s"), rows)
+        return True
+
+    def score_histogram(self, subject, chapter, mode):
+        return dict(self._fetch("SELECT bin, n FROM score_hist WHERE subject=%s AND chapter=%s AND mode=%s",
+                                (subject, chapter or "", mode)))
+
+    def backfill_histograms(self, batch):
+        with self.pool.connection() as con, con.transaction(), con.cursor() as cur:
+            cur.execute("""SELECT b.last_id, h.last_id FROM rollup_state b, rollup_state h
+                           WHERE b.name='histogram_backfill' AND h.name='histograms' FOR UPDATE OF b""")
+            if (row := cur.fetchone()) is None:
+                return False
+            done, end = row
+            hi = min(done + batch, end)
+            cur.execute(SQLiteStorage.HIST_BACKFILL.replace("?", "%s"), (done, hi))
+            if hi < end:
+                cur.execute("UPDATE rollup_state SET last_id=%s WHERE name='histogram_backfill'", (hi,))
+            else:
+                cur.execute("DELETE FROM rollup_state WHERE name='histogram_backfill'")
+            return hi < end
+
+    def apply_engagement(self, old_id, new_id, rows):
+        with self.pool.connection() as con, con.transaction(), con.cursor() as cur:
+            cur.execute("INSERT INTO rollup_state VALUES('engagement', 0) ON CONFLICT DO NOTHING")
+            cur.execute("UPDATE rollup_state SET last_id=%s WHERE name='engagement' AND last_id=%s",
+                        (new_id, old_id))
+            if not cur.rowcount:
+                return False
+            cur.executemany(SQLiteStorage.ENGAGEMENT_UPSERT.replace("?", "%s"), rows)
+        return True
+
+    def load_engagement(self, since):
+        return self._fetch("SELECT day, dim, key, tests, sketch FROM engagement WHERE day>=%s", (since,))
+
+    def load_mastery(self, name):
+        rows = self._fetch(f"SELECT {','.join(MASTERY_KEYS)} FROM user_mastery WHERE name=%s", (name,))
+        return [dict(zip(MASTERY_KEYS, r)) for r in rows]
+
+    def load_rollups(self, grain, since):
+        rows = self._fetch(f"SELECT {','.join(ROLLUP_KEYS)} FROM rollup_scores WHERE grain=%s AND bucket>=%s",
+                           (grain, since))
+        return [dict(zip(ROLLUP_KEYS, r)) for r in rows]
+
+    def weakest_questions(self, min_answered, limit):
+        return self._fetch("""SELECT question_id, shown, answered, correct FROM rollup_questions
+                              WHERE answered>=%s ORDER BY 1.0 * correct / answered, answered DESC
+                              LIMIT %s""", (min_answered, limit))
+
+    def archived_stats(self, name):
+        return {}
+
+@st.cache_resource
+def backend():
+    if STORAGE_BACKEND == "postgres":
+        return PostgresStorage(DATABASE_URL)
+    return SQLiteStorage()
+
+@timed("db")
+def db_init():
+    backend().init()
+
+@timed("db")
+def db_save_user(name, course):
+    backend().save_user(name, course)
+
+@timed("db")
+def db_load_user(name):
+    return backend().load_user(name)
+
+@timed("db")
+def db_delete_user(name):
+    backend().delete_user(name)
+
+@timed("db")
+def db_save_result(r):
+    backend().save_results([r])
+
+@timed("db")
+def db_save_results(rows):
+    backend().save_results(rows)
+
+@timed("db")
+def db_load_attempt(result_id):
+    """One stored attempt with everything needed to rebuild and re-score it."""
+    return backend().load_attempt(result_id)
+
+@timed("db")
+def db_save_checkpoints(rows):
+    backend().save_checkpoints(rows)
+
+@timed("db")
+def db_load_checkpoint(name):
+    return backend().load_checkpoint(name)
+
+@timed("db")
+def db_delete_checkpoint(name):
+    backend().delete_checkpoint(name)
+
+@timed("db")
+def db_recent_question_ids(name, papers=5):
+    """Question ids seen by `name` in their last `papers` attempts."""
+    return backend().recent_question_ids(name, papers)
+
+@timed("db")
+def db_load_user_results(name, archived=False):
+    """`name`'s attempts, oldest first; with `archived`, older months too."""
+    return backend().load_user_results(name, archived)
+
+@timed("db")
+def db_leaderboard(limit=25):
+    return backend().leaderboard(limit)
+
+@timed("db")
+def db_user_rank(name):
+    """Leaderboard position of `name`'s best attempt, or None."""
+    return backend().rank(name)
+
+@timed("db")
+def db_export_rows(after_id, limit):
+    """Up to `limit` full results rows with id > `after_id`, in id order."""
+    return backend().export_rows(after_id, limit)
+
+@timed("db")
+def db_rollup_watermark(name="rollups"):
+    return backend().rollup_watermark(name)
+
+@timed("db")
+def db_apply_rollups(old_id, new_id, scores, questions, prune_before):
+    """Fold one batch into the rollups and move the watermark old_id → new_id,
+    atomically; False if another process already folded it."""
+    return backend().apply_rollups(old_id, new_id, scores, questions, prune_before)
+
+@timed("db")
+def db_apply_mastery(old_id, new_id, rows):
+    """Like db_apply_rollups, for the per-user chapter counts."""
+    return backend().apply_mastery(old_id, new_id, rows)
+
+@timed("db")
+def db_score_histogram(subject, chapter, mode):
+    """{score bin: attempts} for one test key; bin = percentage × 10."""
+    return backend().score_histogram(subject, chapter, mode)
+
+@timed("db")
+def db_backfill_histograms(batch):
+    """Count one batch of pre-histogram results; False when none are left."""
+    return backend().backfill_histograms(batch)
+
+@timed("db")
+def db_apply_engagement(old_id, new_id, rows):
+    """Like db_apply_rollups; rows are (day, dim, key, tests, sketch) totals."""
+    return backend().apply_engagement(old_id, new_id, rows)
+
+@timed("db")
+def db_load_engagement(since):
+    """[(day, dim, key, tests, sketch blob)] for days on or after `since`."""
+    return backend().load_engagement(since)
+
+@timed("db")
+def db_load_mastery(name):
+    return backend().load_mastery(name)
+
+@timed("db")
+def db_load_rollups(grain, since):
+    return backend().load_rollups(grain, since)
+
+@timed("db")
+def db_weakest_questions(min_answered=20, limit=15):
+    """(question id, shown, answered, correct) with the lowest accuracy."""
+    return backend().weakest_questions(min_answered, limit)
+
+@timed("db")
+def db_archived_stats(name):
+    """{subject: (tests, percentage sum, wrong answers)} over archived attempts."""
+    return backend().archived_stats(name)
@@ -0,0 +1,336 @@
+"""
+GradeUP look: the stylesheet and its static build.
+"""
+
+import streamlit as st
+import hashlib, json, re
+
+from . import BASE_DIR
+
+# ═══════════════════════════════════════════════════════════════
+# CSS — clean glassmorphism, generous whitespace
+# Poppins is self-hosted (see assets.py); until it is built, text falls
+# back to the system sans-serif.
+# ═══════════════════════════════════════════════════════════════
+CSS = """
+/* ── Animated background ── */
+@keyframes bgPulse {
+  0%   { background-position: 0% 50%; }
+  50%  { background-position: 100% 50%; }
+  100% { background-position: 0% 50%; }
+}
+[data-testid="stAppViewContainer"] {
+  background: linear-gradient(135deg, #0d1b2a 0%, #1b2d45 30%, #0f3460 60%, #16213e 100%);
+  background-size: 400% 400%;
+  animation: bgPulse 20s ease infinite;
+  min-height: 100vh;
+}
+.stApp > header { background: transparent !important; }
+
+/* ── Main content area ── */
+.block-container {
+  max-width: 860px !important;
+  margin: 2rem auto !important;
+  padding: 2.5rem 3rem !important;
+  background: rgba(255,255,255,0.06) !important;
+  backdrop-filter: blur(24px) !important;
+  -webkit-backdrop-filter: blur(24px) !important;
+  border: 1px solid rgba(255,255,255,0.10) !important;
+  border-radius: 32px !important;
+  box-shadow: 0 20px 60px rgba(0,0,0,0.4) !important;
+}
+
+/* ── Sidebar ── */
+section[data-testid="stSidebar"] {
+  background: rgba(10,20,40,0.75) !important;
+  backdrop-filter: blur(20px) !important;
+  -webkit-backdrop-filter: blur(20px) !important;
+  border-right: 1px solid rgba(255,255,255,0.08) !important;
+  border-radius: 0 28px 28px 0 !important;
+}
+section[data-testid="stSidebar"] .block-container {
+  background: transparent !important;
+  border: none !important;
+  box-shadow: none !important;
+  padding: 1.5rem 1.2rem !important;
+  margin: 0 !important;
+}
+
+/* ── Buttons ── */
+.stButton > button {
+  font-family: 'Poppins', sans-serif !important;
+  font-weight: 600 !important;
+  font-size: 0.92rem !important;
+  color: white !important;
+  background: rgba(255,255,255,0.12) !important;
+  border: 1px solid rgba(255,255,255,0.20) !important;
+  border-radius: 999px !important;
+  padding: 0.65rem 2rem !important;
+  min-height: 46px !important;
+  letter-spacing: 0.02em !important;
+  transition: all 0.25s ease !important;
+  width: 100% !important;
+}
+.stButton > button:hover {
+  background: rgba(255,255,255,0.22) !important;
+  border-color: rgba(255,255,255,0.35) !important;
+  transform: translateY(-1px) !important;
+  box-shadow: 0 8px 24px rgba(0,0,0,0.25) !important;
+}
+.stButton > button:active {
+  transform: translateY(0px) !important;
+}
+
+/* ── Inputs ── */
+[data-testid="stTextInput"] > div > div {
+  background: rgba(255,255,255,0.09) !important;
+  border: 1px solid rgba(255,255,255,0.18) !important;
+  border-radius: 16px !important;
+}
+[data-testid="stTextInput"] input {
+  color: #fff !important;
+  font-family: 'Poppins', sans-serif !important;
+  font-size: 0.95rem !important;
+  background: transparent !important;
+  caret-color: #7ecfff !important;
+}
+[data-testid="stTextInput"] input::placeholder {
+  color: rgba(255,255,255,0.35) !important;
+}
+[data-testid="stTextInput"] label,
+[data-testid="stSelectbox"] label {
+  color: rgba(255,255,255,0.7) !important;
+  font-family: 'Poppins', sans-serif !important;
+  font-size: 0.82rem !important;
+  font-weight: 500 !important;
+  letter-spacing: 0.04em !important;
+  text-transform: uppercase !important;
+}
+
+/* ── Selectbox ── */
+[data-testid="stSelectbox"] > div > div {
+  background: rgba(255,255,255,0.09) !important;
+  border: 1px solid rgba(255,255,255,0.18) !important;
+  border-radius: 16px !important;
+  color: white !important;
+  font-family: 'Poppins', sans-serif !important;
+}
+
+/* ── Radio options ── */
+.stRadio > div { gap: 0.5rem !important; }
+.stRadio > div > label {
+  background: rgba(255,255,255,0.05) !important;
+  border: 1px solid rgba(255,255,255,0.10) !important;
+  border-radius: 14px !important;
+  padding: 0.8rem 1.2rem !important;
+  color: rgba(255,255,255,0.88) !important;
+  font-family: 'Poppins', sans-serif !important;
+  font-size: 0.9rem !important;
+  transition: all 0.2s ease !important;
+  cursor: pointer !important;
+  min-height: 48px !important;
+}
+.stRadio > div > label:hover {
+  background: rgba(126,207,255,0.12) !important;
+  border-color: rgba(126,207,255,0.3) !important;
+}
+
+/* ── Typography ── */
+h1,h2,h3,h4 {
+  color: white !important;
+  font-family: 'Poppins', sans-serif !important;
+  font-weight: 700 !important;
+}
+p, div, span, li {
+  font-family: 'Poppins', sans-serif;
+  color: rgba(255,255,255,0.85);
+}
+hr { border-color: rgba(255,255,255,0.10) !important; margin: 1.5rem 0 !important; }
+footer { visibility: hidden !important; }
+
+/* ── Info / Warning overrides ── */
+.stAlert { border-radius: 16px !important; }
+
+/* ── Question card ── */
+.q-wrap {
+  background: rgba(255,255,255,0.04);
+  border: 1px solid rgba(255,255,255,0.09);
+  border-radius: 20px;
+  padding: 1.4rem 1.6rem 0.6rem;
+  margin-bottom: 1.8rem;
+}
+.q-meta {
+  font-size: 0.7rem;
+  color: rgba(255,255,255,0.35);
+  margin-bottom: 0.5rem;
+  text-transform: uppercase;
+  letter-spacing: 0.06em;
+}
+.q-text {
+  font-size: 0.98rem;
+  font-weight: 600;
+  color: white;
+  line-height: 1.55;
+  margin-bottom: 1rem;
+}
+.diff-hard {
+  display: inline-block;
+  background: rgba(255,70,70,0.18);
+  color: #ffaaaa;
+  border: 1px solid rgba(255,70,70,0.28);
+  border-radius: 999px;
+  font-size: 0.65rem;
+  font-weight: 700;
+  padding: 0.1rem 0.55rem;
+  margin-left: 0.4rem;
+  vertical-align: middle;
+  letter-spacing: 0.05em;
+}
+.diff-medium {
+  display: inline-block;
+  background: rgba(255,190,50,0.18);
+  color: #ffd97d;
+  border: 1px solid rgba(255,190,50,0.28);
+  border-radius: 999px;
+  font-size: 0.65rem;
+  font-weight: 700;
+  padding: 0.1rem 0.55rem;
+  margin-left: 0.4rem;
+  vertical-align: middle;
+  letter-spacing: 0.05em;
+}
+
+/* ── Pill badge ── */
+.pill {
+  display: inline-block;
+  background: rgba(255,255,255,0.10);
+  border: 1px solid rgba(255,255,255,0.16);
+  border-radius: 999px;
+  padding: 0.25rem 0.85rem;
+  font-size: 0.78rem;
+  color: rgba(255,255,255,0.75);
+}
+
+/* ── Timer ── */
+.timer-ok {
+  background: rgba(50,200,120,0.18);
+  border: 1px solid rgba(50,200,120,0.3);
+  border-radius: 999px;
+  padding: 0.4rem 1.2rem;
+  font-size: 1rem;
+  font-weight: 700;
+  color: #7dffc0;
+  display: inline-block;
+}
+.timer-warn {
+  background: rgba(255,60,60,0.20);
+  border: 1px solid rgba(255,60,60,0.35);
+  border-radius: 999px;
+  padding: 0.4rem 1.2rem;
+  font-size: 1rem;
+  font-weight: 700;
+  color: #ffaaaa;
+  display: inline-block;
+  animation: pulse 1s ease-in-out infinite;
+}
+@keyframes pulse { 0%,100%{opacity:1;} 50%{opacity:0.6;} }
+
+/* ── Marking banner ── */
+.marking-banner {
+  background: rgba(255,190,50,0.08);
+  border: 1px solid rgba(255,190,50,0.20);
+  border-radius: 14px;
+  padding: 0.7rem 1.2rem;
+  font-size: 0.82rem;
+  color: #ffd97d;
+  margin-bottom: 2rem;
+}
+
+/* ── Stat card ── */
+.stat-card {
+  background: rgba(255,255,255,0.06);
+  border: 1px solid rgba(255,255,255,0.10);
+  border-radius: 20px;
+  padding: 1.4rem 1rem;
+  text-align: center;
+}
+.stat-num { font-size: 2.2rem; font-weight: 800; color: white; line-height: 1; }
+.stat-label { font-size: 0.72rem; color: rgba(255,255,255,0.45); margin-top: 0.3rem; text-transform: uppercase; letter-spacing: 0.06em; }
+
+/* ── Result card ── */
+.result-card {
+  background: rgba(255,255,255,0.06);
+  border: 1px solid rgba(255,255,255,0.12);
+  border-radius: 28px;
+  padding: 2.5rem 2rem;
+  text-align: center;
+  margin-bottom: 2rem;
+}
+
+/* ── Watermark ── */
+.wm-landing {
+  text-align: center;
+  font-family: 'Poppins', sans-serif;
+  font-size: 1rem;
+  font-weight: 600;
+  color: rgba(255,255,255,0.65);
+  letter-spacing: 0.04em;
+  padding: 1.5rem 0 0.5rem;
+}
+.wm-footer {
+  text-align: center;
+  font-family: 'Poppins', sans-serif;
+  font-size: 0.75rem;
+  color: rgba(255,255,255,0.28);
+  padding: 2.5rem 0 0.5rem;
+}
+
+/* ── Subject grid button override ── */
+.subj-btn .stButton > button {
+  height: 90px !important;
+  font-size: 1rem !important;
+  font-weight: 600 !important;
+}
+
+/* ── Mobile ── */
+@media(max-width:768px){
+  .block-container { padding:1.5rem 1.2rem !important; border-radius:20px !important; margin:0.5rem !important; }
+  .stButton > button { min-height:52px !important; }
+  h1 { font-size:1.7rem !important; }
+  h2 { font-size:1.3rem !important; }
+}
+"""
+
+# ═══════════════════════════════════════════════════════════════
+# STATIC ASSETS
+# assets.py writes the minified stylesheet and subsetted fonts under
+# static/ with content-hashed names, plus a manifest naming them and the
+# CSS they were built from. Each rerun then sends a <link> to the file
+# (cached by the browser) instead of the whole stylesheet; a missing or
+# stale build falls back to inlining the minified CSS.
+# ═══════════════════════════════════════════════════════════════
+STATIC_DIR     = BASE_DIR / "static"
+ASSET_MANIFEST = STATIC_DIR / "manifest.json"
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def css_digest():
+    return hashlib.blake2b(CSS.encode(), digest_size=8).hexdigest()
+
+@st.cache_resource
+def stylesheet():
+    """Markup that styles the app: a link to the built stylesheet, or inline CSS."""
+    try:
+        manifest = json.loads(ASSET_MANIFEST.read_text())
+        if manifest["source"] == css_digest() and (STATIC_DIR / manifest["css"]).exists():
+            return f'<link rel="stylesheet" href="app/static/{manifest["css"]}">'
+    except (OSError, ValueError, KeyError):
+        pass
+    return f"<style>{minify_css(CSS)}</style>"
+
+WM_LANDING = '<div class="wm-landing">Made with love ❤️ for NAUSHERA</div>'
+WM_FOOTER  = '<div class="wm-footer">Made with love ❤️ for NAUSHERA</div>'
@@ -0,0 +1,51 @@
+"""
+GradeUP multi-process launcher
+- Compiles the question bank once into a read-only segment
+- Starts one Streamlit worker per core on consecutive ports
+- Workers mmap the shared bank and keep session state in the shared store,
+  so any worker can serve any session behind a load balancer
+
+    python serve.py --workers 4 --port 8501
+"""
+
+import argparse, os, pathlib, secrets, subprocess, sys, tempfile
+
+from gradeup import BASE_DIR
+from gradeup.bank import compile_bank
+
+SHM_DIR = pathlib.Path("/dev/shm")
+
+
+def main():
+    default_seg = (SHM_DIR if SHM_DIR.is_dir() else pathlib.Path(tempfile.gettempdir())) / "gradeup-bank.seg"
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--port",    type=int, default=8501, help="first worker port")
+    ap.add_argument("--segment", type=pathlib.Path, default=default_seg)
+    ap.add_argument("--dedupe",  action="store_true", help="merge near-duplicate questions (see dedup.py)")
+    args = ap.parse_args()
+
+    merged = compile_bank(args.segment, dedupe=args.dedupe)
+    if merged:
+        print(f"GradeUP: merged {len(merged)} near-duplicate clusters")
+    env = {**os.environ,
+           "GRADEUP_BANK_SEGMENT":    str(args.segment),
+           "GRADEUP_SESSION_BACKEND": os.environ.get("GRADEUP_SESSION_BACKEND", "sqlite"),
+           "GRADEUP_SESSION_SECRET":  os.environ.get("GRADEUP_SESSION_SECRET") or secrets.token_hex(32)}
+    procs = [subprocess.Popen([sys.executable, "-m", "streamlit", "run", str(BASE_DIR / "app.py"),
+                               "--server.port", str(args.port + i), "--server.headless", "true",
+                               "--server.enableStaticServing", "true"],
+                              env=env)
+             for i in range(args.workers)]
+    print(f"GradeUP: {args.workers} workers on ports {args.port}–{args.port + args.workers - 1}, "
+          f"bank segment {args.segment}")
+    try:
+        for p in procs:
+            p.wait()
+    except KeyboardInterrupt:
+        for p in procs:
+            p.terminate()
+
+
+if __name__ == "__main__":
+    main()
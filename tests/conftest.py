@@ -0,0 +1,34 @@
+"""
+Shared fixtures. gradeup reads its paths from the environment at import, so
+they point at a scratch directory before any test module imports it.
+"""
+
+import os, tempfile
+
+SCRATCH = tempfile.mkdtemp(prefix="gradeup-tests-")
+os.environ.setdefault("GRADEUP_DB",          os.path.join(SCRATCH, "gradeup.db"))
+os.environ.setdefault("GRADEUP_SESSION_DB",  os.path.join(SCRATCH, "sessions.db"))
+os.environ.setdefault("GRADEUP_ARCHIVE_DIR", os.path.join(SCRATCH, "archive"))
+os.environ.setdefault("GRADEUP_TIMER_TICK",  "0")
+
+import pytest
+
+from gradeup import analytics, storage
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """A fresh, initialised SQLite database behind the db_* helpers."""
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "gradeup.db")
+    monkeypatch.setattr(storage, "ARCHIVE_DIR", tmp_path / "archive")
+    monkeypatch.setattr(analytics, "ARCHIVE_DIR", tmp_path / "archive")
+    storage.SQLiteStorage().init()
+    return tmp_path / "gradeup.db"
+
+def make_result(name, subject="Mathematics", percentage=50.0, time_taken=600, **extra):
+    """A result dict as pages._save_result builds it, for 10 questions."""
+    correct = round(percentage / 10)
+    return {"name": name, "subject": subject, "chapter": "Algebra", "mode": "chapter",
+            "correct": correct, "wrong": 10 - correct, "unattempted": 0,
+            "raw_score": correct * 4.0, "total_marks": 40, "percentage": percentage,
+            "time_taken": time_taken, "taken_at": "15 Jan 2026 10:00", "questions": [],
+            "seed": None, "bank_version": None, "answer_codes": None, "course": "NDA", **extra}
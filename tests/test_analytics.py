@@ -0,0 +1,128 @@
+import collections, datetime, math, sqlite3
+
+import pytest
+
+from gradeup import analytics, storage
+from gradeup.storage import (db_archived_stats, db_leaderboard, db_load_attempt, db_load_user_results,
+                             db_save_results, db_user_rank)
+from tests.conftest import make_result
+
+# ─── archival ──────────────────────────────────────────────────
+NOW   = datetime.datetime(2026, 6, 1)
+USERS = ["asha", "bilal", "chen", "dev"]
+
+def history():
+    """Attempts in id (= time) order. Before the cutoff each (user, subject)
+    has a single attempt — archived months keep only the best per pair, so
+    this is what lets the whole leaderboard compare equal afterwards."""
+    rows, t = [], 100
+    old = [("2025-09-10", "asha", "Mathematics", 72.5), ("2025-09-21", "bilal", "English", 90.0),
+           ("2025-10-02", "chen", "Mathematics", 72.5), ("2025-10-30", "asha", "English", 40.0),
+           ("2025-11-11", "dev", "Mathematics", 95.0), ("2025-11-25", "bilal", "Mathematics", 55.0)]
+    new = [("2026-03-01", name, subject, 30.0 + 7 * i) for i, (name, subject) in
+           enumerate((n, s) for n in USERS for s in ("Mathematics", "English"))]
+    for day, name, subject, pct in old + new:
+        t += 7
+        taken = datetime.datetime.fromisoformat(day).strftime(analytics.TAKEN_FMT)
+        rows.append(make_result(name, subject, pct, time_taken=t, taken_at=taken))
+    return rows, len(old)
+
+def totals(name):
+    """{subject: (tests, percentage sum, wrong)} across hot and archived attempts."""
+    per = collections.defaultdict(lambda: [0, 0.0, 0])
+    for subject, (tests, pct, wrong) in db_archived_stats(name).items():
+        per[subject] = [tests, pct, wrong]
+    for r in db_load_user_results(name):
+        acc = per[r["subject"]]
+        acc[0] += 1; acc[1] += r["percentage"]; acc[2] += r["wrong"]
+    return {s: (n, pytest.approx(pct), wrong) for s, (n, pct, wrong) in per.items()}
+
+def test_archive_moves_old_rows_and_keeps_totals(sqlite_db):
+    rows, n_old = history()
+    db_save_results(rows)
+    board  = db_leaderboard(100)
+    ranks  = {name: db_user_rank(name) for name in USERS}
+    before = {name: totals(name) for name in USERS}
+    full   = {name: db_load_user_results(name) for name in USERS}
+
+    moved = analytics.archive_results(days=180, now=NOW)
+
+    assert moved == {"2025-09": 2, "2025-10": 2, "2025-11": 2}
+    with sqlite3.connect(storage.DB_PATH) as con:
+        assert con.execute("SELECT min(id), count(*) FROM results").fetchone() == (n_old + 1, len(rows) - n_old)
+        assert con.execute("SELECT month, first_id, last_id, rows FROM archives ORDER BY month").fetchall() \
+            == [("2025-09", 1, 2, 2), ("2025-10", 3, 4, 2), ("2025-11", 5, 6, 2)]
+    with sqlite3.connect(storage.ARCHIVE_DIR / "results-2025-10.db") as con:
+        assert con.execute("SELECT id, name FROM results ORDER BY id").fetchall() == [(3, "chen"), (4, "asha")]
+
+    assert db_leaderboard(100) == board
+    assert {name: db_user_rank(name) for name in USERS} == ranks
+    assert {name: totals(name) for name in USERS} == before
+    assert {name: db_load_user_results(name, archived=True) for name in USERS} == full
+    assert db_load_attempt(3)["name"] == "chen"
+
+    # Nothing newly old: a second run moves nothing
+    assert analytics.archive_results(days=180, now=NOW) == {}
+
+def test_archive_keeps_the_best_of_repeated_attempts(sqlite_db):
+    old = [("asha", "Mathematics", 60.0, 300), ("asha", "Mathematics", 80.0, 500),
+           ("asha", "Mathematics", 80.0, 400), ("bilal", "Mathematics", 85.0, 200),
+           ("bilal", "Mathematics", 70.0, 100), ("chen", "English", 75.0, 350)]
+    new = [("asha", "English", 65.0, 600), ("dev", "Mathematics", 78.0, 450),
+           ("bilal", "Mathematics", 60.0, 250)]
+    taken = {"2025-10-05": old, "2026-03-01": new}
+    db_save_results([make_result(name, subject, pct, time_taken=t,
+                                 taken_at=datetime.datetime.fromisoformat(day).strftime(analytics.TAKEN_FMT))
+                     for day, rows in taken.items() for name, subject, pct, t in rows])
+    board  = db_leaderboard(100)
+    ranks  = {name: db_user_rank(name) for name in USERS}
+    before = {name: totals(name) for name in USERS}
+
+    assert analytics.archive_results(days=180, now=NOW) == {"2025-10": 6}
+
+    # Old attempts other than each pair's best (faster on ties) leave the board
+    dropped = {("asha", 60.0, 300), ("asha", 80.0, 500), ("bilal", 70.0, 100)}
+    assert db_leaderboard(100) == [r for r in board
+                                   if (r["name"], r["percentage"], r["time_taken"]) not in dropped]
+    after = {name: db_user_rank(name) for name in USERS}
+    assert after == {"asha": 2, "bilal": 1, "chen": 4, "dev": 3}
+    assert all(after[name] <= ranks[name] for name in USERS)
+    assert {name: totals(name) for name in USERS} == before
+
+def test_a_failed_month_rolls_back(sqlite_db):
+    rows, _ = history()
+    db_save_results(rows)
+    with sqlite3.connect(storage.DB_PATH) as con:
+        con.execute("""CREATE TRIGGER fail BEFORE INSERT ON archives
+                       WHEN NEW.month = '2025-10' BEGIN SELECT RAISE(ABORT, 'disk full'); END""")
+    with pytest.raises(sqlite3.IntegrityError, match="disk full"):
+        analytics.archive_results(days=180, now=NOW)
+    with sqlite3.connect(storage.DB_PATH) as con:
+        assert con.execute("SELECT min(id) FROM results").fetchone() == (3,)
+        assert con.execute("SELECT month FROM archives").fetchall() == [("2025-09",)]
+        con.execute("DROP TRIGGER fail")
+    assert analytics.archive_results(days=180, now=NOW) == {"2025-10": 2, "2025-11": 2}
+
+# ─── engagement sketches ───────────────────────────────────────
+# Standard error is 1.04/sqrt(m) ≈ 1.6%; hashing is deterministic, so a
+# 4-sigma bound is a fixed check rather than a flaky one
+HLL_BOUND = 4 * 1.04 / math.sqrt(analytics.HLL_M)
+
+def sketch(names):
+    h = analytics.HyperLogLog()
+    for name in names:
+        h.add(name)
+    return h
+
+@pytest.mark.parametrize("n", [10, 1_000, 20_000, 100_000])
+def test_hll_error_within_bounds(n):
+    assert abs(sketch(f"user{i}" for i in range(n)).count() - n) <= max(1, HLL_BOUND * n)
+
+def test_hll_ignores_repeats():
+    assert sketch(f"user{i % 500}" for i in range(5_000)).count() == sketch(f"user{i}" for i in range(500)).count()
+
+def test_hll_merge_counts_the_union_and_survives_storage():
+    week = sketch(f"user{i}" for i in range(0, 30_000))
+    day  = analytics.HyperLogLog.from_blob(sketch(f"user{i}" for i in range(20_000, 50_000)).to_blob())
+    assert abs(week.merge(day).count() - 50_000) <= HLL_BOUND * 50_000
+    assert analytics.HyperLogLog.from_blob(week.to_blob()).count() == week.count()
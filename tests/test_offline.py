@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from gradeup.offline import OFFLINE_GRACE, check_submission, fnv1a
+
+TOKEN     = "0123456789abcdef"
+QUESTIONS = [{"options": ["a", "b", "c", "d"]}] * 3
+DEADLINE  = 1_000_000.0
+
+def payload(codes, token=TOKEN):
+    return {"token": token, "answers": codes, "checksum": fnv1a(f"{token}:{codes}")}
+
+def test_accepts_a_valid_submission_within_the_grace_period():
+    assert check_submission(payload("0-3"), TOKEN, QUESTIONS, DEADLINE, now=DEADLINE) == ("0-3", None)
+    assert check_submission(payload("0-3"), TOKEN, QUESTIONS, DEADLINE,
+                            now=DEADLINE + OFFLINE_GRACE)[0] == "0-3"
+    assert check_submission(payload("---"), TOKEN, QUESTIONS, time.time())[0] == "---"
+
+def test_rejects_another_papers_token():
+    codes, reason = check_submission(payload("0-3", token="fedcba9876543210"), TOKEN, QUESTIONS,
+                                     DEADLINE, now=DEADLINE)
+    assert codes is None and "different paper" in reason
+
+def test_rejects_a_bad_checksum():
+    damaged = {**payload("0-3"), "answers": "1-3"}
+    codes, reason = check_submission(damaged, TOKEN, QUESTIONS, DEADLINE, now=DEADLINE)
+    assert codes is None and "damaged" in reason
+
+@pytest.mark.parametrize("codes", ["0-", "0-34", "0-9", "0x3", None])
+def test_rejects_an_incomplete_sheet(codes):
+    sheet = {"token": TOKEN, "answers": codes, "checksum": fnv1a(f"{TOKEN}:{codes}")}
+    assert check_submission(sheet, TOKEN, QUESTIONS, DEADLINE, now=DEADLINE)[0] is None
+
+def test_rejects_a_submission_after_the_grace_period():
+    codes, reason = check_submission(payload("0-3"), TOKEN, QUESTIONS, DEADLINE,
+                                     now=DEADLINE + OFFLINE_GRACE + 1)
+    assert codes is None and "after the test closed" in reason
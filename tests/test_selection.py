@@ -0,0 +1,136 @@
+import array, random
+
+import pytest
+
+from gradeup import bank, selection
+from gradeup.questions import Q
+from gradeup.scoring import calculate_score
+from gradeup.storage import db_save_result
+from tests.conftest import make_result
+
+@pytest.fixture
+def big_bank(monkeypatch):
+    """A flat bank past the uint16 range (positions only; no chapters)."""
+    questions = [{**Q(f"question {i}", ["a", "b", "c", "d"], i % 4), "id": f"q{i}"}
+                 for i in range(70_000)]
+    monkeypatch.setattr(bank, "BANK_LIST", questions)
+    monkeypatch.setattr(bank, "BANK_POS", {q["id"]: i for i, q in enumerate(questions)})
+    return questions
+
+def test_positions_past_65535_survive_serialisation(big_bank):
+    ids = ["q3", "q65535", "q65536", "q69999"]
+    seed, positions, perms = selection.variant_from_ids(ids, seed=11)
+    assert list(positions) == [3, 65535, 65536, 69999]
+
+    restored = array.array(selection.POSITION_TYPE)
+    restored.frombytes(positions.tobytes())
+    questions = selection.materialize((seed, restored, perms))
+    assert [q["question"] for q in questions] == [f"question {i}" for i in (3, 65535, 65536, 69999)]
+    assert all(q["options"][q["correct"]] == "abcd"[i % 4]
+               for q, i in zip(questions, (3, 65535, 65536, 69999)))
+
+# ─── seeded attempts ───────────────────────────────────────────
+KEYS = [("chapter", "Mathematics", "Trigonometry & Geometry"), ("full", "General Science", None),
+        ("paper", "NDA GAT Mini", None)]
+
+@pytest.mark.parametrize("key", KEYS, ids=lambda k: k[0])
+def test_same_seed_rebuilds_questions_and_option_order(key):
+    first  = selection.materialize(selection.build_variant(key, 1234))
+    again  = selection.materialize(selection.build_variant(key, 1234))
+    other  = selection.materialize(selection.build_variant(key, 1235))
+    assert [(q["id"], q["options"], q["correct"]) for q in first] \
+        == [(q["id"], q["options"], q["correct"]) for q in again]
+    assert [(q["id"], q["options"]) for q in first] != [(q["id"], q["options"]) for q in other]
+
+@pytest.mark.parametrize("key", KEYS[:2], ids=lambda k: k[0])
+def test_sampling_positions_draws_what_sampling_the_pool_did(key):
+    mode, subject, chapter = key
+    pool = [q for ch, qs in bank.QUESTION_BANK[subject].items() if chapter in (None, ch) for q in qs]
+    k    = min(50, len(pool)) if mode == "chapter" else len(pool)
+    assert selection.select_questions(subject, chapter, mode, random.Random(3)) \
+        == random.Random(3).sample(pool, k)
+
+def test_option_order_replays_over_a_stored_question_list():
+    seed, positions, perms = selection.build_variant(KEYS[1], 99)
+    ids = [bank.BANK_LIST[p]["id"] for p in positions]
+    assert selection.variant_from_ids(ids, seed) == (seed, positions, perms)
+
+@pytest.mark.parametrize("key", KEYS, ids=lambda k: k[0])
+def test_rescore_matches_the_stored_score(key, sqlite_db):
+    mode, subject, chapter = key
+    variant   = selection.build_variant(key, 4321)
+    questions = selection.materialize(variant)
+    rng       = random.Random(7)
+    answers   = {i: rng.choice(q["options"] + [None]) for i, q in enumerate(questions)}
+    score     = calculate_score(questions, answers)
+    db_save_result({"name": "asha", "subject": subject, "chapter": chapter or "Full Mock", "mode": mode,
+                    **score, "time_taken": 600, "taken_at": "15 Jan 2026 10:00",
+                    "questions": [q["id"] for q in questions], "seed": variant[0],
+                    "bank_version": bank.BANK_VERSION, "course": "NDA",
+                    "answer_codes": selection.encode_answers(questions, answers)})
+
+    rebuilt, rebuilt_answers = selection.rebuild_attempt(selection.db_load_attempt(1))
+    assert [q["options"] for q in rebuilt] == [q["options"] for q in questions]
+    assert rebuilt_answers == answers
+    assert selection.rescore_attempt(1) == score
+
+def test_rebuild_refuses_another_bank_version(sqlite_db):
+    db_save_result(make_result("asha", seed=1, bank_version="stale", questions=["x"], answer_codes="0"))
+    with pytest.raises(ValueError, match="bank stale"):
+        selection.rescore_attempt(1)
+
+# ─── blueprint papers ──────────────────────────────────────────
+YEARS = [f"NDA {y}" for y in range(2019, 2024)]
+
+@pytest.fixture
+def roomy_bank(monkeypatch):
+    """40 Hard and 40 Medium questions per chapter, spread evenly over YEARS,
+    so every blueprint quota can be met without repair."""
+    built = {subj: {ch: [Q(f"{ch} {diff} {i}", ["a", "b", "c", "d"], 0, diff, "", YEARS[i % len(YEARS)])
+                         for diff in ("Hard", "Medium") for i in range(40)]
+                    for ch in chapters}
+             for subj, chapters in bank.CHAPTERS.items()}
+    flat, positions, version = bank.index_bank(built)
+    monkeypatch.setattr(bank, "QUESTION_BANK", built)
+    monkeypatch.setattr(bank, "BANK_LIST", flat)
+    monkeypatch.setattr(bank, "BANK_POS", positions)
+    selection.blueprint_index.clear()
+    yield built
+    selection.blueprint_index.clear()
+
+def sections_of(name, ids):
+    out = []
+    for sec in selection.BLUEPRINTS[name]["sections"]:
+        out.append([bank.BANK_LIST[bank.BANK_POS[qid]] for qid in ids[:sec["count"]]])
+        ids = ids[sec["count"]:]
+    return out
+
+@pytest.mark.parametrize("name", list(selection.BLUEPRINTS))
+def test_paper_meets_section_and_difficulty_quotas(name, roomy_bank):
+    bp  = selection.BLUEPRINTS[name]
+    ids = selection.generate_paper(name, (), random.Random(5))
+    assert len(ids) == len(set(ids)) == selection.blueprint_size(name)
+    for sec, qs in zip(bp["sections"], sections_of(name, ids)):
+        assert {q["subject"] for q in qs} == {sec["subject"]}
+        if sec.get("chapter"):
+            assert {q["chapter"] for q in qs} == {sec["chapter"]}
+        # Explicit mix, or the bank's own (even here)
+        mix  = bp.get("difficulty") or {"Hard": 1, "Medium": 1}
+        want = selection._apportion(sec["count"], mix)
+        got  = {d: sum(q["difficulty"] == d for q in qs) for d in want}
+        assert got == want
+
+def test_paper_balances_years(roomy_bank):
+    ids   = selection.generate_paper("NDA GAT", (), random.Random(8))
+    years = [bank.BANK_LIST[bank.BANK_POS[qid]]["year"] for qid in ids]
+    counts = [years.count(y) for y in YEARS]
+    assert max(counts) - min(counts) <= 1
+
+def test_paper_prefers_fresh_questions_then_tops_up(roomy_bank):
+    english = [q["id"] for q in roomy_bank["English"]["Grammar & Vocabulary"]]
+    recent  = set(english[::2])                 # 40 of the 80 seen recently
+    ids     = selection.generate_paper("NDA GAT", recent, random.Random(3))
+    section = set(ids[:50])
+    assert set(english) - recent <= section     # every fresh one used
+    assert len(section & recent) == 10          # the shortfall from recent ones
+    assert len(ids) == selection.blueprint_size("NDA GAT")
@@ -0,0 +1,39 @@
+import pytest
+
+from gradeup import sessions
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(sessions.time, "time", lambda: now[0])
+    return now
+
+@pytest.fixture(params=["memory", "sqlite"])
+def session_store(request, tmp_path, clock):
+    if request.param == "memory":
+        return sessions.MemorySessionStore()
+    return sessions.SQLiteSessionStore(tmp_path / "sessions.db")
+
+def test_sessions_expire_after_the_last_save(session_store, clock):
+    session_store.save("a", {"name": b'"asha"'})
+    clock[0] += sessions.SESSION_TTL - 1
+    session_store.save("a", {"page": b'"test"'})
+    clock[0] += sessions.SESSION_TTL - 1
+    # Unchanged keys live as long as the session keeps saving
+    assert session_store.load("a") == {"name": b'"asha"', "page": b'"test"'}
+    clock[0] += 2
+    assert session_store.load("a") == {}
+    session_store.save("a", {"page": b'"dashboard"'})
+    assert session_store.load("a") == {"page": b'"dashboard"'}
+
+def test_saving_prunes_expired_sessions(session_store, clock):
+    for sid in ("a", "b"):
+        session_store.save(sid, {"name": b'"x"'})
+    clock[0] += sessions.SESSION_TTL + sessions.SESSION_PRUNE
+    session_store.save("c", {"name": b'"y"'})
+    if isinstance(session_store, sessions.MemorySessionStore):
+        assert set(session_store.data) == {"c"}
+    else:
+        con = sessions.sqlite3.connect(session_store.path)
+        assert con.execute("SELECT DISTINCT sid FROM sessions").fetchall() == [("c",)]
+        con.close()
@@ -0,0 +1,154 @@
+"""
+One suite for every Storage backend: SQLite always, PostgreSQL when
+GRADEUP_PG_DSN points at a scratch database (its tables are truncated).
+"""
+
+import os
+
+import pytest
+
+from gradeup import storage
+from tests.conftest import make_result
+
+PG_DSN    = os.environ.get("GRADEUP_PG_DSN")
+PG_TABLES = ["users", "results", "checkpoints", "rollup_state", "rollup_scores",
+             "rollup_questions", "user_mastery", "score_hist", "engagement"]
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def store(request, sqlite_db):
+    if request.param == "sqlite":
+        yield storage.SQLiteStorage()
+        return
+    if not PG_DSN:
+        pytest.skip("set GRADEUP_PG_DSN to run the suite against PostgreSQL")
+    backend = storage.PostgresStorage(PG_DSN, pool_size=2)
+    backend.init()
+    with backend.pool.connection() as con:
+        con.execute(f"TRUNCATE {', '.join(PG_TABLES)} RESTART IDENTITY")
+    yield backend
+    backend.pool.close()
+
+def connect(store):
+    """A raw connection on the store's database; commits on leaving `with`."""
+    if isinstance(store, storage.SQLiteStorage):
+        return store.connect()
+    return store.pool.connection()
+
+def test_backends_implement_the_interface():
+    assert issubclass(storage.SQLiteStorage, storage.Storage)
+    assert issubclass(storage.PostgresStorage, storage.Storage)
+    assert not storage.SQLiteStorage.__abstractmethods__
+    assert not storage.PostgresStorage.__abstractmethods__
+
+def test_users(store):
+    assert store.load_user("asha") is None
+    store.save_user("asha", "NDA")
+    store.save_user("asha", "CDS")
+    assert tuple(store.load_user("asha")) == ("CDS",)
+    store.delete_user("asha")
+    assert store.load_user("asha") is None
+
+def test_results_history_and_attempts(store):
+    store.save_results([make_result("asha", percentage=40.0, questions=["q1", "q2"], seed=7,
+                                    bank_version="v1", answer_codes="0-"),
+                        make_result("asha", subject="English", percentage=70.0)])
+    history = store.load_user_results("asha", archived=False)
+    assert [r["subject"] for r in history] == ["Mathematics", "English"]
+    assert list(history[0]) == storage.HISTORY_KEYS
+    attempt = store.load_attempt(1)
+    assert (attempt["questions"], attempt["seed"], attempt["bank_version"], attempt["answers"]) \
+        == ("q1,q2", 7, "v1", "0-")
+    assert store.load_attempt(99) is None
+    assert store.recent_question_ids("asha", 5) == {"q1", "q2"}
+
+def test_leaderboard_and_rank(store):
+    store.save_results([make_result("asha", percentage=60.0, time_taken=500),
+                        make_result("bilal", percentage=80.0, time_taken=900),
+                        make_result("chen", percentage=60.0, time_taken=300)])
+    assert [r["name"] for r in store.leaderboard(10)] == ["bilal", "chen", "asha"]
+    assert [r["name"] for r in store.leaderboard(1)] == ["bilal"]
+    assert (store.rank("bilal"), store.rank("chen"), store.rank("asha")) == (1, 2, 3)
+    assert store.rank("nobody") is None
+    # Ranked by the best attempt; every attempt holds a place ahead of slower ones
+    store.save_results([make_result("asha", percentage=90.0, time_taken=700),
+                        make_result("dev", percentage=60.0, time_taken=300)])
+    assert (store.rank("asha"), store.rank("bilal"), store.rank("chen"), store.rank("dev")) == (1, 2, 3, 3)
+
+def test_score_histogram(store):
+    store.save_results([make_result("asha", percentage=50.0), make_result("bilal", percentage=50.0),
+                        make_result("chen", percentage=75.5)])
+    hist = store.score_histogram("Mathematics", "Algebra", "chapter")
+    assert hist == {storage.score_bin(50.0): 2, storage.score_bin(75.5): 1}
+    assert storage.percentile(hist, 75.5) == pytest.approx(100 * 2.5 / 3)
+
+def test_histograms_backfill_in_batches(store):
+    store.save_results([make_result(n, percentage=pct) for n, pct in
+                        [("asha", 50.0), ("bilal", 50.0), ("chen", 75.5), ("dev", 20.0), ("eve", 50.0)]])
+    # As if the results predate score_hist: init claims them, counts nothing
+    with connect(store) as con:
+        con.execute("DELETE FROM score_hist")
+        con.execute("DELETE FROM rollup_state WHERE name='histograms'")
+    store.ready = False
+    store.init()
+    store.save_results([make_result("fay", percentage=75.5)])
+    assert store.score_histogram("Mathematics", "Algebra", "chapter") == {storage.score_bin(75.5): 1}
+
+    assert store.backfill_histograms(2) and store.backfill_histograms(2)
+    assert not store.backfill_histograms(2) and not store.backfill_histograms(2)
+    assert store.score_histogram("Mathematics", "Algebra", "chapter") \
+        == {storage.score_bin(50.0): 3, storage.score_bin(75.5): 2, storage.score_bin(20.0): 1}
+
+def test_export_rows(store):
+    store.save_user("asha", "AFCAT")
+    store.save_results([make_result("asha", course=None), make_result("asha")])
+    rows = store.export_rows(0, 10)
+    assert [r["id"] for r in rows] == [1, 2]
+    assert [r["course"] for r in rows] == ["AFCAT", "NDA"]
+    assert [r["id"] for r in store.export_rows(1, 10)] == [2]
+
+def test_checkpoints(store):
+    cp = {"name": "asha", "subject": "Mathematics", "chapter": None, "mode": "full", "seed": 7,
+          "bank_version": "v1", "positions": b"\x01\x00\x00\x00", "perms": b"\x03",
+          "answers": "1-", "elapsed": 12.5, "duration": 1800, "updated_at": 1.0}
+    store.save_checkpoints([cp])
+    store.save_checkpoints([{**cp, "answers": "12"}])
+    loaded = store.load_checkpoint("asha")
+    assert loaded["answers"] == "12"
+    assert (loaded["positions"], loaded["perms"]) == (cp["positions"], cp["perms"])
+    store.delete_checkpoint("asha")
+    assert store.load_checkpoint("asha") is None
+
+def test_rollups_compare_and_set(store):
+    assert store.rollup_watermark() == 0
+    score = ("day", "2026-01-15", "NDA", "Mathematics", "Algebra", "chapter", 5, 1, 50.0, 5, 5, 0)
+    assert store.apply_rollups(0, 3, [score], [("q1", 1, 1, 1)], "2026-01-01")
+    assert not store.apply_rollups(0, 3, [score], [("q1", 1, 1, 1)], "2026-01-01")
+    assert store.rollup_watermark() == 3
+    assert store.apply_rollups(3, 4, [score], [("q1", 1, 1, 0)], "2026-01-01")
+    rows = store.load_rollups("day", "2026-01-01")
+    assert len(rows) == 1 and rows[0]["attempts"] == 2 and rows[0]["pct_sum"] == 100.0
+    assert store.load_rollups("day", "2026-02-01") == []
+    assert [tuple(r) for r in store.weakest_questions(1, 10)] == [("q1", 2, 2, 1)]
+    assert store.weakest_questions(5, 10) == []
+
+def test_mastery(store):
+    row = ("asha", "Mathematics", "Algebra", 10, 8, 6, "2026-01-15 10:00")
+    assert store.apply_mastery(0, 1, [row])
+    assert store.apply_mastery(1, 2, [(*row[:6], "2026-01-14 10:00")])
+    assert not store.apply_mastery(1, 2, [row])
+    assert store.rollup_watermark("mastery") == 2
+    assert store.load_mastery("asha") == [{"subject": "Mathematics", "chapter": "Algebra", "shown": 20,
+                                           "answered": 16, "correct": 12,
+                                           "last_taken": "2026-01-15 10:00"}]
+
+def test_engagement(store):
+    assert store.apply_engagement(0, 5, [("2026-01-15", "all", "all", 3, b"sketch-1")])
+    assert store.apply_engagement(5, 6, [("2026-01-15", "all", "all", 4, b"sketch-2")])
+    rows = [tuple(r) for r in store.load_engagement("2026-01-01")]
+    assert [(day, dim, key, tests, bytes(sketch)) for day, dim, key, tests, sketch in rows] \
+        == [("2026-01-15", "all", "all", 4, b"sketch-2")]
+    assert store.load_engagement("2026-02-01") == []
+
+def test_nothing_archived(store):
+    store.save_results([make_result("asha")])
+    assert store.archived_stats("asha") == {}